@@ -0,0 +1,394 @@
+from gsfs.feature_selection.LRavePaths import *
+import zlib
+import random
+import numpy as np
+import pandas as pd
+
+class ApproximateLRavePaths:
+    """
+    Class for providing approximate l-RAVE scores in bounded memory, it has the same interface as LRavePaths.
+    Exact sums and counts are kept for at most "max_paths" most frequently scored sets of features, when the table is full
+    the least frequently scored sets are evicted to summaries of the long tail: exact per-feature aggregates, count-min
+    sketch of per-pair aggregates and reservoir sample of evicted sets. l-RAVE of a set of features is a sum over
+    the exact table and an estimate for the tail: exact for single features, count-min estimate for pairs (exact
+    while all evicted sets fit in the reservoir) and scaled reservoir estimate for larger sets.
+    """
+
+    PRIME = 2147483647
+
+    def __init__(self, max_paths = 10000, reservoir_size = 1000, sketch_width = 2048, sketch_depth = 4, random_state = 123):
+        """
+        Parameters
+        ----------
+        max_paths: int (default: 10000)
+            Maximal number of sets of features with exact scores,
+        reservoir_size: int (default: 1000)
+            Number of evicted sets of features kept in the reservoir sample,
+        sketch_width: int (default: 2048)
+            Number of columns of the count-min sketch of pairs of features,
+        sketch_depth: int (default: 4)
+            Number of rows (hash functions) of the count-min sketch,
+        random_state: int (default: 123)
+            Seed of the reservoir sampling and of the hash functions.
+        """
+
+        self._max_paths = max_paths
+        self._reservoir_size = reservoir_size
+        self._random = random.Random(random_state)
+        self._exact = {}
+        self._features_tail = {}
+        self._tail_n = 0
+        self._tail_score = 0
+        self._evicted_count = 0
+        self._tail_version = 0
+        self._reservoir = []
+        self._sketch_n = np.zeros((sketch_depth, sketch_width))
+        self._sketch_scores = np.zeros((sketch_depth, sketch_width))
+        hash_random = np.random.RandomState(random_state)
+        self._hash_params = hash_random.randint(1, ApproximateLRavePaths.PRIME, size = (sketch_depth, 3)).astype(np.int64)
+        self._features_hashes = {}
+
+    def add_path_score(self, used_features, score):
+        """
+        Method for adding l-RAVE score for selected features.
+
+        Parameters
+        ----------
+        used_features: set
+            Features for which the score will be added,
+        score: float
+            Added score.
+        """
+
+        self._add(frozenset(used_features), 1, score)
+
+    def add_paths_scores(self, paths_scores, n = 1):
+        """
+        Method for adding l-RAVE scores for many sets of features at once, every score counts as "n" iterations.
+
+        Parameters
+        ----------
+        paths_scores: list
+            List of pairs (set of features, score),
+        n: float (default: 1)
+            Pseudo-count of every added score.
+        """
+
+        for used_features, score in paths_scores:
+            self._add(frozenset(used_features), n, score * n)
+
+    def merge(self, other):
+        """
+        Method for adding all l-RAVE scores of other LRavePaths or ApproximateLRavePaths object, summaries of the tail
+        of other ApproximateLRavePaths object are added only if its sketch has the same size and random state.
+
+        Parameters
+        ----------
+        other: gsfs.feature_selection.LRavePaths|gsfs.feature_selection.ApproximateLRavePaths
+            Object which scores will be added.
+        """
+
+        self.merge_lists(other._paths, other._n_vals, other._scores)
+
+        if not isinstance(other, ApproximateLRavePaths):
+            return
+
+        for name, (n, score) in other._features_tail.items():
+            tail = self._features_tail.setdefault(name, [0, 0])
+            tail[0] += n
+            tail[1] += score
+
+        self._tail_n += other._tail_n
+        self._tail_score += other._tail_score
+        self._tail_version += 1
+
+        if self._sketch_n.shape == other._sketch_n.shape and (self._hash_params == other._hash_params).all():
+            self._sketch_n += other._sketch_n
+            self._sketch_scores += other._sketch_scores
+
+        for entry in other._reservoir:
+            self._add_to_reservoir(entry)
+
+        self._evicted_count += other._evicted_count - len(other._reservoir)
+
+    def merge_lists(self, paths, n_vals, scores):
+        """
+        Method for adding l-RAVE scores given as sums and counts.
+
+        Parameters
+        ----------
+        paths: list
+            List of sets of features,
+        n_vals: list
+            Counts of scores of every set,
+        scores: list
+            Sums of scores of every set.
+        """
+
+        for path, n, score in zip(paths, n_vals, scores):
+            self._add(frozenset(path), n, score)
+
+    def get_decayed(self, decay, max_n = None, features = None):
+        """
+        Method for getting copy of exact l-RAVE scores with counts multiplied by decay (and capped), summaries of the tail
+        are not copied.
+
+        Parameters
+        ----------
+        decay: float
+            Multiplier of counts,
+        max_n: float (default: None)
+            Maximal count after decay, if None then counts are not capped,
+        features: set (default: None)
+            If not None, then only paths which are subsets of features are kept.
+
+        Returns: gsfs.feature_selection.LRavePaths
+            Object with decayed scores.
+        """
+
+        paths = LRavePaths()
+        paths.merge_lists(self._paths, self._n_vals, self._scores)
+        return paths.get_decayed(decay, max_n, features)
+
+    def get_path_score(self, used_features):
+        """
+        Method for getting approximate l-RAVE score for selected features, it will be an average score of all nodes
+        that have used_features as subset of their features.
+
+        Parameters
+        ----------
+        used_features: set
+            Features for which the score will be calculated.
+
+        Returns: float
+            l-RAVE score for selected features.
+        """
+
+        n, score = self._get_sums(used_features)
+        return score/n if n > 0 else 0
+
+    def get_t_l(self, used_features):
+        """
+        Method for getting approximate number of iterations in calculating l-RAVE score.
+
+        Parameters
+        ----------
+        used_features: set
+            Features for which the t_l will be calculated.
+
+        Returns: float
+            Number of iterations in l-RAVE calculation.
+        """
+
+        return self._get_sums(used_features)[0]
+
+    def get_scores_dataframe(self):
+        """
+        Method for getting l-RAVE scores of sets of features from the exact table.
+
+        Returns: pandas.DataFrame
+            Data frame in which every row contains fields features, n, scores, score.
+        """
+
+        return pd.DataFrame({
+            'features': [','.join(s) for s in self._paths],
+            'n': self._n_vals,
+            'scores': self._scores,
+            'score': [x/y for x, y in zip(self._scores, self._n_vals)]
+        })
+
+    def get_memory_info(self):
+        """
+        Method for getting sizes of the exact table and of the summaries of the tail.
+
+        Returns: dict
+            Dictionary with entries "exact_paths", "evicted_paths", "reservoir_paths", "tail_features" and "sketch_cells".
+        """
+
+        return {'exact_paths': len(self._exact), 'evicted_paths': self._evicted_count, 'reservoir_paths': len(self._reservoir),
+                'tail_features': len(self._features_tail), 'sketch_cells': self._sketch_n.size}
+
+    def get_tail_version(self):
+        """
+        Method for getting version of the summaries of the tail, it changes whenever sets of features are moved to
+        the tail (evicted or merged). Estimates for the tail (and so l-RAVE and t_l of sets of any features, as pairs share
+        cells of the sketch and reservoir estimates are scaled by number of evicted sets) can change only then.
+
+        Returns: int
+            Version of the tail.
+        """
+
+        return self._tail_version
+
+    @staticmethod
+    def get_error(exact, approximate, queries = None):
+        """
+        Method for measuring error of approximate l-RAVE scores against exact ones.
+
+        Parameters
+        ----------
+        exact: gsfs.feature_selection.LRavePaths
+            Exact l-RAVE scores,
+        approximate: gsfs.feature_selection.ApproximateLRavePaths
+            Approximate l-RAVE scores of the same sets of features,
+        queries: list (default: None)
+            Sets of features for which the scores are compared, if None then all single features and all sets from exact scores.
+
+        Returns: dict
+            Dictionary with entries "mean_score_error" and "max_score_error" (absolute errors of l-RAVE scores),
+            "mean_t_l_error" (mean relative error of t_l) and "queries" (number of compared sets).
+        """
+
+        if queries is None:
+            queries = [set([name]) for name in set().union(*exact._paths)] + [set(path) for path in exact._paths]
+
+        score_errors = []
+        t_l_errors = []
+        for used_features in queries:
+            t_l = exact.get_t_l(used_features)
+            score_errors.append(abs(exact.get_path_score(used_features) - approximate.get_path_score(used_features)))
+            t_l_errors.append(abs(t_l - approximate.get_t_l(used_features))/t_l if t_l > 0 else 0)
+
+        return {'mean_score_error': float(np.mean(score_errors)) if len(queries) > 0 else 0,
+                'max_score_error': float(np.max(score_errors)) if len(queries) > 0 else 0,
+                'mean_t_l_error': float(np.mean(t_l_errors)) if len(queries) > 0 else 0,
+                'queries': len(queries)}
+
+    @property
+    def _paths(self):
+        return [set(path) for path in self._exact.keys()]
+
+    @property
+    def _n_vals(self):
+        return [entry[0] for entry in self._exact.values()]
+
+    @property
+    def _scores(self):
+        return [entry[1] for entry in self._exact.values()]
+
+    def _add(self, key, n, score):
+        entry = self._exact.get(key)
+
+        if entry is not None:
+            entry[0] += n
+            entry[1] += score
+            return
+
+        self._exact[key] = [n, score]
+
+        if len(self._exact) > self._max_paths:
+            self._evict()
+
+    def _evict(self):
+        # A tenth of the table is evicted at once, so the sorting is amortized over many additions
+        count = max(1, self._max_paths//10)
+        evicted = sorted(self._exact.items(), key = lambda item: item[1][0])[:count]
+
+        for key, (n, score) in evicted:
+            del self._exact[key]
+            self._add_to_tail(key, n, score)
+
+    def _add_to_tail(self, key, n, score):
+        self._tail_version += 1
+        self._tail_n += n
+        self._tail_score += score
+
+        for name in key:
+            tail = self._features_tail.setdefault(name, [0, 0])
+            tail[0] += n
+            tail[1] += score
+
+        if len(key) > 1:
+            hashes = np.array([self._get_feature_hash(name) for name in sorted(key)], dtype = np.int64)
+            first, second = np.triu_indices(len(hashes), 1)
+            columns = self._get_sketch_columns(hashes[first], hashes[second])
+            rows = np.repeat(np.arange(len(columns)), columns.shape[1])
+            np.add.at(self._sketch_n, (rows, columns.ravel()), n)
+            np.add.at(self._sketch_scores, (rows, columns.ravel()), score)
+
+        self._add_to_reservoir((key, n, score))
+
+    def _add_to_reservoir(self, entry):
+        self._evicted_count += 1
+
+        if len(self._reservoir) < self._reservoir_size:
+            self._reservoir.append(entry)
+        else:
+            i = self._random.randint(0, self._evicted_count - 1)
+            if i < self._reservoir_size:
+                self._reservoir[i] = entry
+
+    def _get_sketch_columns(self, x, y):
+        # Hashes of pairs for all rows of the sketch, all values are below 2^31, so products fit in int64
+        a, b, c = self._hash_params[:, 0:1], self._hash_params[:, 1:2], self._hash_params[:, 2:3]
+        return (a * np.atleast_1d(x) % ApproximateLRavePaths.PRIME + b * np.atleast_1d(y) % ApproximateLRavePaths.PRIME + c) \
+               % ApproximateLRavePaths.PRIME % self._sketch_n.shape[1]
+
+    def _get_feature_hash(self, name):
+        # crc32 is used instead of hash, so sketches built in different processes can be merged
+        if name not in self._features_hashes:
+            self._features_hashes[name] = zlib.crc32(name.encode()) % ApproximateLRavePaths.PRIME
+        return self._features_hashes[name]
+
+    def _get_sums(self, used_features):
+        if used_features is None:
+            raise Exception('used_features cannot be None')
+
+        n = 0
+        score = 0
+        for key, entry in self._exact.items():
+            if used_features.issubset(key):
+                n += entry[0]
+                score += entry[1]
+
+        tail_n, tail_score = self._get_tail_sums(used_features)
+        return n + tail_n, score + tail_score
+
+    def _get_tail_sums(self, used_features):
+        if self._evicted_count == 0:
+            return 0, 0
+        elif len(used_features) == 0:
+            return self._tail_n, self._tail_score
+        elif len(used_features) == 1:
+            return tuple(self._features_tail.get(next(iter(used_features)), [0, 0]))
+
+        # Reservoir is exact while it contains all evicted sets
+        if self._evicted_count <= self._reservoir_size:
+            return self._get_reservoir_sums(used_features)
+
+        names = sorted(used_features)
+        hashes = np.array([self._get_feature_hash(name) for name in names], dtype = np.int64)
+        first, second = np.triu_indices(len(names), 1)
+        columns = self._get_sketch_columns(hashes[first], hashes[second])
+        rows = np.arange(len(columns))[:, None]
+        # Count-min estimate of every pair is the minimum over rows, the pair with the lowest estimate is used
+        pairs_rows = np.argmin(self._sketch_n[rows, columns], axis = 0)
+        pairs_columns = columns[pairs_rows, np.arange(columns.shape[1])]
+        best = int(np.argmin(self._sketch_n[pairs_rows, pairs_columns]))
+        pair = set([names[first[best]], names[second[best]]])
+        pair_n = float(self._sketch_n[pairs_rows[best], pairs_columns[best]])
+        pair_score = float(self._sketch_scores[pairs_rows[best], pairs_columns[best]])
+
+        if len(names) == 2 or pair_n == 0:
+            return pair_n, pair_score
+
+        # Sums for larger sets are sums for their rarest pair scaled by fraction of sets containing the pair
+        # in the reservoir, which contain also all other features
+        sample_pair_n, _ = self._get_reservoir_sums(pair)
+        sample_n, sample_score = self._get_reservoir_sums(used_features)
+
+        if sample_pair_n == 0 or sample_n == 0:
+            return 0, 0
+
+        n = pair_n * sample_n/sample_pair_n
+        return n, sample_score/sample_n * n
+
+    def _get_reservoir_sums(self, used_features):
+        n = 0
+        score = 0
+        for key, key_n, key_score in self._reservoir:
+            if used_features.issubset(key):
+                n += key_n
+                score += key_score
+
+        return n, score
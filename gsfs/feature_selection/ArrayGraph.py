@@ -0,0 +1,492 @@
+import numpy as np
+
+class ArrayNode:
+    """
+    Class representing view of a node stored in ArrayNodeAdder, it has the same interface as gsfs.feature_selection.Node,
+    but all its data (statistics, features and children) is kept in arrays of the ArrayNodeAdder.
+    """
+
+    __slots__ = ('_graph', '_index', '_features_set')
+
+    def __init__(self, graph, index):
+        """
+        Parameters
+        ----------
+        graph: gsfs.feature_selection.ArrayNodeAdder
+            Graph containing the node,
+        index: int
+            Index of the node in the graph.
+        """
+
+        self._graph = graph
+        self._index = index
+        self._features_set = None
+
+    @property
+    def T(self):
+        return int(self._graph._T[self._index])
+
+    @property
+    def _features(self):
+        # Features of a node never change, so the set is decoded once per view (views are short-lived,
+        # so the decoded sets aren't kept for the whole graph)
+        if self._features_set is None:
+            self._features_set = self._graph._get_features(self._index)
+
+        return self._features_set
+
+    @property
+    def _children(self):
+        graph = self._graph
+        return [ArrayNode(graph, index) for index in graph._get_children(self._index).tolist()]
+
+    def add_child(self, node):
+        """
+        Method for adding new child node to current node.
+
+        Parameters
+        ----------
+        node: gsfs.feature_selection.ArrayNode
+            Node that will be added as child to current node.
+
+        Returns: None
+        """
+
+        self._graph._link(self._index, node._index)
+
+    def add_score(self, score):
+        """
+        Method for adding score to current node.
+
+        Parameters
+        ----------
+        score: float
+            Score that will be added
+
+        Returns: None
+        """
+
+        graph = self._graph
+        graph._T[self._index] += 1
+        graph._sums[self._index] += score
+        graph._squares_sums[self._index] += score * score
+
+    def get_variance(self):
+        """
+        Method for getting variance of scores for current node, if node hasn’t been visited yet (has no scores) then 0 is returned.
+
+        Returns: float
+            Variance of the node.
+        """
+
+        T = self._graph._T[self._index]
+
+        if T == 0:
+            return 0
+
+        mean = self._graph._sums[self._index]/T
+        return max(0.0, float(self._graph._squares_sums[self._index]/T - mean * mean))
+
+    def get_score(self):
+        """
+        Method for getting average score for current node, if node hasn’t been visited yet (has no scores) then 0 is returned.
+
+        Returns: float
+            average score for node.
+        """
+
+        T = self._graph._T[self._index]
+        return float(self._graph._sums[self._index]/T) if T != 0 else 0
+
+    def add_cost(self, seconds, cpu_seconds):
+        """
+        Method for adding measured cost of evaluation of node's features.
+
+        Parameters
+        ----------
+        seconds: float
+            Wall time of the evaluation,
+        cpu_seconds: float
+            CPU time of the evaluation.
+
+        Returns: None
+        """
+
+        graph = self._graph
+        graph._cost_sums[self._index] += seconds
+        graph._cpu_cost_sums[self._index] += cpu_seconds
+        graph._cost_n[self._index] += 1
+
+    def get_cost(self):
+        """
+        Method for getting average wall time of evaluations of node's features, if node hasn’t been evaluated yet then 0 is returned.
+
+        Returns: float
+            Average evaluation time in seconds.
+        """
+
+        n = self._graph._cost_n[self._index]
+        return float(self._graph._cost_sums[self._index]/n) if n != 0 else 0
+
+    def get_cpu_cost(self):
+        """
+        Method for getting average CPU time of evaluations of node's features, if node hasn’t been evaluated yet then 0 is returned.
+
+        Returns: float
+            Average evaluation CPU time in seconds.
+        """
+
+        n = self._graph._cost_n[self._index]
+        return float(self._graph._cpu_cost_sums[self._index]/n) if n != 0 else 0
+
+    def get_label(self):
+        """
+        Method for getting concatenated features of current node, separated by commas.
+
+        Returns: str
+            Label of the node, e.g. "feature1,feature2".
+        """
+
+        return ','.join(sorted(self._features))
+
+    def get_str_node_info(self):
+        """
+        Method for current node’s information as a string. This information is average score, number of visits and variance of scores.
+
+        Returns: str
+            Multi-line string with informations about node.
+        """
+
+        return '''T: {:d}
+        avg score: {:.4f}
+        var: {:.4f}'''.format(self.T, self.get_score(), self.get_variance())
+
+    def get_used_features_in_children(self):
+        """
+        Method for getting set of used features current node’s children nodes.
+
+        Returns: set
+            Set of features that are used in node’s children nodes
+        """
+
+        graph = self._graph
+        rows = graph._features[np.append(graph._get_children(self._index), self._index)]
+        return graph._decode(np.bitwise_or.reduce(rows, axis = 0))
+
+    def __eq__(self, other):
+        return isinstance(other, ArrayNode) and self._graph is other._graph and self._index == other._index
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((id(self._graph), self._index))
+
+class ArrayNodeAdder:
+    """
+    Class representing search graph stored in arrays (alternative to gsfs.feature_selection.Node objects linked by NodeAdder).
+    Statistics of nodes (T, sum and sum of squares of scores, costs) are kept in growable numpy arrays, sets of features
+    and sets of features that can be added to nodes are packed bitset rows, children of every node are kept in a contiguous
+    block of a shared children array (moved to the end of the array with doubled size when full) and scores of features
+    that can be added to expanded nodes are rows of a candidates matrix. Nodes are accessed through ArrayNode views, so the
+    graph can be used by MultiArmStrategies, ScoringFunctions and EndStrategies in the same way as the graph of Node objects.
+    """
+
+    def __init__(self, all_features_names, capacity = 1024):
+        """
+        Parameters
+        ----------
+        all_features_names: set
+            Set containing all names of the variables in a dataset used in search,
+        capacity: int (default: 1024)
+            Initial number of nodes and edges for which the arrays are allocated, the arrays grow when needed.
+        """
+
+        self._features_list = sorted(all_features_names)
+        self._features_names = np.array(self._features_list, dtype = object)
+        self._features_indexes = dict([name, i] for i, name in enumerate(self._features_list))
+        self._mask_bytes = max(1, (len(self._features_list) + 7)//8)
+        self._all_row = np.packbits(np.ones(len(self._features_list), dtype = np.uint8), bitorder = 'little')
+        self._all_row = np.pad(self._all_row, (0, self._mask_bytes - len(self._all_row)))
+
+        self._size = 0
+        self._T = np.zeros(capacity, dtype = np.int64)
+        self._sums = np.zeros(capacity)
+        self._squares_sums = np.zeros(capacity)
+        self._cost_sums = np.zeros(capacity)
+        self._cpu_cost_sums = np.zeros(capacity)
+        self._cost_n = np.zeros(capacity, dtype = np.int64)
+        self._features = np.zeros((capacity, self._mask_bytes), dtype = np.uint8)
+        self._not_used = np.zeros((capacity, self._mask_bytes), dtype = np.uint8)
+        self._children_start = np.zeros(capacity, dtype = np.int64)
+        self._children_count = np.zeros(capacity, dtype = np.int64)
+        self._children_capacity = np.zeros(capacity, dtype = np.int64)
+        self._candidates_row = np.full(capacity, -1, dtype = np.int64)
+
+        self._children_size = 0
+        self._children = np.zeros(capacity, dtype = np.int64)
+
+        self._candidates_count = 0
+        self._candidates_scores = np.zeros((16, len(self._features_list)))
+        self._candidates_versions = np.zeros(16, dtype = np.int64)
+
+        self._buckets = {}
+        self._buckets_sizes = {}
+        self._nodes_index = None
+
+        self._add(np.zeros(self._mask_bytes, dtype = np.uint8), 0)
+
+    def get_root(self):
+        """
+        Method for getting root of the graph (node with empty set of features).
+
+        Returns: gsfs.feature_selection.ArrayNode
+            Root of the graph.
+        """
+
+        return ArrayNode(self, 0)
+
+    def add_node(self, node, feature_name):
+        """
+        method that adds new node to selected node and links it with all its parents and children in the graph.
+
+        Parameters
+        ----------
+        node: gsfs.feature_selection.ArrayNode
+            Parent node of the newly added node,
+        feature_name: str
+            New feature, new node's features = node.features + [feature_name].
+
+        Returns: gsfs.feature_selection.ArrayNode
+            newly added node.
+        """
+
+        j = self._features_indexes[feature_name]
+        row = self._features[node._index].copy()
+        row[j >> 3] |= 1 << (j & 7)
+        depth = self._get_depth(node._index)
+        index = self._add(row, depth + 1)
+
+        parents = self._get_bucket(depth)
+        if len(parents) > 0:
+            for parent in parents[np.all((self._features[parents] & ~row) == 0, axis = 1)]:
+                self._link(parent, index)
+
+        children = self._get_bucket(depth + 2)
+        if len(children) > 0:
+            for child in children[np.all((row & ~self._features[children]) == 0, axis = 1)]:
+                self._link(index, child)
+
+        return ArrayNode(self, index)
+
+    def get_node(self, features):
+        """
+        Method for finding node with given set of features, index of nodes (keyed by bitset rows) is built on first call
+        and then maintained when nodes are added.
+
+        Parameters
+        ----------
+        features: set
+            Set of features of the node.
+
+        Returns: gsfs.feature_selection.ArrayNode
+            Node with the features or None if there is no such node in the graph.
+        """
+
+        if self._nodes_index is None:
+            self._nodes_index = dict([self._features[index].tobytes(), index] for index in range(self._size))
+
+        row = np.zeros(self._mask_bytes, dtype = np.uint8)
+        for name in features:
+            j = self._features_indexes[name]
+            row[j >> 3] |= 1 << (j & 7)
+
+        index = self._nodes_index.get(row.tobytes())
+        return None if index is None else ArrayNode(self, index)
+
+    def get_not_used_features(self, node):
+        """
+        Method for getting features that are neither used in the node nor in any of its children,
+        i.e. features that can be used to create new child of the node.
+
+        Parameters
+        ----------
+        node: gsfs.feature_selection.ArrayNode
+            Node for which the features will be returned.
+
+        Returns: list
+            List of names of features.
+        """
+
+        bits = np.unpackbits(self._not_used[node._index], bitorder = 'little')[:len(self._features_list)]
+        return [self._features_list[i] for i in np.flatnonzero(bits)]
+
+    def is_not_used(self, node, feature_name):
+        """
+        Method for checking whether the feature is neither used in the node nor in any of its children.
+
+        Parameters
+        ----------
+        node: gsfs.feature_selection.ArrayNode
+            Checked node,
+        feature_name: str
+            Name of the feature.
+
+        Returns: boolean
+            True if the feature can be used to create new child of the node.
+        """
+
+        j = self._features_indexes[feature_name]
+        return ((self._not_used[node._index, j >> 3] >> (j & 7)) & 1) != 0
+
+    def get_best_new_feature(self, node, scoring_functions, global_scores):
+        """
+        Method for getting feature with the highest score of a new node created by adding the feature to the node (used by
+        MultiArmStrategies instead of heaps of candidates kept by Node objects). Scores of all features are kept in a row of
+        candidates matrix, only features updated in global scores since the last visit are rescored and the best feature
+        that can still be added is found with argmax over the row.
+
+        Parameters
+        ----------
+        node: gsfs.feature_selection.ArrayNode
+            Node to which the feature will be added,
+        scoring_functions: gsfs.feature_selection.ScoringFunctions
+            Scoring functions used to score new nodes,
+        global_scores: gsfs.feature_selection.GlobalScores
+            Global scores used in search.
+
+        Returns: tuple
+            Name of the feature and its score, (None, None) if no feature can be added.
+        """
+
+        index = node._index
+        row = self._candidates_row[index]
+        not_used = np.unpackbits(self._not_used[index], bitorder = 'little')[:len(self._features_list)].astype(bool)
+        updated_features = None if row == -1 else global_scores.get_updated_features(self._candidates_versions[row])
+
+        if row == -1:
+            row = self._add_candidates_row(index)
+
+        if updated_features is None:
+            features = np.flatnonzero(not_used).tolist()
+        else:
+            features = [self._features_indexes[name] for name in updated_features if name in self._features_indexes]
+            features = [j for j in features if not_used[j]]
+
+        scores = self._candidates_scores[row]
+        for j in features:
+            scores[j] = scoring_functions.get_new_node_score(self._features_list[j], node, global_scores)
+
+        self._candidates_versions[row] = global_scores.get_version()
+        available = np.flatnonzero(not_used)
+        if len(available) == 0:
+            return None, None
+
+        best = available[np.argmax(scores[available])]
+        return self._features_list[best], float(scores[best])
+
+    def get_nodes_count(self):
+        """
+        Method for getting number of nodes in the graph.
+
+        Returns: int
+            Number of nodes.
+        """
+
+        return self._size
+
+    @property
+    def _nodes_buckets(self):
+        return dict([depth, [ArrayNode(self, index) for index in self._get_bucket(depth)]] for depth in sorted(self._buckets.keys()))
+
+    def _add(self, row, depth):
+        if self._size == len(self._T):
+            self._grow_nodes()
+
+        index = self._size
+        self._features[index] = row
+        self._not_used[index] = self._all_row & ~row
+        self._size += 1
+
+        if depth not in self._buckets:
+            self._buckets[depth] = np.zeros(16, dtype = np.int64)
+            self._buckets_sizes[depth] = 0
+        elif self._buckets_sizes[depth] == len(self._buckets[depth]):
+            self._buckets[depth] = np.concatenate([self._buckets[depth], np.zeros(len(self._buckets[depth]), dtype = np.int64)])
+
+        self._buckets[depth][self._buckets_sizes[depth]] = index
+        self._buckets_sizes[depth] += 1
+
+        if self._nodes_index is not None:
+            self._nodes_index[row.tobytes()] = index
+
+        return index
+
+    def _link(self, parent, child):
+        start = self._children_start[parent]
+        count = self._children_count[parent]
+
+        if count == self._children_capacity[parent]:
+            capacity = max(4, 2 * count)
+            if self._children_size + capacity > len(self._children):
+                self._children = np.concatenate([self._children, np.zeros(max(len(self._children), capacity), dtype = np.int64)])
+
+            self._children[self._children_size:self._children_size + count] = self._children[start:start + count]
+            start = self._children_size
+            self._children_start[parent] = start
+            self._children_capacity[parent] = capacity
+            self._children_size += capacity
+
+        self._children[start + count] = child
+        self._children_count[parent] = count + 1
+        self._not_used[parent] &= ~self._features[child]
+
+    def _get_children(self, index):
+        start = self._children_start[index]
+        return self._children[start:start + self._children_count[index]]
+
+    def _add_candidates_row(self, index):
+        if self._candidates_count == len(self._candidates_versions):
+            self._candidates_scores = np.concatenate([self._candidates_scores, np.zeros_like(self._candidates_scores)])
+            self._candidates_versions = np.concatenate([self._candidates_versions, np.zeros_like(self._candidates_versions)])
+
+        row = self._candidates_count
+        self._candidates_row[index] = row
+        self._candidates_count += 1
+        return row
+
+    def _get_features(self, index):
+        return self._decode(self._features[index])
+
+    def _decode(self, row):
+        bits = np.unpackbits(row, bitorder = 'little')[:len(self._features_list)].astype(bool)
+        return set(self._features_names[bits].tolist())
+
+    def _get_depth(self, index):
+        return int(np.unpackbits(self._features[index]).sum())
+
+    def _get_bucket(self, depth):
+        if depth not in self._buckets:
+            return np.zeros(0, dtype = np.int64)
+
+        return self._buckets[depth][:self._buckets_sizes[depth]]
+
+    def _grow_nodes(self):
+        capacity = 2 * len(self._T)
+
+        for name in ['_T', '_sums', '_squares_sums', '_cost_sums', '_cpu_cost_sums', '_cost_n',
+                     '_children_start', '_children_count', '_children_capacity']:
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype = array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+        for name in ['_features', '_not_used']:
+            array = getattr(self, name)
+            grown = np.zeros((capacity, self._mask_bytes), dtype = np.uint8)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+        grown = np.full(capacity, -1, dtype = np.int64)
+        grown[:len(self._candidates_row)] = self._candidates_row
+        self._candidates_row = grown
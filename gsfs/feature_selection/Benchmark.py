@@ -0,0 +1,367 @@
+import os
+import sys
+import json
+import time
+import platform
+import itertools
+from gsfs.feature_selection.GSFS import *
+from gsfs.feature_selection.EvaluationGuard import *
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+import numpy as np
+import pandas as pd
+import sklearn
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+class Benchmark:
+    """
+    Class representing benchmark of anytime performance of GSFS configurations. Every configuration is fitted on every problem
+    (seeded synthetic classification datasets with known informative features), each run in a separate child process,
+    so peak resident memory of runs doesn't depend on each other. For every run curve of best score found up to given wall time,
+    iterations per second, share of search time spent on evaluating sets of features (fitting models) and peak resident memory
+    are recorded (child process starts with peak memory of its parent, so growth of the peak during the run is recorded too).
+    Results are saved to JSON reports, that can be compared between versions of the package.
+    """
+
+    REPORT_VERSION = 1
+
+    def __init__(self, model = None, calculations_budget = 100, calculations_done_condition = 'iterations', configurations = None,
+                 problems = None, metric = 'roc_auc', isolate = True):
+        """
+        Parameters
+        ----------
+        model: sklearn model (default: None)
+            Model used by all configurations, if None then LogisticRegression (liblinear solver) is used,
+        calculations_budget: int|dict (default: 100)
+            Budget of every run (see GSFS),
+        calculations_done_condition: str|list (default: "iterations")
+            Type of the budget (see GSFS),
+        configurations: dict (default: None)
+            Dictionary containing pairs of names of configurations and dictionaries of arguments of GSFS constructor
+            (e.g. {"rave": {"scoring_function": "UCB1_rave", "params": {"n_jobs": 4}}}),
+            if None then Benchmark.get_configurations() is used,
+        problems: list (default: None)
+            List of problems returned by Benchmark.get_problems, if None then Benchmark.get_problems() is used,
+        metric: str (default: "roc_auc")
+            Name of the metric used by all configurations,
+        isolate: boolean (default: True)
+            Information whether run every fitting in a child process, if False then peak memory is peak memory of this process.
+        """
+
+        self._model = LogisticRegression(solver = 'liblinear') if model is None else clone(model)
+        self._calculations_budget = calculations_budget
+        self._calculations_done_condition = calculations_done_condition
+        self._configurations = Benchmark.get_configurations() if configurations is None else configurations
+        self._problems = Benchmark.get_problems() if problems is None else problems
+        self._metric_name = metric
+        self._isolate = isolate
+        self._results = []
+
+        if len(self._configurations) == 0:
+            raise Exception('At least one configuration is required')
+        if len(self._problems) == 0:
+            raise Exception('At least one problem is required')
+
+        for name, kwargs in self._configurations.items():
+            unsupported = set(kwargs.keys()).intersection(['model', 'calculations_budget', 'calculations_done_condition', 'metric'])
+            if len(unsupported) > 0:
+                raise Exception('Configuration \"' + str(name) + '\" can\'t override: ' + ', '.join(sorted(unsupported)))
+
+    @staticmethod
+    def get_problems(widths = [20, 100], rows = [500, 2000], n_informative = 5, seeds = [0]):
+        """
+        Method for getting seeded synthetic classification problems, one for every combination of width, number of rows and seed.
+
+        Parameters
+        ----------
+        widths: list (default: [20, 100])
+            Numbers of features,
+        rows: list (default: [500, 2000])
+            Numbers of rows,
+        n_informative: int (default: 5)
+            Number of informative features of every problem,
+        seeds: list (default: [0])
+            Random states used for generating the datasets.
+
+        Returns: list
+            List of dictionaries with entries "name", "width", "rows", "seed" and "n_informative".
+        """
+
+        if n_informative <= 0 or n_informative > min(widths):
+            raise Exception('n_informative must be in (0, ' + str(min(widths)) + ']')
+
+        return [{'name': 'w' + str(width) + '_r' + str(n_rows) + '_s' + str(seed), 'width': width, 'rows': n_rows,
+                 'seed': seed, 'n_informative': n_informative}
+                for width, n_rows, seed in itertools.product(widths, rows, seeds)]
+
+    @staticmethod
+    def get_problem_data(problem):
+        """
+        Method for generating dataset of the problem, the same problem always gives the same dataset.
+
+        Parameters
+        ----------
+        problem: dict
+            Problem returned by Benchmark.get_problems.
+
+        Returns: tuple
+            Tuple containing dataset (pandas.DataFrame), labels (pandas.Series) and list of names of informative features.
+        """
+
+        X, y = make_classification(n_samples = problem['rows'], n_features = problem['width'],
+                                   n_informative = problem['n_informative'], n_redundant = 0, n_repeated = 0,
+                                   shuffle = False, random_state = problem['seed'])
+        # Without shuffling informative features are the first ones, columns are permuted so they aren't first in the search
+        order = np.random.RandomState(problem['seed']).permutation(problem['width'])
+        data = pd.DataFrame(X[:, order], columns = ['f' + str(i) for i in order])
+        informative = ['f' + str(i) for i in range(problem['n_informative'])]
+
+        return data, pd.Series(y), informative
+
+    @staticmethod
+    def get_configurations(scoring_functions = ['UCB1_rave', 'UCB1_with_variance', 'UCB1'],
+                           multiarm_strategies = ['discrete', 'continuous'], with_cv = [False], **gsfs_kwargs):
+        """
+        Method for getting configurations for all combinations of scoring functions, multiarm strategies and cross-validation.
+
+        Parameters
+        ----------
+        scoring_functions: list (default: ["UCB1_rave", "UCB1_with_variance", "UCB1"])
+            Names of scoring functions,
+        multiarm_strategies: list (default: ["discrete", "continuous"])
+            Names of multiarm strategies,
+        with_cv: list (default: [False])
+            Values of with_cv argument,
+        gsfs_kwargs:
+            Other arguments of GSFS constructor shared by all configurations (e.g. evaluator, params).
+
+        Returns: dict
+            Dictionary containing pairs of names of configurations and arguments of GSFS constructor.
+        """
+
+        configurations = {}
+        for scoring_function, multiarm_strategy, cv in itertools.product(scoring_functions, multiarm_strategies, with_cv):
+            name = scoring_function + '/' + multiarm_strategy + ('/cv' if cv else '')
+            configurations[name] = dict(gsfs_kwargs, scoring_function = scoring_function,
+                                        multiarm_strategy = multiarm_strategy, with_cv = cv)
+
+        return configurations
+
+    def run(self, path = None):
+        """
+        Method for running all configurations on all problems.
+
+        Parameters
+        ----------
+        path: str (default: None)
+            Path of JSON file to which the report will be written, if None then report isn't saved.
+
+        Returns: dict
+            Report containing entries "report_version", "environment", "settings" and "results" (list of results of runs).
+        """
+
+        self._results = []
+        runs = list(itertools.product(self._problems, self._configurations.items()))
+
+        for i, (problem, (name, kwargs)) in enumerate(runs):
+            print('Benchmark run ' + str(i + 1) + '/' + str(len(runs)) + ': ' + name + ' on ' + problem['name'])
+            result = self._run_isolated(problem, kwargs) if self._isolate else Benchmark._run_single(
+                self._model, self._calculations_budget, self._calculations_done_condition, self._metric_name, problem, kwargs)
+
+            self._results.append(dict(result, problem = problem['name'], configuration = name))
+
+        report = self.get_report()
+        if path is not None:
+            Benchmark.save_report(report, path)
+
+        return report
+
+    def _run_isolated(self, problem, kwargs):
+        guard = EvaluationGuard({'evaluation_timeout': None, 'evaluation_max_rss_mb': None})
+        result = guard.run(Benchmark._run_single, (self._model, self._calculations_budget, self._calculations_done_condition,
+                                                   self._metric_name, problem, kwargs))
+
+        if result['reason'] is not None:
+            raise Exception('Benchmark run ' + str(kwargs) + ' on ' + problem['name'] + ' ' + result['reason'])
+
+        return result['score']
+
+    @staticmethod
+    def _run_single(model, calculations_budget, calculations_done_condition, metric_name, problem, kwargs):
+        data, labels, informative = Benchmark.get_problem_data(problem)
+        kwargs = dict(kwargs)
+        params = dict(kwargs.pop('params', None) or {})
+        params.setdefault('random_state', problem['seed'])
+
+        start_rss_mb = Benchmark._get_peak_rss_mb()
+        gsfs = GSFS(model, calculations_budget, calculations_done_condition, params = params, metric = metric_name, **kwargs)
+
+        start_time = time.perf_counter()
+        curve = [[event['time'], event['iteration'], event['best_score']] for event in gsfs.iter_fit(data, labels)]
+        seconds = time.perf_counter() - start_time
+
+        timings = gsfs.get_timings()
+        stats = gsfs.get_evaluation_stats()
+        iterations = gsfs.get_stopping_info()['iterations']
+        best_features = list(gsfs.get_best_features() or [])
+        found = len(set(best_features).intersection(informative))
+
+        peak_rss_mb = Benchmark._get_peak_rss_mb()
+
+        return {'curve': curve,
+                'best_score': gsfs.get_best_score(),
+                'best_features': best_features,
+                'informative_recall': found/len(informative),
+                'informative_precision': found/len(best_features) if len(best_features) > 0 else 0,
+                'anytime_score': Benchmark.get_anytime_score(curve, timings['search']),
+                'iterations': iterations,
+                'stopping_reason': gsfs.get_stopping_info()['reason'],
+                'seconds': seconds,
+                'search_seconds': timings['search'],
+                'iterations_per_second': iterations/timings['search'] if timings['search'] > 0 else None,
+                'fit_share': stats['evaluation_seconds']/timings['search'] if timings['search'] > 0 else None,
+                'true_evaluations': stats['true_evaluations'],
+                'peak_rss_mb': peak_rss_mb,
+                'peak_rss_increase_mb': peak_rss_mb - start_rss_mb if peak_rss_mb is not None else None}
+
+    @staticmethod
+    def get_anytime_score(curve, seconds):
+        """
+        Method for getting time-averaged best score, i.e. area under the curve of best score found up to given time divided by
+        the time (score is 0 before the first set of features is scored), higher values mean good sets are found sooner.
+
+        Parameters
+        ----------
+        curve: list
+            List of points [time, iteration, best score] in order of time,
+        seconds: float
+            Duration of the search.
+
+        Returns: float
+            Time-averaged best score.
+        """
+
+        if seconds <= 0 or len(curve) == 0:
+            return 0
+
+        times = np.minimum([point[0] for point in curve] + [seconds], seconds)
+        scores = np.array([point[2] for point in curve])
+        return float(np.sum(scores * np.diff(times))/seconds)
+
+    @staticmethod
+    def _get_peak_rss_mb():
+        if resource is None:
+            return None
+
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak/(1024*1024) if sys.platform == 'darwin' else peak/1024
+
+    def get_results(self):
+        """
+        Method for getting summary of results of the last run, without curves.
+
+        Returns: pandas.DataFrame
+            Data frame with one row for every problem and configuration.
+        """
+
+        return pd.DataFrame([dict((k, v) for k, v in result.items() if k not in ['curve', 'best_features'])
+                             for result in self._results])
+
+    def get_report(self):
+        """
+        Method for getting report of the last run.
+
+        Returns: dict
+            Report containing entries "report_version", "environment", "settings" and "results".
+        """
+
+        return {'report_version': Benchmark.REPORT_VERSION,
+                'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                                'numpy': np.__version__, 'pandas': pd.__version__, 'sklearn': sklearn.__version__,
+                                'cpu_count': os.cpu_count()},
+                'settings': {'model': repr(self._model), 'calculations_budget': self._calculations_budget,
+                             'calculations_done_condition': self._calculations_done_condition, 'metric': self._metric_name,
+                             'isolate': self._isolate, 'configurations': self._configurations, 'problems': self._problems},
+                'results': self._results}
+
+    @staticmethod
+    def save_report(report, path):
+        """
+        Method for saving report to JSON file, keys are sorted, so reports of different versions can be compared with diff.
+
+        Parameters
+        ----------
+        report: dict
+            Report returned by run,
+        path: str
+            Path of the file.
+
+        Returns: None
+        """
+
+        with open(path, 'w') as f:
+            json.dump(report, f, indent = 1, sort_keys = True, default = Benchmark._to_json)
+
+    @staticmethod
+    def load_report(path):
+        """
+        Method for loading report from JSON file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+
+        Returns: dict
+            Report.
+        """
+
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def compare_reports(baseline, report, columns = ['best_score', 'anytime_score', 'informative_recall',
+                                                     'iterations_per_second', 'fit_share', 'peak_rss_increase_mb']):
+        """
+        Method for comparing results of two reports, runs are matched by problem and configuration.
+
+        Parameters
+        ----------
+        baseline: dict|str
+            Baseline report or path of its file,
+        report: dict|str
+            Compared report or path of its file,
+        columns: list (default: ["best_score", "anytime_score", "informative_recall", "iterations_per_second", "fit_share",
+                                 "peak_rss_increase_mb"])
+            Compared values.
+
+        Returns: pandas.DataFrame
+            Data frame with one row for every run present in both reports, containing values of both reports
+            (with suffixes "_baseline" and "_new") and their differences (with suffix "_diff").
+        """
+
+        frames = []
+        for value in [baseline, report]:
+            value = Benchmark.load_report(value) if isinstance(value, str) else value
+            frames.append(pd.DataFrame(value['results']).loc[:, ['problem', 'configuration'] + columns])
+
+        comparison = frames[0].merge(frames[1], on = ['problem', 'configuration'], suffixes = ('_baseline', '_new'))
+        for column in columns:
+            comparison[column + '_diff'] = comparison[column + '_new'].astype(float) - comparison[column + '_baseline'].astype(float)
+
+        return comparison
+
+    @staticmethod
+    def _to_json(value):
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+
+        return repr(value)
@@ -1,7 +1,112 @@
 from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+import numpy as np
+
+class SplitLabels:
+    """Class keeping labels of a split (0 - negative class, 1 - positive class) with statistics precomputed for fast metrics."""
+    
+    def __init__(self, labels):
+        """
+        Parameters
+        ----------
+        labels: pandas.Series|numpy.array
+            Labels of the split.
+        """
+        
+        self.labels = np.asarray(labels)
+        self.positive = self.labels == 1
+        self.n_positive = int(self.positive.sum())
+        self.n_negative = len(self.labels) - self.n_positive
+
+class FastMetrics:
+    """
+    Class containing static lean versions of supported metrics, without input validation. Labels can be passed 
+    as gsfs.feature_selection.SplitLabels, so statistics of labels are not recalculated on every call.
+    """
+    
+    @staticmethod
+    def roc_auc(labels, predicted):
+        """
+        Method for calculating Roc AUC from ranks of predictions (ties get average rank), using single sort.
+        
+        Parameters
+        ----------
+        labels: gsfs.feature_selection.SplitLabels|numpy.array
+            True labels,
+        predicted: numpy.array
+            Predicted scores of positive class.
+            
+        Returns: float
+            Roc AUC.
+        """
+        
+        labels = FastMetrics._get_split_labels(labels)
+        
+        if labels.n_positive == 0 or labels.n_negative == 0:
+            raise ValueError('Only one class present in labels, Roc AUC is not defined')
+        
+        predicted = np.asarray(predicted)
+        order = np.argsort(predicted, kind = 'mergesort')
+        sorted_predicted = predicted[order]
+        ends = np.append(np.flatnonzero(sorted_predicted[1:] != sorted_predicted[:-1]) + 1, len(predicted))
+        starts = np.append(0, ends[:-1])
+        ranks = np.repeat((starts + ends + 1)/2.0, ends - starts)
+        positive_ranks_sum = ranks[labels.positive[order]].sum()
+        
+        return (positive_ranks_sum - labels.n_positive * (labels.n_positive + 1)/2.0)/(labels.n_positive * labels.n_negative)
+    
+    @staticmethod
+    def accuracy(labels, predicted):
+        """
+        Method for calculating accuracy.
+        
+        Parameters
+        ----------
+        labels: gsfs.feature_selection.SplitLabels|numpy.array
+            True labels,
+        predicted: numpy.array
+            Predicted classes.
+            
+        Returns: float
+            Accuracy.
+        """
+        
+        labels = FastMetrics._get_split_labels(labels)
+        return float((np.asarray(predicted) == labels.labels).mean())
+    
+    @staticmethod
+    def f1(labels, predicted):
+        """
+        Method for calculating f1 score of positive class, if there are no positive labels and predictions then 0 is returned.
+        
+        Parameters
+        ----------
+        labels: gsfs.feature_selection.SplitLabels|numpy.array
+            True labels,
+        predicted: numpy.array
+            Predicted classes.
+            
+        Returns: float
+            F1 score.
+        """
+        
+        labels = FastMetrics._get_split_labels(labels)
+        predicted_positive = np.asarray(predicted) == 1
+        true_positive = np.count_nonzero(predicted_positive & labels.positive)
+        denominator = np.count_nonzero(predicted_positive) + labels.n_positive
+        
+        return 2.0 * true_positive/denominator if denominator > 0 else 0.0
+    
+    @staticmethod
+    def _get_split_labels(labels):
+        if isinstance(labels, SplitLabels):
+            return labels
+        return SplitLabels(labels)
 
 class BuildInMetrics:
-    """Class containing supported scoring methods, supports accuracy, f1 and Roc AUC."""
+    """
+    Class containing supported scoring methods, supports accuracy, f1 and Roc AUC. Every metric is available 
+    as sklearn version (with input validation) and fast version from FastMetrics.
+    """
     def __init__(self):
         """Initializes the metrics dictionary"""
         
@@ -11,19 +116,75 @@ class BuildInMetrics:
             'roc_auc': roc_auc_score
         }
         
-    def get_metric(self, name):
+        self._fast_metrics = {
+            'acc': FastMetrics.accuracy,
+            'f1': FastMetrics.f1,
+            'roc_auc': FastMetrics.roc_auc
+        }
+        
+    def get_metric(self, name, fast = False):
         """
         method for getting metric with selected name, supported values areacc(accuracy), f1, roc_auc, if the provided name is not supported then exception is thrown.
         Parameters
         ----------
         name: str
-            Name of the metric to be returned.
+            Name of the metric to be returned,
+        fast: boolean (default: False)
+            If True then lean version of the metric from FastMetrics is returned, otherwise sklearn metric.
 
         Returns: sklearn metric
             One of the supported metrics.
         """
 
         if name in self._metrics:
-            return self._metrics[name]
+            return self._fast_metrics[name] if fast else self._metrics[name]
+        else:
+            raise Exception('Error initializing GSFS object, \"' + name + '\" is not supported metric, available values are: ' + ', '.join(self._metrics.keys()))
+    
+    @staticmethod
+    def prepare_labels(metric, labels):
+        """
+        Method for preparing labels of a split that will be scored many times with selected metric,
+        for fast metrics statistics of the labels are precomputed.
+        
+        Parameters
+        ----------
+        metric: function
+            Metric returned by get_metric,
+        labels: pandas.Series|numpy.array
+            Labels of the split.
+
+        Returns: gsfs.feature_selection.SplitLabels|numpy.array
+            Labels that can be passed to the metric.
+        """
+        
+        if metric in [FastMetrics.accuracy, FastMetrics.f1, FastMetrics.roc_auc]:
+            return SplitLabels(labels)
+        
+        return np.asarray(labels)
+    
+    def get_chance_score(self, name, labels):
+        """
+        Method for getting score of the metric with selected name that is achieved by a model without any information,
+        for roc_auc it is 0.5, for acc it is fraction of the most frequent class and for f1 it is f1 of predicting only positive class.
+        
+        Parameters
+        ----------
+        name: str
+            Name of the metric,
+        labels: pandas.Series
+            Labels of the dataset (0 - negative class, 1 - positive class).
+
+        Returns: float
+            Score of not informative model.
+        """
+        
+        self.get_metric(name)
+        positive_rate = (labels == 1).mean() if len(labels) > 0 else 0
+        
+        if name == 'roc_auc':
+            return 0.5
+        elif name == 'acc':
+            return max(positive_rate, 1 - positive_rate)
         else:
-            raise Exception('Error initializing GSFS object, \"' + name + '\" is not supported metric, available values are: ' + ', '.join(self._metrics.keys()))
\ No newline at end of file
+            return 2 * positive_rate/(1 + positive_rate)
@@ -1,10 +1,53 @@
+from gsfs.feature_selection.BuildInMetrics import *
 from sklearn.model_selection import StratifiedKFold
+import numpy as np
+import weakref
 
 class CV:
-    """Class containing static method for performing cross-validation"""
+    """
+    Class containing static method for performing cross-validation. Splits and test labels prepared for the metric 
+    are cached for the last scored labels object, so they aren't recalculated on every scoring of the same labels.
+    Labels are referenced weakly by the cache, so it doesn't keep them in memory, and it is cleared at the end of fitting.
+    """
+    
+    _splits_cache = None
     
     @staticmethod
-    def cv(metric, metric_name, model, data, labels, cv):
+    def get_splits(data, labels, cv, random_state = 123):
+        """
+        Static method for getting indexes of rows used in every fold of cross-validation, the splits are the same
+        as the ones used in cv.
+        
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Input dataset used in cross-validation,
+        labels: pandas.Series
+            Labels of input dataset,
+        cv: int
+            Number of folds in cross-validation,
+        random_state: int (default: 123)
+            Seed used for shuffling rows before splitting.
+            
+        Returns: list
+            List of pairs of numpy arrays, indexes of train rows and indexes of test rows.
+        """
+        
+        kfold = StratifiedKFold(n_splits=cv, random_state=random_state, shuffle=True)
+        return list(kfold.split(data, labels))
+    
+    @staticmethod
+    def clear_cache():
+        """
+        Static method for releasing cached splits and test labels.
+        
+        Returns: None
+        """
+        
+        CV._splits_cache = None
+    
+    @staticmethod
+    def cv(metric, metric_name, model, data, labels, cv, random_state = 123):
         """
         Static method that performs cross-validation for selected dataset and model.   
         It uses StratifiedKFold fromsklearn.model_selection to make the "cv" number of splits, 
@@ -24,24 +67,47 @@ class CV:
         labels: pandas.Series
             Labels of input dataset,
         cv: int
-            Number of folds in cross-validation.
+            Number of folds in cross-validation,
+        random_state: int (default: 123)
+            Seed used for shuffling rows before splitting.
             
         Returns: float
             Cross-validation score for selected metric.
         """
 
-        kfold = StratifiedKFold(n_splits=cv, random_state=123, shuffle=True)
         score = 0
         
         if metric_name in ['acc','f1']:
-            for train, test in kfold.split(data, labels):
+            for train, test, y_test in CV._get_prepared_splits(metric, data, labels, cv, random_state):
                 model.fit(data.loc[train,:], labels[train])
                 predicted = model.predict(data.loc[test,:])
-                score += metric(labels[test], predicted)
+                score += metric(y_test, predicted)
         else:
-            for train, test in kfold.split(data, labels):
+            for train, test, y_test in CV._get_prepared_splits(metric, data, labels, cv, random_state):
                 model.fit(data.loc[train,:], labels[train])
                 predicted = model.predict_proba(data.loc[test,:])[:,1]
-                score += metric(labels[test], predicted)
+                score += metric(y_test, predicted)
                 
-        return score/cv
\ No newline at end of file
+        return score/cv
+    
+    @staticmethod
+    def _get_prepared_splits(metric, data, labels, cv, random_state):
+        # Labels object is compared by identity of live weak reference (so id of freed labels can't be matched), 
+        # cache is replaced by single assignment, so it is safe for threads
+        cache = CV._splits_cache
+        key = (len(labels), metric, cv, random_state)
+        
+        if cache is not None and cache[0]() is labels and cache[1] == key:
+            return cache[2]
+        
+        y = np.asarray(labels)
+        splits = [(train, test, BuildInMetrics.prepare_labels(metric, y[test])) 
+                  for train, test in CV.get_splits(data, labels, cv, random_state)]
+        
+        try:
+            CV._splits_cache = (weakref.ref(labels), key, splits)
+        except TypeError:
+            # Labels not supporting weak references (e.g. list) aren't cached
+            CV._splits_cache = None
+        
+        return splits
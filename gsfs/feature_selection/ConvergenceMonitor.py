@@ -0,0 +1,78 @@
+import heapq
+from collections import deque
+
+class ConvergenceMonitor:
+    """
+    Class used for detecting convergence of the search. Search is converged when within the last "convergence_window" iterations
+    the best score didn't improve by more than "convergence_tol" and the set of "convergence_top_k" features with best g-RAVE
+    scores didn't change (at least "convergence_top_k_overlap" fraction of these features is the same).
+    """
+
+    def __init__(self, params):
+        """
+        Parameters
+        ----------
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        self._window = params['convergence_window']
+        self._tol = params['convergence_tol']
+        self._top_k = params['convergence_top_k']
+        self._overlap = params['convergence_top_k_overlap']
+        self._check_interval = max(1, self._window//10)
+        self._snapshots = deque()
+        self._converged_iteration = None
+
+    def update(self, iteration, best_score, global_scores):
+        """
+        Method for updating the state of the monitor after an iteration of the search.
+
+        Parameters
+        ----------
+        iteration: int
+            Number of the iteration,
+        best_score: float
+            Best score found so far,
+        global_scores: gsfs.feature_selection.GlobalScores
+            GlobalScores object used in search.
+
+        Returns: boolean
+            True if the search has converged.
+        """
+
+        if self._converged_iteration is not None:
+            return True
+
+        if iteration % self._check_interval != 0:
+            return False
+
+        top_features = set(name for name, info in heapq.nlargest(self._top_k, global_scores.scores['g_rave'].items(),
+                                                                 key = lambda item: item[1]['score']/item[1]['n']))
+        self._snapshots.append((iteration, best_score, top_features))
+
+        while len(self._snapshots) > 1 and self._snapshots[1][0] <= iteration - self._window:
+            self._snapshots.popleft()
+
+        first_iteration, first_best_score, first_top_features = self._snapshots[0]
+
+        if iteration - first_iteration < self._window or len(top_features) == 0:
+            return False
+
+        required_overlap = self._overlap * len(top_features)
+        if (best_score - first_best_score <= self._tol and
+            all(len(top_features & features) >= required_overlap for _, _, features in self._snapshots)):
+            self._converged_iteration = iteration
+            return True
+
+        return False
+
+    def get_converged_iteration(self):
+        """
+        Method for getting iteration in which the convergence was detected.
+
+        Returns: int
+            Number of the iteration or None if search hasn't converged.
+        """
+
+        return self._converged_iteration
@@ -0,0 +1,104 @@
+import pandas as pd
+
+class CostModel:
+    """
+    Class representing additive model of evaluation cost of sets of features, cost of a set is a sum of costs of its features.
+    Time of every evaluation is split equally between features of evaluated set, cost of a feature is an average of its shares.
+    """
+
+    def __init__(self):
+        self._costs = {}
+
+    def update_cost(self, used_features, seconds):
+        """
+        Method for adding measured evaluation time of a set of features.
+
+        Parameters
+        ----------
+        used_features: set
+            Set of evaluated features,
+        seconds: float
+            Time of the evaluation in seconds.
+
+        Returns: None
+        """
+
+        if len(used_features) == 0:
+            return
+
+        share = seconds/len(used_features)
+        for name in used_features:
+            if name not in self._costs:
+                self._costs[name] = {'n': 1, 'seconds': share}
+            else:
+                self._costs[name]['seconds'] += share
+                self._costs[name]['n'] += 1
+
+    def merge(self, other):
+        """
+        Method for adding all measured costs of other CostModel object.
+
+        Parameters
+        ----------
+        other: gsfs.feature_selection.CostModel
+            Object which costs will be added.
+
+        Returns: None
+        """
+
+        for name, cost_info in other._costs.items():
+            if name not in self._costs:
+                self._costs[name] = dict(cost_info)
+            else:
+                self._costs[name]['seconds'] += cost_info['seconds']
+                self._costs[name]['n'] += cost_info['n']
+
+    def get_feature_cost(self, name):
+        """
+        Method for getting predicted cost of adding the feature to a set of features, for features which haven't been
+        evaluated yet 0 is returned (cost of a feature doesn't depend on evaluations of other features, so it changes only
+        when a set containing the feature is evaluated).
+
+        Parameters
+        ----------
+        name: str
+            Name of the feature.
+
+        Returns: float
+            Predicted cost in seconds.
+        """
+
+        if name not in self._costs:
+            return 0
+
+        cost_info = self._costs[name]
+        return cost_info['seconds']/cost_info['n']
+
+    def get_cost(self, used_features):
+        """
+        Method for getting predicted cost of evaluation of a set of features.
+
+        Parameters
+        ----------
+        used_features: set
+            Set of features.
+
+        Returns: float
+            Predicted cost in seconds.
+        """
+
+        return sum(self.get_feature_cost(name) for name in used_features)
+
+    def get_dataframe(self):
+        """
+        Method for getting costs of all features in form of DataFrame, with columns feature, n and cost.
+
+        Returns: pandas.DataFrame
+            DataFrame with costs of features.
+        """
+
+        return pd.DataFrame({
+            'feature': list(self._costs.keys()),
+            'n': [v['n'] for v in self._costs.values()],
+            'cost': [v['seconds']/v['n'] for v in self._costs.values()]
+        })
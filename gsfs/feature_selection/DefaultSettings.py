@@ -17,7 +17,49 @@ class DefaultSettings:
             "cv": 4,
             "b_T": 0.5,
             "test_size": 0.25,
-            "new_node_preference": 1
+            "new_node_preference": 1,
+            "n_jobs": 1,
+            "screening_top_k": None,
+            "screening_mode": "filter",
+            "screening_pseudo_count": 1,
+            "warm_start_estimators": ["forest"],
+            "warm_start_subsample": 1.0,
+            "warm_start_pseudo_count": 1,
+            "warm_start_l_rave_pseudo_count": 1,
+            "evaluator_cache_size": 1000,
+            "kernel_cache_size": 100,
+            "kernel_cache_mb": 1024,
+            "kernel_memmap_dir": None,
+            "fast_metrics": True,
+            "surrogate": None,
+            "surrogate_min_samples": 200,
+            "surrogate_retrain_interval": 100,
+            "surrogate_k": 2,
+            "surrogate_margin": 0,
+            "cache_preprocessing": True,
+            "convergence_window": 200,
+            "convergence_tol": 1e-4,
+            "convergence_top_k": 10,
+            "convergence_top_k_overlap": 1.0,
+            "cost_weight": 0,
+            "evaluation_timeout": None,
+            "evaluation_max_rss_mb": None,
+            "evaluation_penalty": None,
+            "random_state": 123,
+            "evaluation_store": None,
+            "prior_stats_decay": 0.5,
+            "prior_stats_max_n": 20,
+            "redundancy": None,
+            "redundancy_threshold": 0.95,
+            "redundancy_mode": "skip",
+            "redundancy_penalty": 1,
+            "redundancy_block_size": 256,
+            "redundancy_bins": 10,
+            "l_rave_backend": "exact",
+            "l_rave_max_paths": 10000,
+            "l_rave_reservoir_size": 1000,
+            "l_rave_sketch_width": 2048,
+            "l_rave_sketch_depth": 4
         }
     
     @staticmethod
@@ -56,5 +98,73 @@ class DefaultSettings:
             raise Exception('test_size must be > 0')
         if merged_params['new_node_preference'] <= 0:
             raise Exception('new_node_preference must be > 0')
+        if merged_params['n_jobs'] == 0:
+            raise Exception('n_jobs must be != 0')
+        if merged_params['screening_top_k'] is not None and merged_params['screening_top_k'] <= 0:
+            raise Exception('screening_top_k must be > 0')
+        if merged_params['screening_mode'] not in ['filter', 'prior']:
+            raise Exception('screening_mode must be one of: filter, prior')
+        if merged_params['screening_pseudo_count'] <= 0:
+            raise Exception('screening_pseudo_count must be > 0')
+        if merged_params['warm_start_subsample'] <= 0 or merged_params['warm_start_subsample'] > 1:
+            raise Exception('warm_start_subsample must be in (0, 1]')
+        if merged_params['warm_start_pseudo_count'] <= 0:
+            raise Exception('warm_start_pseudo_count must be > 0')
+        if merged_params['warm_start_l_rave_pseudo_count'] < 0:
+            raise Exception('warm_start_l_rave_pseudo_count must be >= 0')
+        if merged_params['evaluator_cache_size'] <= 0:
+            raise Exception('evaluator_cache_size must be > 0')
+        if merged_params['kernel_cache_size'] <= 0:
+            raise Exception('kernel_cache_size must be > 0')
+        if merged_params['kernel_cache_mb'] <= 0:
+            raise Exception('kernel_cache_mb must be > 0')
+        if merged_params['surrogate'] not in [None, 'ridge', 'forest']:
+            raise Exception('surrogate must be one of: None, ridge, forest')
+        if merged_params['surrogate_min_samples'] <= 0:
+            raise Exception('surrogate_min_samples must be > 0')
+        if merged_params['surrogate_retrain_interval'] <= 0:
+            raise Exception('surrogate_retrain_interval must be > 0')
+        if merged_params['surrogate_k'] < 0:
+            raise Exception('surrogate_k must be >= 0')
+        if merged_params['convergence_window'] <= 0:
+            raise Exception('convergence_window must be > 0')
+        if merged_params['convergence_tol'] < 0:
+            raise Exception('convergence_tol must be >= 0')
+        if merged_params['convergence_top_k'] <= 0:
+            raise Exception('convergence_top_k must be > 0')
+        if merged_params['convergence_top_k_overlap'] < 0 or merged_params['convergence_top_k_overlap'] > 1:
+            raise Exception('convergence_top_k_overlap must be in [0, 1]')
+        if merged_params['cost_weight'] < 0:
+            raise Exception('cost_weight must be >= 0')
+        if merged_params['evaluation_timeout'] is not None and merged_params['evaluation_timeout'] <= 0:
+            raise Exception('evaluation_timeout must be > 0')
+        if merged_params['evaluation_max_rss_mb'] is not None and merged_params['evaluation_max_rss_mb'] <= 0:
+            raise Exception('evaluation_max_rss_mb must be > 0')
+        if merged_params['prior_stats_decay'] <= 0 or merged_params['prior_stats_decay'] > 1:
+            raise Exception('prior_stats_decay must be in (0, 1]')
+        if merged_params['prior_stats_max_n'] is not None and merged_params['prior_stats_max_n'] <= 0:
+            raise Exception('prior_stats_max_n must be > 0')
+        if merged_params['redundancy'] not in [None, 'correlation', 'spearman', 'mutual_info']:
+            raise Exception('redundancy must be one of: None, correlation, spearman, mutual_info')
+        if merged_params['redundancy_threshold'] <= 0 or merged_params['redundancy_threshold'] > 1:
+            raise Exception('redundancy_threshold must be in (0, 1]')
+        if merged_params['redundancy_mode'] not in ['skip', 'penalty']:
+            raise Exception('redundancy_mode must be one of: skip, penalty')
+        if merged_params['redundancy_penalty'] < 0:
+            raise Exception('redundancy_penalty must be >= 0')
+        if merged_params['redundancy_block_size'] <= 0:
+            raise Exception('redundancy_block_size must be > 0')
+        if merged_params['redundancy_bins'] < 2:
+            raise Exception('redundancy_bins must be >= 2')
+        if merged_params['l_rave_backend'] not in ['exact', 'approximate']:
+            raise Exception('l_rave_backend must be one of: exact, approximate')
+        if merged_params['l_rave_max_paths'] <= 0:
+            raise Exception('l_rave_max_paths must be > 0')
+        if merged_params['l_rave_reservoir_size'] <= 0:
+            raise Exception('l_rave_reservoir_size must be > 0')
+        if merged_params['l_rave_sketch_width'] <= 0:
+            raise Exception('l_rave_sketch_width must be > 0')
+        if merged_params['l_rave_sketch_depth'] <= 0:
+            raise Exception('l_rave_sketch_depth must be > 0')
             
         return merged_params
\ No newline at end of file
@@ -1,7 +1,9 @@
 from graphviz import Digraph
 from queue import *
+from xml.sax.saxutils import escape
+import json
 
-def draw_tree(node_adder, file_name = None, view = True, view_nodes_info = False):
+def draw_tree(node_adder, file_name = None, view = True, view_nodes_info = False, max_depth = None, top_k_paths = None):
     """
     Method for drawing the search graph.
 
@@ -14,30 +16,135 @@ def draw_tree(node_adder, file_name = None, view = True, view_nodes_info = False
     view: boolean (default: True)
         If Truethen the graph will beviewed in a default browser,
     view_nodes_info: boolean (default: False)
-        If False then only features names are displayed, otherwise each node will have additionaly number of visits, 
-        average score and variance displayed.
-       
+        If False then only features names are displayed, otherwise each node will have additionaly number of visits,
+        average score and variance displayed,
+    max_depth: int (default: None)
+        If specified then only nodes with at most max_depth features are drawn,
+    top_k_paths: int (default: None)
+        If specified then only top_k_paths most visited paths are drawn, every path starts in one of the top_k_paths
+        most visited children of the root and follows the most visited child in every next node.
+
     Returns: None
     """
-    
+
     dot = Digraph(comment='mcts')
 
+    if top_k_paths is not None:
+        nodes = _get_top_k_paths_nodes(node_adder, top_k_paths)
+    else:
+        nodes = [node for value in node_adder._nodes_buckets.values() for node in value]
+
+    if max_depth is not None:
+        nodes = [node for node in nodes if len(node._features) <= max_depth]
+
+    labels = dict([node, node.get_label()] for node in nodes)
+
     # Adding nodes
-    for key, value in node_adder._nodes_buckets.items():
-        for node in value:
-            node_id = node.get_label()
-            label = node_id
-
-            if view_nodes_info:
-                label += '\n' + node.get_str_node_info()
-            
-            dot.node(node_id,label)
-    
+    for node, node_id in labels.items():
+        label = node_id
+
+        if view_nodes_info:
+            label += '\n' + node.get_str_node_info()
+
+        dot.node(node_id,label)
+
     # Adding edges
-    for key, value in node_adder._nodes_buckets.items():
-        for node in value:
-            for child_node in node._children:
-                
-                dot.edge(node.get_label(), child_node.get_label())
-            
-    dot.render(file_name, view = view)
\ No newline at end of file
+    for node, node_id in labels.items():
+        for child_node in node._children:
+            if child_node in labels:
+                dot.edge(node_id, labels[child_node])
+
+    dot.render(file_name, view = view)
+
+def export_graph(node_adder, file_name, file_format = 'graphml'):
+    """
+    Method for exporting the search graph to a file without rendering it. Graph is written in one pass,
+    every node gets an integer id (root has id 0).
+
+    Parameters
+    ----------
+    node_adder: gsfs.feature_selection.NodeAdder
+        NodeAdder instance that was used in algorithm,
+    file_name: str
+        Path of the file to which the graph will be written,
+    file_format: str (default: "graphml")
+        Format of the file, available values are "graphml", "jsonl" (one node or edge as JSON object per line)
+        and "edgelist" (tab separated pairs of ids, nodes with their labels and stats are written to file_name + ".nodes").
+
+    Returns: None
+    """
+
+    if file_format not in ['graphml', 'jsonl', 'edgelist']:
+        raise Exception('Graph format \"' + str(file_format) + '\" is not supported, available values are: graphml, jsonl, edgelist')
+
+    depths = sorted(node_adder._nodes_buckets.keys())
+    offsets = {}
+    offset = 0
+    for depth in depths:
+        offsets[depth] = offset
+        offset += len(node_adder._nodes_buckets[depth])
+
+    with open(file_name, 'w') as f:
+        nodes_file = open(file_name + '.nodes', 'w') if file_format == 'edgelist' else None
+
+        if file_format == 'graphml':
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+            for key, key_type in [('label', 'string'), ('T', 'int'), ('score', 'double'), ('variance', 'double')]:
+                f.write('<key id="' + key + '" for="node" attr.name="' + key + '" attr.type="' + key_type + '"/>\n')
+            f.write('<graph id="G" edgedefault="directed">\n')
+
+        # Deepest nodes are written first, so ids of children are known when edges of their parents are written
+        ids = {}
+        for depth in reversed(depths):
+            for i, node in enumerate(node_adder._nodes_buckets[depth]):
+                node_id = offsets[depth] + i
+                ids[node] = node_id
+                _write_node(f, nodes_file, file_format, node_id, node)
+
+                for child_node in node._children:
+                    _write_edge(f, file_format, node_id, ids[child_node])
+
+        if file_format == 'graphml':
+            f.write('</graph>\n</graphml>\n')
+
+        if nodes_file is not None:
+            nodes_file.close()
+
+def _write_node(f, nodes_file, file_format, node_id, node):
+    label = node.get_label()
+    score = node.get_score()
+    variance = node.get_variance()
+
+    if file_format == 'graphml':
+        f.write('<node id="n' + str(node_id) + '"><data key="label">' + escape(label) + '</data><data key="T">' + str(node.T) +
+                '</data><data key="score">' + repr(float(score)) + '</data><data key="variance">' + repr(float(variance)) + '</data></node>\n')
+    elif file_format == 'jsonl':
+        f.write(json.dumps({'type': 'node', 'id': node_id, 'features': sorted(node._features), 'T': node.T,
+                            'score': float(score), 'variance': float(variance)}) + '\n')
+    else:
+        nodes_file.write(str(node_id) + '\t' + str(node.T) + '\t' + repr(float(score)) + '\t' + repr(float(variance)) + '\t' + label + '\n')
+
+def _write_edge(f, file_format, source_id, target_id):
+    if file_format == 'graphml':
+        f.write('<edge source="n' + str(source_id) + '" target="n' + str(target_id) + '"/>\n')
+    elif file_format == 'jsonl':
+        f.write('{"type": "edge", "source": ' + str(source_id) + ', "target": ' + str(target_id) + '}\n')
+    else:
+        f.write(str(source_id) + '\t' + str(target_id) + '\n')
+
+def _get_top_k_paths_nodes(node_adder, top_k_paths):
+    root = node_adder._nodes_buckets[0][0]
+    nodes = [root]
+    used_nodes = set(nodes)
+    starts = sorted(root._children, key = lambda node: node.T, reverse = True)[:top_k_paths]
+
+    for node in starts:
+        while node is not None:
+            if node not in used_nodes:
+                used_nodes.add(node)
+                nodes.append(node)
+
+            visited_children = [child_node for child_node in node._children if child_node.T > 0]
+            node = max(visited_children, key = lambda child_node: child_node.T) if len(visited_children) > 0 else None
+
+    return nodes
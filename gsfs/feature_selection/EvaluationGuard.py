@@ -0,0 +1,182 @@
+import time
+import weakref
+import multiprocessing
+
+class EvaluationGuard:
+    """
+    Class for running evaluations of sets of features in a supervised worker process. Worker process is killed when
+    the evaluation exceeds wall-clock timeout or its resident memory (read from /proc, so the memory limit
+    is enforced only on systems providing it) exceeds the limit. Worker is started with "forkserver" (or "spawn")
+    method, so it is never forked from a process with running threads (e.g. thread pools of fit_async, surrogate or BLAS),
+    and it is persistent: the evaluated function is sent to it once (it must be picklable) and state of the function
+    (e.g. caches of evaluators) is kept between evaluations. State is lost only when the worker is killed, then new
+    worker is started for the next evaluation. Resident memory of the worker includes its copy of the function's data.
+    As with any process started by "spawn" or "forkserver", the main module of the program is imported by the worker,
+    so scripts using the guard must start the search under "if __name__ == '__main__':".
+    """
+
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, params):
+        """
+        Parameters
+        ----------
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        self._timeout = params['evaluation_timeout']
+        self._max_rss_mb = params['evaluation_max_rss_mb']
+        self._process = None
+        self._connection = None
+        self._function = None
+        self._finalizer = None
+
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('forkserver')
+        else:
+            self._context = multiprocessing.get_context('spawn')
+
+    def run(self, function, args, timeout = None):
+        """
+        Method for running the function in the worker process, the function is sent to the worker only if it is
+        different than the function of the previous run (or the worker was restarted).
+
+        Parameters
+        ----------
+        function: callable
+            Picklable function returning score of the evaluation,
+        args: tuple
+            Picklable arguments of the function,
+        timeout: float (default: None)
+            Additional timeout in seconds (e.g. remaining time budget), the lower of it and "evaluation_timeout" is used.
+
+        Returns: dict
+            Dictionary with entries "score" (None if the evaluation was stopped), "reason" (None, "timeout", "memory" or "crashed"),
+            "seconds" (wall time of the evaluation) and "rss_mb" (highest observed resident memory of the worker process).
+        """
+
+        if self._timeout is not None:
+            timeout = self._timeout if timeout is None else min(timeout, self._timeout)
+
+        if self._process is None or not self._process.is_alive():
+            self._start()
+
+        if function is not self._function:
+            # Loading of the function (and its data) isn't a part of the evaluation, so it isn't limited by the timeout
+            self._connection.send(('function', function))
+            self._receive_ready()
+            self._function = function
+
+        start_time = time.perf_counter()
+        self._connection.send(('run', args))
+
+        result = {'score': None, 'reason': None, 'seconds': 0, 'rss_mb': 0}
+        finished = False
+        while not finished:
+            if self._connection.poll(EvaluationGuard.POLL_INTERVAL):
+                try:
+                    status, value = self._connection.recv()
+                except (EOFError, OSError):
+                    result['reason'] = 'crashed'
+                    break
+
+                if status == 'error':
+                    raise Exception('Evaluation in worker process failed: ' + value)
+
+                result['score'] = value
+                finished = True
+            else:
+                result['rss_mb'] = max(result['rss_mb'], EvaluationGuard._get_rss_mb(self._process.pid))
+
+            if timeout is not None and time.perf_counter() - start_time > timeout:
+                # Result which came after the timeout is rejected too, but then the worker (and its state) is kept
+                result['score'] = None
+                result['reason'] = 'timeout'
+                break
+            elif self._max_rss_mb is not None and result['rss_mb'] > self._max_rss_mb:
+                result['score'] = None
+                result['reason'] = 'memory'
+                break
+            elif not finished and not self._process.is_alive() and not self._connection.poll():
+                result['reason'] = 'crashed'
+                break
+
+        if result['reason'] is not None and not finished:
+            self._process.kill()
+            self.close()
+
+        result['seconds'] = time.perf_counter() - start_time
+        return result
+
+    def close(self):
+        """
+        Method for stopping the worker process (with all state of the evaluated function), next run starts new worker.
+
+        Returns: None
+        """
+
+        if self._finalizer is not None:
+            self._finalizer()
+
+        self._process = None
+        self._connection = None
+        self._function = None
+        self._finalizer = None
+
+    def _start(self):
+        self.close()
+        self._connection, worker_connection = self._context.Pipe()
+        self._process = self._context.Process(target = EvaluationGuard._run_worker, args = (worker_connection,), daemon = True)
+        self._process.start()
+        worker_connection.close()
+        self._finalizer = weakref.finalize(self, EvaluationGuard._stop, self._process, self._connection)
+
+    def _receive_ready(self):
+        try:
+            status, value = self._connection.recv()
+        except (EOFError, OSError):
+            self.close()
+            raise Exception('Worker process of evaluations stopped while loading the evaluated function')
+
+        if status == 'error':
+            self.close()
+            raise Exception('Loading evaluated function in worker process failed: ' + value)
+
+    @staticmethod
+    def _stop(process, connection):
+        connection.close()
+        process.join(1)
+
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    @staticmethod
+    def _run_worker(connection):
+        function = None
+        while True:
+            try:
+                message, value = connection.recv()
+
+                if message == 'function':
+                    function = value
+                    connection.send(('ready', None))
+                else:
+                    connection.send(('ok', function(*value)))
+            except EOFError:
+                return
+            except Exception as e:
+                connection.send(('error', repr(e)))
+
+    @staticmethod
+    def _get_rss_mb(pid):
+        try:
+            with open('/proc/' + str(pid) + '/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])/1024
+        except (OSError, ValueError):
+            pass
+
+        return 0
@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import pandas as pd
+
+class EvaluationStore:
+    """
+    Class representing on-disk store of scores of sets of features, shared between runs of the algorithm. Scores are kept
+    in SQLite database (in WAL mode, so many processes can read and write it at the same time) and are keyed by context
+    (fingerprint of the dataset, model parameters, metric and split configuration) and sorted names of the features
+    (encoded as JSON list).
+    Every thread uses its own connection.
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the SQLite database file, it is created if it doesn't exist.
+        """
+
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._context = None
+        self._hits = 0
+        self._misses = 0
+
+        connection = self._get_connection()
+        connection.execute('CREATE TABLE IF NOT EXISTS evaluations (context TEXT NOT NULL, features TEXT NOT NULL, ' +
+                           'score REAL NOT NULL, created REAL NOT NULL, PRIMARY KEY (context, features))')
+        connection.commit()
+
+    @staticmethod
+    def get_context(data, labels, model, metric_name, with_cv, params):
+        """
+        Method for getting key of the context in which the scores are calculated.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset,
+        model: sklearn model
+            Model used for scoring,
+        metric_name: str
+            Name of used metric,
+        with_cv: boolean
+            Information whether cross-validation is used,
+        params: dict
+            Parameters of the algorithm.
+
+        Returns: str
+            Hash of the context.
+        """
+
+        context = hashlib.sha256()
+        context.update(json.dumps([str(col) for col in data.columns]).encode())
+        context.update(pd.util.hash_pandas_object(data, index = False).values.tobytes())
+        context.update(pd.util.hash_pandas_object(labels, index = False).values.tobytes())
+        context.update((type(model).__module__ + '.' + type(model).__name__).encode())
+        context.update(repr(sorted((name, repr(value)) for name, value in model.get_params(deep = True).items())).encode())
+        context.update(repr([metric_name, with_cv, params['cv'] if with_cv else params['test_size'], params['random_state']]).encode())
+        return context.hexdigest()
+
+    def set_context(self, context):
+        """
+        Method for setting context used by get_score and add_score, it also resets hits and misses counters.
+
+        Parameters
+        ----------
+        context: str
+            Context returned by get_context.
+
+        Returns: None
+        """
+
+        with self._lock:
+            self._context = context
+            self._hits = 0
+            self._misses = 0
+
+    def get_score(self, features):
+        """
+        Method for getting stored score of the features.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features.
+
+        Returns: float
+            Stored score or None if the features haven't been scored in current context.
+        """
+
+        row = self._get_connection().execute('SELECT score FROM evaluations WHERE context = ? AND features = ?',
+                                             (self._context, EvaluationStore._get_key(features))).fetchone()
+
+        # Scores are looked up by many threads (e.g. in score_subsets)
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return row[0]
+
+    def add_score(self, features, score):
+        """
+        Method for storing score of the features.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features,
+        score: float
+            Score of the features.
+
+        Returns: None
+        """
+
+        connection = self._get_connection()
+        connection.execute('INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?)',
+                           (self._context, EvaluationStore._get_key(features), float(score), time.time()))
+        connection.commit()
+
+    def get_stats(self):
+        """
+        Method for getting number of hits and misses since the context was set.
+
+        Returns: dict
+            Dictionary with entries "hits", "misses" and "hit_rate".
+        """
+
+        with self._lock:
+            hits, misses = self._hits, self._misses
+
+        lookups = hits + misses
+        return {'hits': hits, 'misses': misses, 'hit_rate': hits/lookups if lookups != 0 else 0}
+
+    def get_path(self):
+        """
+        Method for getting path of the database file.
+
+        Returns: str
+            Path of the SQLite database file.
+        """
+
+        return self._path
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_local'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _get_connection(self):
+        # Connections can't be shared between threads nor inherited by forked processes
+        if getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self._path, timeout = 30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return self._local.connection
+
+    @staticmethod
+    def _get_key(features):
+        # JSON list is unambiguous for names containing commas
+        return json.dumps(sorted(features))
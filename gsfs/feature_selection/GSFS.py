@@ -8,12 +8,29 @@ from gsfs.feature_selection.ScoringFunctions import *
 from gsfs.feature_selection.BuildInMetrics import *
 from gsfs.feature_selection.GlobalScores import *
 from gsfs.feature_selection.NodeAdder import *
-from gsfs.feature_selection.DrawTree import draw_tree
+from gsfs.feature_selection.ArrayGraph import *
+from gsfs.feature_selection.DrawTree import draw_tree, export_graph
 from gsfs.feature_selection.TrainTestScore import *
+from gsfs.feature_selection.Screening import *
+from gsfs.feature_selection.WarmStart import *
+from gsfs.feature_selection.GramEvaluator import *
+from gsfs.feature_selection.KernelEvaluator import *
+from gsfs.feature_selection.PipelineEvaluator import *
+from gsfs.feature_selection.Surrogate import *
+from gsfs.feature_selection.ConvergenceMonitor import *
+from gsfs.feature_selection.EvaluationGuard import *
+from gsfs.feature_selection.EvaluationStore import *
+from gsfs.feature_selection.Predictor import *
+from gsfs.feature_selection.Redundancy import *
+from gsfs.feature_selection.ApproximateLRavePaths import *
 
+import os
 import time
-from sklearn.ensemble import RandomForestClassifier
+import functools
+import asyncio
+import math
 from sklearn.base import clone
+from joblib import Parallel, delayed, effective_n_jobs
 import pandas as pd
 
 class GSFS:
@@ -28,16 +45,23 @@ class GSFS:
                  multiarm_strategy = 'discrete', 
                  end_strategy = 'default',
                  with_cv = False,
-                 preprocess = True):
+                 preprocess = True,
+                 evaluator = 'default',
+                 graph_backend = 'objects'):
         """
         Parameters
         ----------
         model: sklearn model
             Model that implements fit, predict, predict_proba methods, used during feature selection - GSFS is a wrapper around that model,
-        calculations_budget: int
-            Budget for calculations, it can be either time in seconds or number of iterations,
-        calculations_done_condition: str (default: iterations)
-            Information of what type of budget the algorithm considers (available values are "iterations" and "time"), 
+        calculations_budget: int|dict
+            Budget for calculations, it can be either time in seconds or number of iterations, for combined conditions
+            it can be a dictionary with budget for every condition (e.g. {"time": 60, "iterations": 1000}), if only "convergence"
+            condition is used, then the budget is a maximal number of iterations,
+        calculations_done_condition: str|list (default: iterations)
+            Information of what type of budget the algorithm considers (available values are "iterations", "time", "cpu_seconds" 
+            (CPU time of the process and its finished child processes, CPU time of worker processes that are still alive,
+            e.g. reused joblib/loky workers when n_jobs > 1, isn't counted) and "convergence"), 
+            conditions can be combined using "|" (e.g. "time|convergence") or passed as a list, then fitting ends when any of them is met,
         params: dict (default: None)
             Dictionary containing possible parameters of algorithm, the values from this dictionary will be taken
             as overrides of default values of the parameters (DefaultSettings.get_default_params()), if nothing is provided
@@ -55,7 +79,17 @@ class GSFS:
             Information whether use cross-validation during calculating model's score, if not then train-test score will be used,
         preprocess: boolean (default: True)
             Information whether use the preprocessing of input data, meaning resetting index of data and labels
-            relabeling the labels to 0 and 1.
+            relabeling the labels to 0 and 1,
+        evaluator: str (default: "default")
+            Name of the method used for scoring sets of features during search, "default" fits the model on every set of features,
+            "gram" scores linear models (Ridge, RidgeClassifier, LinearRegression, LinearDiscriminantAnalysis) in closed form 
+            using precomputed Gram matrix, "kernel" scores SVC with rbf kernel using kernels built incrementally from 
+            precomputed per-feature distances, "pipeline" fits per-column transformers (scalers, imputers) 
+            leading a Pipeline once and then fits only the remaining steps for every set of features (used by default 
+            for such pipelines, unless "cache_preprocessing" parameter is False),
+        graph_backend: str (default: "objects")
+            Representation of the search graph, "objects" uses Node objects, "arrays" keeps statistics, features, children
+            and scores of candidate features of nodes in numpy arrays (ArrayNodeAdder), which needs much less memory for large graphs.
         """
         
         
@@ -64,8 +98,13 @@ class GSFS:
         self._multiarm_strategy_name = multiarm_strategy
         self._end_strategy_name = end_strategy
         self._best_features = None
+        self._predictor = None
+        self._cancelled = False
+        self._pos_class = 'numeric'
         self._best_score = 0
         self._feature_names = None
+        self._feature_groups = None
+        self._groups = None
         self._calculations_done_condition = calculations_done_condition
         self._calculations_budget = calculations_budget
         self._model = clone(model)
@@ -73,13 +112,33 @@ class GSFS:
         self._iterations = 0
         self._preprocess = preprocess
         self._with_cv = with_cv
+        self._timings = {}
+        self._evaluator_name = evaluator
+        self._graph_backend = graph_backend
+        self._evaluator = None
+        self._evaluator_columns = None
+        self._evaluator_context = None
+        self._surrogate = None
+        self._evaluation_guard = None
+        self._guarded_evaluation = None
+        self._evaluation_store = None
+        self._evaluation_stats = {}
         
         print('Using cross-validation: ' + str(with_cv))
         
-        if not (isinstance(self._calculations_budget,float) or isinstance(self._calculations_budget,int)):
-            raise Exception('Calculations budget must be a float or int')
-        elif self._calculations_budget <= 0:
-            raise Exception('Calculations budget must be > 0')
+        if graph_backend not in ['objects', 'arrays']:
+            raise Exception('Graph backend \"' + str(graph_backend) + '\" is not supported, available values are: objects, arrays')
+        
+        if evaluator not in ['default', 'gram', 'kernel', 'pipeline']:
+            raise Exception('Evaluator \"' + str(evaluator) + '\" is not supported, available values are: default, gram, kernel, pipeline')
+        elif evaluator == 'gram' and not GramEvaluator.is_supported(self._model):
+            raise Exception('Gram evaluator supports only Ridge, RidgeClassifier, LinearRegression and LinearDiscriminantAnalysis models')
+        elif evaluator == 'kernel' and not KernelEvaluator.is_supported(self._model):
+            raise Exception('Kernel evaluator supports only SVC model with rbf kernel')
+        elif evaluator == 'pipeline' and not PipelineEvaluator.is_supported(self._model):
+            raise Exception('Pipeline evaluator supports only Pipeline starting with per-column transformers')
+        
+        GSFS._validate_budget(self._calculations_budget)
         
         if params is None:
             print('No param overrides provided, using default ones')
@@ -87,6 +146,9 @@ class GSFS:
         else:
             self._params = DefaultSettings.merge_params(params)
         
+        GSFS._parse_conditions(self._calculations_done_condition, self._calculations_budget)
+        self._stopping_info = {}
+        
     @staticmethod 
     def print_info():
         print('Graph Search Feature Selection')
@@ -94,7 +156,10 @@ class GSFS:
     
     def fit(self, data, out_variable, pos_class = 'numeric', warm_start = False, 
                  calculations_done_conditions = None,
-                 calculations_budget = None):
+                 calculations_budget = None,
+                 screening = None,
+                 prior_stats = None,
+                 feature_groups = None):
         """
         Method for perfoming the fitting of the feature selection algorithm.
         
@@ -107,33 +172,141 @@ class GSFS:
         pos_class: str (default: 'numeric')
             Value indicating the positive class, which will be transformed to 1 and all other values from output variable
             will be 0, by default the highest value of the output variable will be taken as positive class,
-        warm_start: boolean (default: False)
-            Information whether before the actual graph based feature selection the g-RAVE scores will be initialised from
-            feature_importance of RandomForestClassifier,
-        calculations_done_condition: str (default: None)
-            Information of what type of budget the algorithm considers (available values are 'iterations' and 'time'), 
-            default value is taken from constructor,
-        calculations_budget: int (default: None)
+        warm_start: boolean|list (default: False)
+            Information whether before the actual graph based feature selection the g-RAVE and l-RAVE scores will be initialised from
+            importances of the estimators from "warm_start_estimators" parameter, list of estimators names ("forest", "l1_logistic", 
+            "permutation") can be passed instead to override the parameter,
+        calculations_done_condition: str|list (default: None)
+            Information of what type of budget the algorithm considers (available values are 'iterations', 'time', 
+            'cpu_seconds' and 'convergence', possibly combined), default value is taken from constructor,
+        calculations_budget: int|dict (default: None)
             Budget for calculations, it can be either time in seconds or number of iterations, default value is taken
-            from constructor.
+            from constructor,
+        screening: str (default: None)
+            If not None, then before the graph search features are screened with selected univariate statistic 
+            ("mutual_info", "f_classif" or "point_biserial"), depending on "screening_mode" parameter only 
+            "screening_top_k" best features are kept ("filter") or the statistics are used as g-RAVE priors ("prior"),
+        prior_stats: str|GSFS|GlobalScores (default: None)
+            If not None, then g-RAVE and l-RAVE scores of previous run (path passed to save_stats_to_files, fitted GSFS or
+            GlobalScores object) are added as priors, with counts multiplied by "prior_stats_decay" and capped at "prior_stats_max_n",
+        feature_groups: dict (default: None)
+            If not None, dictionary containing pairs of names of groups and lists of their features (e.g. returned by 
+            Preprocessing.one_hot_encode with return_groups=True), every group is added to and removed from sets of features 
+            as one unit, so nodes, g-RAVE and l-RAVE scores are kept for groups (features outside of groups form single groups 
+            named as the features), best features contain all features of selected groups, if screening in "filter" mode 
+            removes some features of a group, then the group keeps only the remaining features (groups without remaining features
+            are removed).
 
         Returns: None.
         """
         
+        for _ in self.iter_fit(data, out_variable, pos_class, warm_start, calculations_done_conditions, calculations_budget, 
+                               screening, prior_stats, feature_groups):
+            pass
+    
+    def iter_fit(self, data, out_variable, pos_class = 'numeric', warm_start = False, 
+                 calculations_done_conditions = None,
+                 calculations_budget = None,
+                 screening = None,
+                 prior_stats = None,
+                 feature_groups = None,
+                 events = 'improvement'):
+        """
+        Method for perfoming the fitting step by step, arguments are validated immediately, but the fitting is done lazily 
+        while the returned generator is consumed. When the generator is exhausted the object is fitted as after the fit method, 
+        if it is closed earlier (or cancel method is called), the search stops and the model is trained on the best features found so far.
+        
+        Parameters
+        ----------
+        data, out_variable, pos_class, warm_start, calculations_done_conditions, calculations_budget, screening, prior_stats,
+        feature_groups:
+            See fit method,
+        events: str (default: "improvement")
+            Which iterations generate events, possible values are "improvement" (only iterations that improved best score) 
+            and "iteration" (every iteration).
+
+        Returns: generator
+            Generator of events, dictionaries with entries "event" ("improvement" or "iteration"), "iteration", "score" and 
+            "features" (score and features of the iteration), "best_score", "best_features" and "time" (seconds since start of the search).
+        """
+        
+        if events not in ['improvement', 'iteration']:
+            raise Exception('Events \"' + str(events) + '\" are not supported, available values are: improvement, iteration')
+        
         self._pos_class = pos_class
         if calculations_done_conditions is not None:
             self._calculations_done_condition = calculations_done_conditions
         
         if calculations_budget is not None:
-            if not (isinstance(calculations_budget,float) or isinstance(calculations_budget,int)):
-                raise Exception('Calculations budget must be a float or int')
-            elif calculations_budget <= 0:
-                raise Exception('Calculations budget must be > 0')
+            GSFS._validate_budget(calculations_budget)
             self._calculations_budget = calculations_budget
+        
+        GSFS._parse_conditions(self._calculations_done_condition, self._calculations_budget)
             
         data, out_variable = self._preprocess_input(data, out_variable)
+        self._input_columns = list(data.columns)
+        self._feature_groups = GSFS._get_feature_groups(self._input_columns, feature_groups)
+        self._cancelled = False
         
-        self._classification_fit_start(data, out_variable, warm_start)
+        return self._iter_classification_fit_start(data, out_variable, warm_start, screening, prior_stats, events)
+    
+    async def fit_async(self, data, out_variable, pos_class = 'numeric', warm_start = False, 
+                        calculations_done_conditions = None,
+                        calculations_budget = None,
+                        screening = None,
+                        prior_stats = None,
+                        feature_groups = None,
+                        events = 'improvement',
+                        executor = None):
+        """
+        Asynchronous version of iter_fit, every iteration of the search is run in the executor, so many searches can be run
+        on one event loop. Breaking the iteration or cancelling the task consuming it stops the search after currently 
+        running iteration and trains the model on the best features found so far, so the object stays usable.
+        
+        Parameters
+        ----------
+        data, out_variable, pos_class, warm_start, calculations_done_conditions, calculations_budget, screening, prior_stats,
+        feature_groups, events:
+            See iter_fit method,
+        executor: concurrent.futures.Executor (default: None)
+            Executor running the iterations, if None then default executor of the event loop is used.
+
+        Returns: async generator
+            Asynchronous generator of events (see iter_fit).
+        """
+        
+        loop = asyncio.get_running_loop()
+        iterator = self.iter_fit(data, out_variable, pos_class, warm_start, calculations_done_conditions, calculations_budget, 
+                                 screening, prior_stats, feature_groups, events)
+        future = None
+        
+        try:
+            while True:
+                future = loop.run_in_executor(executor, next, iterator, None)
+                # Shielded, so cancellation doesn't leave the iteration running in the executor behind
+                event = await asyncio.shield(future)
+                future = None
+                
+                if event is None:
+                    return
+                
+                yield event
+        finally:
+            if future is not None:
+                self.cancel()
+                await asyncio.wait([future])
+            
+            await loop.run_in_executor(executor, iterator.close)
+    
+    def cancel(self):
+        """
+        Method for cooperative cancellation of running fitting (e.g. from other thread), the search stops after currently running 
+        iteration and the model is trained on the best features found so far.
+
+        Returns: None
+        """
+        
+        self._cancelled = True
     
     def refit(self, data, out_variable, calculations_budget):
         """Not fully supported method, only for experimenting purposes."""
@@ -151,7 +324,9 @@ class GSFS:
             self._calculations_budget += calculations_budget + 1
         else:
             self._calculations_budget = calculations_budget
-            
+        
+        self._input_columns = list(data.columns)
+        self._cancelled = False
         self._classification_fit(data, out_variable)
     
     def _preprocess_input(self, data, out_variable):
@@ -165,24 +340,188 @@ class GSFS:
             
         return data, out_variable
     
-    def _classification_fit_start(self, data, out_variable, warm_start):
+    def _iter_classification_fit_start(self, data, out_variable, warm_start, screening, prior_stats, events):
+        self._timings = {}
+        priors = None
+        # Scores are read before initialization, as previous run can be the one of this object
+        prior_stats = GSFS._get_prior_stats(prior_stats)
+        
+        if screening is not None:
+            data, priors = self._screen_features(data, out_variable, screening)
+        
         self._init_fitting_values(data)
         
-        if warm_start:
-            rf = RandomForestClassifier()
-            rf.fit(data, out_variable)
-            for i in range(len(data.columns)):
-                self._global_scores._update_g_rave_score([data.columns[i]], rf.feature_importances_[i])
+        if self._evaluator is not None:
+            self._evaluator.close()
+        
+        self._evaluator = self._create_evaluator(data, out_variable, self._metric)
+        context = None
+        
+        if self._evaluation_store is not None or self._evaluator is not None:
+            context = EvaluationStore.get_context(data, out_variable, self._model, self._metric_name, self._with_cv, self._params)
+        
+        # Context of the evaluator is kept, so score_subsets can reuse it (and its caches) for the same dataset
+        self._evaluator_columns = list(data.columns) if self._evaluator is not None else None
+        self._evaluator_context = context if self._evaluator is not None else None
+        
+        if self._evaluation_store is not None:
+            self._evaluation_store.set_context(context)
+        
+        if priors is not None:
+            self._global_scores.add_prior_scores(self._get_groups_priors(priors), self._params['screening_pseudo_count'])
+        
+        if prior_stats is not None:
+            self._add_prior_stats(prior_stats)
+        
+        if warm_start is not False and warm_start is not None:
+            self._warm_start(data, out_variable, warm_start)
 
-        self._classification_fit(data, out_variable)
+        yield from self._iter_classification_fit(data, out_variable, events)
+    
+    def _create_evaluator(self, data, out_variable, metric):
+        if self._evaluator_name == 'gram':
+            return GramEvaluator(self._model, metric, self._metric_name, data, out_variable, self._with_cv, self._params)
+        elif self._evaluator_name == 'kernel':
+            return KernelEvaluator(self._model, metric, self._metric_name, data, out_variable, self._with_cv, self._params)
+        elif self._evaluator_name == 'pipeline' or (self._evaluator_name == 'default' and self._params['cache_preprocessing'] and 
+                                                    PipelineEvaluator.is_supported(self._model)):
+            return PipelineEvaluator(self._model, metric, self._metric_name, data, out_variable, self._with_cv, self._params)
+        
+        return None
+    
+    def _warm_start(self, data, out_variable, warm_start):
+        start_time = time.time()
+        estimators = self._params['warm_start_estimators'] if warm_start is True else list(warm_start)
+        chance_score = BuildInMetrics().get_chance_score(self._metric_name, out_variable)
+        priors = WarmStart(estimators, self._params).get_priors(self._model, self._metric, self._metric_name, 
+                                                               data, out_variable, chance_score)
+        self._global_scores.add_prior_scores(self._get_groups_priors(priors), self._params['warm_start_pseudo_count'], 
+                                             self._params['warm_start_l_rave_pseudo_count'])
+        
+        self._timings['warm_start'] = time.time() - start_time
+        print('Warm start (' + ', '.join(estimators) + ') done in ' + '{:.2f}'.format(self._timings['warm_start']) + 's')
+    
+    @staticmethod
+    def _get_prior_stats(prior_stats):
+        if prior_stats is None or isinstance(prior_stats, GlobalScores):
+            return prior_stats
+        elif isinstance(prior_stats, str):
+            return GlobalScores.read_files(prior_stats)
+        
+        return prior_stats._global_scores
+    
+    def _add_prior_stats(self, prior_stats):
+        self._global_scores.add_decayed_scores(prior_stats, self._params['prior_stats_decay'], 
+                                               self._params['prior_stats_max_n'], self._feature_names)
+        print('Prior stats added for ' + str(len(self._global_scores.scores['g_rave'])) + ' features')
+    
+    def _create_l_rave(self):
+        if self._params['l_rave_backend'] == 'exact':
+            return None
+        
+        return ApproximateLRavePaths(self._params['l_rave_max_paths'], self._params['l_rave_reservoir_size'], 
+                                     self._params['l_rave_sketch_width'], self._params['l_rave_sketch_depth'], 
+                                     self._params['random_state'])
+    
+    def _get_redundancy(self, data):
+        start_time = time.time()
+        redundancy = Redundancy(data, self._params['redundancy'], self._params['redundancy_threshold'], 
+                                self._params['redundancy_block_size'], self._params['redundancy_bins'], self._groups)
+        
+        self._timings['redundancy'] = time.time() - start_time
+        print('Redundancy (' + self._params['redundancy'] + ') done in ' + '{:.2f}'.format(self._timings['redundancy']) + 
+              's, found ' + str(redundancy.get_pairs_count()) + ' redundant pairs')
+        
+        return redundancy
+    
+    def _screen_features(self, data, out_variable, screening):
+        start_time = time.time()
+        names = list(data.columns)
+        scores = Screening.get_scores(screening, data, out_variable, self._params['random_state'])
+        top_k = self._params['screening_top_k']
+        best_features = Screening.get_top_k(names, scores, top_k)
+        priors = None
+        
+        if self._params['screening_mode'] == 'filter':
+            data = data.loc[:, best_features]
+        else:
+            low = BuildInMetrics().get_chance_score(self._metric_name, out_variable)
+            calibrated = Screening.calibrate(scores, low, 1)
+            kept = set(best_features)
+            priors = dict([name, calibrated[i] if name in kept else low] for i, name in enumerate(names))
+        
+        self._timings['screening'] = time.time() - start_time
+        print('Screening (' + screening + ') done in ' + '{:.2f}'.format(self._timings['screening']) + 
+              's, kept ' + str(len(data.columns)) + '/' + str(len(names)) + ' features')
+        
+        return data, priors
     
     def _classification_fit(self, data, out_variable):
+        for _ in self._iter_classification_fit(data, out_variable, 'improvement'):
+            pass
+    
+    def _iter_classification_fit(self, data, out_variable, events):
         self._time = time.time()
+        self._cpu_time = GSFS._get_cpu_time()
+        self._stop_conditions = GSFS._parse_conditions(self._calculations_done_condition, self._calculations_budget)
+        self._convergence_monitor = ConvergenceMonitor(self._params)
+        self._stopping_info = {}
         
-        while not self._is_fitting_over():
-            self._single_classification_iteration(data, out_variable)
+        try:
+            while not self._is_fitting_over():
+                best_score = self._best_score
+                node, score = self._single_classification_iteration(data, out_variable)
+                
+                if events == 'iteration' or self._best_score != best_score:
+                    yield {'event': 'improvement' if self._best_score != best_score else 'iteration',
+                           'iteration': self._iterations,
+                           'score': score,
+                           'features': self._expand_features(node._features),
+                           'best_score': self._best_score,
+                           'best_features': list(self._best_features),
+                           'time': time.time() - self._time}
+        except GeneratorExit:
+            # Generator closed by the consumer, the search is finished as if it was cancelled
+            self._set_stopping_info('cancelled', self._iterations)
+            print('Fitting stopped (cancelled) after ' + str(self._iterations) + ' iterations')
+            self._finish_classification_fit(data, out_variable)
+            raise
+        
+        self._finish_classification_fit(data, out_variable)
+    
+    def _finish_classification_fit(self, data, out_variable):
+        self._timings['search'] = time.time() - self._time
+        
+        if self._surrogate is not None:
+            self._surrogate.close()
+            print('True/surrogate evaluations: ' + str(self._evaluation_stats['true_evaluations']) + '/' + 
+                  str(self._evaluation_stats['surrogate_evaluations']))
+        
+        if self._evaluation_store is not None:
+            store_stats = self._evaluation_store.get_stats()
+            self._evaluation_stats.update({'store_hits': store_stats['hits'], 'store_misses': store_stats['misses'], 
+                                           'store_hit_rate': store_stats['hit_rate']})
+            print('Evaluation store hits/misses: ' + str(store_stats['hits']) + '/' + str(store_stats['misses']))
+        
+        # Caches (and memory-mapped files) of the evaluator are released, it can still be reused by score_subsets
+        if self._evaluator is not None:
+            self._evaluator.close()
+        
+        CV.clear_cache()
+        TrainTestScore.clear_cache()
+        
+        if self._evaluation_guard is not None:
+            self._evaluation_guard.close()
+            self._guarded_evaluation = None
+            
+            if self._best_features is None and self._evaluation_stats['killed_evaluations'] > 0:
+                raise Exception('All evaluations were stopped by the evaluation guard (' + 
+                                ', '.join(sorted(set(event['reason'] for event in self._evaluation_stats['guard_events']))) + 
+                                '), increase evaluation_timeout or evaluation_max_rss_mb')
         
-        self._model.fit(data.loc[:, self._best_features], out_variable)
+        if self._best_features is not None:
+            self._model.fit(data.loc[:, self._best_features], out_variable)
+            self._predictor = Predictor(self._model, self._input_columns, self._best_features)
     
     def _single_classification_iteration(self, data, out_variable):
         used_nodes = [None]*(self._longest_graph_branch+1)
@@ -197,31 +536,167 @@ class GSFS:
             used_nodes[used_nodes_index] = node
             used_nodes_index += 1  
 
-        score = self._get_score_for_features(data[list(node._features)], out_variable)
+        score, is_true_score = self._get_score_for_node(node, data, out_variable)
         self._update_nodes(used_nodes, score)
         self._global_scores.update_score(node._features, score)
         
-        
-        if score > self._best_score:
-            self._best_score = score
-            self._best_features = list(node._features)
-            self._scores_history = self._scores_history.append({
-                'score': score, 
-                'features': self._best_features,
-                'time': time.time() - self._time,
-                'iteration': self._iterations
-            },ignore_index=True)
+        # Penalties of stopped evaluations and surrogate predictions are used only to guide the search
+        if is_true_score and score > self._best_score:
+            self._set_best_node(node, score)
         
         if self._longest_graph_branch < used_nodes_index:
             self._longest_graph_branch = used_nodes_index
+        
+        return node, score
 
     
+    def _set_best_node(self, node, score):
+        self._best_score = score
+        self._best_features = self._expand_features(node._features)
+        self._scores_history = self._scores_history.append({
+            'score': score, 
+            'features': self._best_features,
+            'time': time.time() - self._time,
+            'iteration': self._iterations
+        },ignore_index=True)
+    
     def _update_nodes(self, used_nodes, score):
         for i in range(len(used_nodes)):
             if used_nodes[i] is None:
                 return
             used_nodes[i].add_score(score)
     
+    def _get_score_for_node(self, node, data, out_variable):
+        features = list(node._features)
+        columns = self._expand_features(node._features)
+        
+        if self._evaluation_store is not None:
+            score = self._evaluation_store.get_score(columns)
+            
+            if score is not None:
+                if self._surrogate is not None:
+                    self._surrogate.add_evaluation(features, score, self._global_scores)
+                return score, True
+        
+        if self._surrogate is not None:
+            score = self._surrogate.get_score(features, self._global_scores, self._best_score)
+            
+            if score is not None:
+                self._evaluation_stats['surrogate_evaluations'] += 1
+                return score, False
+        
+        start_time = time.perf_counter()
+        start_cpu_time = GSFS._get_cpu_time()
+        is_true_score = True
+        
+        if self._evaluation_guard is not None:
+            score, is_true_score = self._get_guarded_score(columns, data, out_variable)
+        else:
+            score = self._evaluate_features(columns, data, out_variable)
+        
+        seconds = time.perf_counter() - start_time
+        cpu_seconds = GSFS._get_cpu_time() - start_cpu_time
+        node.add_cost(seconds, cpu_seconds)
+        self._global_scores.update_cost(node._features, seconds)
+        self._evaluation_stats['true_evaluations'] += 1
+        self._evaluation_stats['evaluation_seconds'] += seconds
+        self._evaluation_stats['evaluation_cpu_seconds'] += cpu_seconds
+        
+        if self._surrogate is not None and is_true_score:
+            self._surrogate.add_evaluation(features, score, self._global_scores)
+        
+        if self._evaluation_store is not None and is_true_score:
+            self._evaluation_store.add_score(columns, score)
+        
+        return score, is_true_score
+    
+    def _expand_features(self, features):
+        if self._groups is None:
+            return list(features)
+        
+        return [column for name in sorted(features) for column in self._groups[name]]
+    
+    def _get_groups_priors(self, priors):
+        if self._groups is None:
+            return priors
+        
+        return dict([name, max(priors[column] for column in group)] for name, group in self._groups.items())
+    
+    @staticmethod
+    def _get_feature_groups(columns, feature_groups):
+        if feature_groups is None:
+            return None
+        
+        groups = {}
+        grouped = set()
+        for name, group in feature_groups.items():
+            group = [str(column) for column in group]
+            
+            if len(group) == 0:
+                raise Exception('Feature group \"' + str(name) + '\" is empty')
+            elif not set(group).issubset(columns):
+                raise Exception('Features ' + ', '.join(sorted(set(group) - set(columns))) + ' of group \"' + str(name) + 
+                                '\" are not in the dataset')
+            elif not grouped.isdisjoint(group):
+                raise Exception('Feature groups must be disjoint, features ' + ', '.join(sorted(grouped.intersection(group))) + 
+                                ' are in many groups')
+            
+            grouped.update(group)
+            groups[str(name)] = group
+        
+        for column in columns:
+            if column in grouped:
+                continue
+            elif column in groups:
+                raise Exception('Name of feature group \"' + column + '\" is the same as name of feature outside of the group')
+            
+            groups[column] = [column]
+        
+        return groups
+    
+    def _evaluate_features(self, features, data, out_variable):
+        if self._evaluator is not None:
+            return self._evaluator.score(features)
+        
+        return self._get_score_for_features(data[features], out_variable)
+    
+    def _get_guarded_score(self, features, data, out_variable):
+        timeout = None
+        if 'time' in self._stop_conditions:
+            timeout = max(0, self._stop_conditions['time'] - (time.time() - self._time))
+        
+        if self._guarded_evaluation is None:
+            # Evaluator and data are sent to the worker process once, so caches of the evaluator are kept in the worker
+            self._guarded_evaluation = functools.partial(GSFS._evaluate_guarded, self._evaluator, self._metric, self._metric_name, 
+                                                         self._model, self._with_cv, self._params, data, out_variable)
+        
+        result = self._evaluation_guard.run(self._guarded_evaluation, (features,), timeout)
+        
+        if result['reason'] is None:
+            return result['score'], True
+        
+        if self._params['evaluation_penalty'] is not None:
+            score = self._params['evaluation_penalty']
+        else:
+            score = BuildInMetrics().get_chance_score(self._metric_name, out_variable)
+        
+        self._evaluation_stats['killed_evaluations'] += 1
+        self._evaluation_stats['guard_events'].append({'iteration': self._iterations, 
+                                                       'features': sorted(features), 
+                                                       'reason': result['reason'],
+                                                       'seconds': result['seconds'], 
+                                                       'rss_mb': result['rss_mb'],
+                                                       'score': score})
+        print('Evaluation of ' + ','.join(sorted(features)) + ' stopped (' + result['reason'] + '), using score ' + str(score))
+        return score, False
+    
+    @staticmethod
+    def _evaluate_guarded(evaluator, metric, metric_name, model, with_cv, params, data, out_variable, features):
+        if evaluator is not None:
+            return evaluator.score(features)
+        
+        return GSFS._score_features(metric, metric_name, clone(model), data[features], out_variable, with_cv, params)
+    
     def _get_score_for_features(self, data, out_variable, with_cv = None, model = None):
         if with_cv is None:
             with_cv = self._with_cv
@@ -229,46 +704,150 @@ class GSFS:
         if model is None:
             model = clone(self._model)
         
+        return GSFS._score_features(self._metric, self._metric_name, model, data, out_variable, with_cv, self._params)
+    
+    @staticmethod
+    def _score_features(metric, metric_name, model, data, out_variable, with_cv, params):
         if with_cv:
-            return CV.cv(self._metric, self._metric_name, model, data, out_variable, self._params['cv'])
+            return CV.cv(metric, metric_name, model, data, out_variable, params['cv'], params['random_state'])
             
-        return TrainTestScore.train_test_score(self._metric, self._metric_name, 
-                                                   model, data, out_variable, self._params['test_size'])
+        return TrainTestScore.train_test_score(metric, metric_name, 
+                                                   model, data, out_variable, params['test_size'], params['random_state'])
             
     
     def _init_fitting_values(self, data):
-        self._root = Node(set(), None)
-        self._feature_names = set(data.columns)
+        if self._feature_groups is None:
+            self._groups = None
+            self._feature_names = set(data.columns)
+        else:
+            # Groups keep only their columns that are left after screening
+            columns = set(data.columns)
+            self._groups = dict([name, [column for column in group if column in columns]] 
+                                for name, group in self._feature_groups.items() if any(column in columns for column in group))
+            self._feature_names = set(self._groups.keys())
+        
         self._multiarm_strategy = MultiArmStrategies(self._multiarm_strategy_name, self._feature_names, self._params)
         self._end_strategy = EndStrategies(self._end_strategy_name, len(self._feature_names))
-        self._scoring_functions = ScoringFunctions(self._scoring_function_name, self._params)
-        self._metric = BuildInMetrics().get_metric(self._metric_name)
+        self._redundancy = self._get_redundancy(data) if self._params['redundancy'] is not None else None
+        self._scoring_functions = ScoringFunctions(self._scoring_function_name, self._params, self._redundancy)
+        self._metric = BuildInMetrics().get_metric(self._metric_name, self._params['fast_metrics'])
         self._best_features = None
         self._best_score = 0
         self._longest_graph_branch = 1
-        self._global_scores = GlobalScores()
+        self._global_scores = GlobalScores(l_rave = self._create_l_rave())
         self._scores_history = pd.DataFrame(columns=['score','features','time','iteration'])
-        self._node_adder = NodeAdder(self._root)
+        
+        if self._graph_backend == 'arrays':
+            self._node_adder = ArrayNodeAdder(self._feature_names)
+            self._root = self._node_adder.get_root()
+        else:
+            self._root = Node(set(), None)
+            self._node_adder = NodeAdder(self._root, self._feature_names)
+        
         self._time = time.time()
         self._iterations = 0
+        self._evaluation_stats = {'true_evaluations': 0, 'surrogate_evaluations': 0, 
+                                  'evaluation_seconds': 0, 'evaluation_cpu_seconds': 0,
+                                  'killed_evaluations': 0, 'guard_events': []}
+        self._surrogate = None
+        self._evaluation_guard = None
+        self._guarded_evaluation = None
+        
+        self._evaluation_store = self._get_evaluation_store()
+        
+        if self._params['evaluation_timeout'] is not None or self._params['evaluation_max_rss_mb'] is not None:
+            self._evaluation_guard = EvaluationGuard(self._params)
+        
+        if self._params['surrogate'] is not None:
+            self._surrogate = Surrogate(self._params['surrogate'], self._feature_names, self._params)
     
     def _is_fitting_over(self):
         self._iterations += 1
         self._print_calculations_info_if_needed()
         
-        if self._calculations_done_condition == 'iterations':
-            return self._iterations > self._calculations_budget 
-        else:
-            return (time.time() - self._time) > self._calculations_budget 
+        reason = self._get_stopping_reason()
+        
+        if reason is None:
+            return False
+        
+        self._set_stopping_info(reason, self._iterations - 1)
+        print('Fitting stopped (' + reason + ') after ' + str(self._iterations - 1) + ' iterations')
+        return True
+    
+    def _set_stopping_info(self, reason, iterations):
+        self._stopping_info = {'reason': reason, 
+                               'iterations': iterations,
+                               'converged_iteration': self._convergence_monitor.get_converged_iteration()}
+    
+    def _get_stopping_reason(self):
+        if self._cancelled:
+            return 'cancelled'
+        
+        for condition, budget in self._stop_conditions.items():
+            if condition == 'iterations' and self._iterations > budget:
+                return condition
+            elif condition == 'time' and (time.time() - self._time) > budget:
+                return condition
+            elif condition == 'cpu_seconds' and (GSFS._get_cpu_time() - self._cpu_time) > budget:
+                return condition
+            elif condition == 'convergence' and self._convergence_monitor.update(self._iterations - 1, self._best_score, 
+                                                                                 self._global_scores):
+                return condition
+        
+        return None
+    
+    @staticmethod
+    def _get_cpu_time():
+        # CPU time of the process and its finished child processes, os.times() doesn't report children that
+        # are still running, so CPU time of persistent joblib/loky workers is missed (the budget undercounts)
+        times = os.times()
+        return time.process_time() + times.children_user + times.children_system
+    
+    @staticmethod
+    def _validate_budget(budget):
+        budgets = budget.values() if isinstance(budget, dict) else [budget]
+        
+        for value in budgets:
+            if not (isinstance(value,float) or isinstance(value,int)):
+                raise Exception('Calculations budget must be a float or int')
+            elif value <= 0:
+                raise Exception('Calculations budget must be > 0')
+    
+    @staticmethod
+    def _parse_conditions(calculations_done_condition, calculations_budget):
+        if isinstance(calculations_done_condition, str):
+            calculations_done_condition = calculations_done_condition.split('|')
+        
+        conditions = {}
+        for condition in [condition.strip() for condition in calculations_done_condition]:
+            if condition not in ['iterations', 'time', 'cpu_seconds', 'convergence']:
+                raise Exception('Calculations done condition \"' + condition + '\" is not supported, available values are: iterations, time, cpu_seconds, convergence')
+            elif condition == 'convergence':
+                conditions[condition] = None
+            elif not isinstance(calculations_budget, dict):
+                conditions[condition] = calculations_budget
+            elif condition in calculations_budget:
+                conditions[condition] = calculations_budget[condition]
+            else:
+                raise Exception('No calculations budget for condition \"' + condition + '\"')
+        
+        if list(conditions.keys()) == ['convergence']:
+            conditions['iterations'] = calculations_budget.get('iterations') if isinstance(calculations_budget, dict) else calculations_budget
+            
+            if conditions['iterations'] is None:
+                raise Exception('No calculations budget for condition \"iterations\"')
+        
+        return conditions
     
     def _print_calculations_info_if_needed(self):
-        if self._calculations_done_condition != 'iterations':
+        if 'iterations' not in self._stop_conditions:
             return
         
-        calc_interval = self._calculations_budget/100
+        budget = self._stop_conditions['iterations']
+        calc_interval = budget/100
         
         if (int((self._iterations/calc_interval))-int(((self._iterations-1)/calc_interval))) > 0:
-            print(str(self._iterations - 1) + '/' + str(self._calculations_budget))
+            print(str(self._iterations - 1) + '/' + str(budget))
     
     def get_best_features(self):
         """
@@ -290,6 +869,41 @@ class GSFS:
         
         return self._best_score
     
+    def get_stopping_info(self):
+        """
+        Method for getting information why the last fitting stopped.
+
+        Returns: dict
+            Dictionary containing entries "reason" (condition that stopped the fitting or "cancelled"), "iterations" (number of done iterations)
+            and "converged_iteration" (iteration in which convergence was detected or None).
+        """
+        
+        return self._stopping_info
+    
+    def get_timings(self):
+        """
+        Method for getting duration of stages of last fitting (e.g. "screening", "search").
+
+        Returns: dict
+            Dictionary containing pairs of stage names and durations in seconds.
+        """
+        
+        return self._timings
+    
+    def get_evaluation_stats(self):
+        """
+        Method for getting statistics of evaluations of sets of features done during last fitting, e.g. number of
+        evaluations done with the model ("true_evaluations") and with surrogate model ("surrogate_evaluations"),
+        total wall time ("evaluation_seconds") and CPU time ("evaluation_cpu_seconds") of evaluations done with the model,
+        number of evaluations stopped by the guard ("killed_evaluations") and their details ("guard_events"), numbers of found
+        and not found scores in evaluation store ("store_hits", "store_misses", "store_hit_rate").
+
+        Returns: dict
+            Dictionary containing names of statistics and their values.
+        """
+        
+        return self._evaluation_stats
+    
     def get_search_history(self):
         """
         Method for getting search history.
@@ -312,15 +926,15 @@ class GSFS:
 
         Parameters
         ----------
-        data: pandas.DataFrame
-            Data for which the classes will be returned.
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which the classes will be returned, numpy array must have the same columns as the dataset used for fitting,
+            input data is not modified.
 
         Returns: list
             List with predictions, every value is either 1 (positive) or 0 (negative) class, i-th row is a class for i-th input observation.
         """
 
-        data.columns = [str(col) for col in data.columns]
-        return self._model.predict(data.loc[:, self._best_features])
+        return self._predictor.predict(data)
     
     def predict_proba(self, data):
         """
@@ -328,19 +942,69 @@ class GSFS:
 
         Parameters
         ----------
-        data: pandas.DataFrame
-            Data for which probabilites will be returned.
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which probabilites will be returned, numpy array must have the same columns as the dataset used for fitting,
+            input data is not modified.
 
         Returns: 2-dimensional list
             List, where first column represents probabilities of 0 (negative) class and second probabilities of 1 (positive) class.
         """
 
-        data.columns = [str(col) for col in data.columns]
-        return self._model.predict_proba(data.loc[:, self._best_features])
+        return self._predictor.predict_proba(data)
+    
+    def predict_chunks(self, chunks, proba = True):
+        """
+        Method for lazily predicting consecutive chunks of data (see Predictor.predict_chunks).
+
+        Parameters
+        ----------
+        chunks: iterable
+            Iterable of pandas.DataFrame or numpy.ndarray objects,
+        proba: boolean (default: True)
+            If True then probabilities of classes are returned, otherwise classes.
+
+        Returns: generator
+            Generator of predictions for consecutive chunks.
+        """
+
+        return self._predictor.predict_chunks(chunks, proba)
+    
+    def predict_file(self, input_path, output_path = None, chunksize = 100000, proba = True, **read_csv_kwargs):
+        """
+        Method for predicting CSV file in chunks, in constant memory if output path is given (see Predictor.predict_file).
+
+        Parameters
+        ----------
+        input_path: str
+            Path of CSV file with header containing names of the features,
+        output_path: str (default: None)
+            Path of CSV file to which predictions will be written, if None then predictions are returned,
+        chunksize: int (default: 100000)
+            Number of rows read at a time,
+        proba: boolean (default: True)
+            If True then probabilities of classes are predicted, otherwise classes,
+        read_csv_kwargs:
+            Other arguments passed to pandas.read_csv.
+
+        Returns: int|numpy.ndarray
+            Number of predicted rows if output path is given, otherwise predictions.
+        """
+
+        return self._predictor.predict_file(input_path, output_path, chunksize, proba, **read_csv_kwargs)
+    
+    def get_predictor(self):
+        """
+        Method for getting inference path of the model trained on the best features.
+
+        Returns: gsfs.feature_selection.Predictor
+            Predictor object.
+        """
+
+        return self._predictor
     
     def get_features_importances(self):
         """
-        Method for getting importances (g-RAVE) of all features used in algorithm.
+        Method for getting importances (g-RAVE) of all features used in algorithm (of groups, if feature groups were used).
         
         Returns: dict
             Dictionary containing pairs of features and importances.
@@ -348,23 +1012,25 @@ class GSFS:
         importances = dict([k, self._global_scores.get_g_rave_score(k)] for k,v in self._global_scores.scores['g_rave'].items())
         return dict(sorted(importances.items(), key=lambda item: item[1], reverse = True))
     
-    def one_hot_encode(self, data):
+    def one_hot_encode(self, data, return_groups = False):
         """
         Method for one-hot encoding the data.
         
         Parameters
         ----------
         data: pandas.DataFrame
-            Input dataset that will be one-hot encoded.
+            Input dataset that will be one-hot encoded,
+        return_groups: boolean (default: False)
+            Information whether also groups of dummy columns will be returned (see Preprocessing.one_hot_encode).
             
-        Returns: pandas.DataFrame
-            One-hot encoded dataset.
+        Returns: pandas.DataFrame|tuple
+            One-hot encoded dataset, or tuple of the dataset and dictionary of groups if return_groups is True.
         """
         
         data.columns = [str(col) for col in data.columns]
-        return Preprocessing.one_hot_encode(data)
+        return Preprocessing.one_hot_encode(data, return_groups)
     
-    def draw_graph(self, file_name = None, view = True, view_nodes_info = False):
+    def draw_graph(self, file_name = None, view = True, view_nodes_info = False, max_depth = None, top_k_paths = None):
         """
         Method for drawing the graph of the search algorithm.
         
@@ -375,12 +1041,32 @@ class GSFS:
         view: boolean (default: True)
             If True then graph will be displayed in default browser,
         view_nodes_info: boolean (default: False)
-            If True then average score, number of visits and variance of scores is displayed on every node.
+            If True then average score, number of visits and variance of scores is displayed on every node,
+        max_depth: int (default: None)
+            If other than None then only nodes with at most max_depth features are drawn,
+        top_k_paths: int (default: None)
+            If other than None then only top_k_paths most visited paths of the graph are drawn.
             
         Returns: None
         """
         
-        draw_tree(self._node_adder, file_name, view, view_nodes_info)
+        draw_tree(self._node_adder, file_name, view, view_nodes_info, max_depth, top_k_paths)
+    
+    def export_graph(self, file_name, file_format = 'graphml'):
+        """
+        Method for writing the graph of the search algorithm to a file, suitable for large graphs that can't be drawn.
+        
+        Parameters
+        ----------
+        file_name: str
+            Path of the file to which the graph will be written,
+        file_format: str (default: "graphml")
+            Format of the file, available values are "graphml", "jsonl" and "edgelist".
+            
+        Returns: None
+        """
+        
+        export_graph(self._node_adder, file_name, file_format)
     
     def save_stats_to_files(self, path):
         """
@@ -418,11 +1104,13 @@ class GSFS:
         self._global_scores.get_g_rave_dataframe().to_csv(path + '_g_rave.csv')
         self._global_scores.get_l_rave_dataframe().to_csv(path + '_l_rave.csv')
         
-    def get_best_model(self, data, labels, with_cv = None, model = None, preprocess = True):
+    def get_best_model(self, data, labels, with_cv = None, model = None, preprocess = True,
+                       n_jobs = None, strategy = 'full', patience = None, growth = 2):
         """
         Method for getting best model for selected dataset. Features are selected using greedy approach
         based on g-RAVE, model is trained on best feature, then on two best features, until all features
-        are used.
+        are used. Prefixes of the ranking can be scored in parallel and, depending on the strategy, 
+        only some of the prefix sizes are evaluated.
 
         Parameters
         ----------
@@ -437,41 +1125,280 @@ class GSFS:
             Model for which best features will be selected, if None then copy of the model from GSFS object is taken,
         preprocess: boolean (default: True)
             Information whether use the preprocessing of input data, meaning resetting index of data and labels
-            relabeling the labels to 0 and 1.
+            relabeling the labels to 0 and 1,
+        n_jobs: int (default: None)
+            Number of workers scoring the prefixes in parallel (-1 means all processors), 
+            if None then "n_jobs" parameter of GSFS object is taken,
+        strategy: str (default: "full")
+            Strategy of choosing the prefix sizes that will be scored, possible values are "full" (every prefix), 
+            "geometric" (prefix sizes growing by "growth" factor) and "bisection" (geometric probing followed by
+            bisection of the interval around the best prefix size),
+        patience: int (default: None)
+            If not None, then the sweep is stopped after "patience" evaluated prefixes in a row did not improve 
+            the best score,
+        growth: float (default: 2)
+            Growth factor of prefix sizes used by "geometric" and "bisection" strategies.
             
         Returns: dict
             Dictionary containing entries: "model" (model trained on best features), "scores" (data frame containing 
-            scores of all sets of features used in greedy search) and "best_features" (best features on which final model
+            scores of all sets of features evaluated in greedy search) and "best_features" (best features on which final model
             was trained).
         """
 
-        used_features = []
-        scores = []
-        features_str = []
-        best_score = 0
-        best_features = []
-
         if model is None:
             model = clone(self._model)
         
+        if with_cv is None:
+            with_cv = self._with_cv
+        
+        if n_jobs is None:
+            n_jobs = self._params['n_jobs']
+        
+        if strategy not in ['full', 'geometric', 'bisection']:
+            raise Exception('Strategy \"' + str(strategy) + '\" is not supported, available values are: full, geometric, bisection')
+        
+        if growth <= 1:
+            raise Exception('growth must be > 1')
+        
         if preprocess:
             data, labels = self._preprocess_input(data, labels)
         
-        for key in self.get_features_importances().keys():
-            used_features.append(key)
-            features_str.append(','.join(used_features))
-            score = self._get_score_for_features(data.loc[:,used_features],labels,with_cv,model)
-            
-            if best_score < score:
-                best_score = score
-                best_features = used_features.copy()
+        ranking = list(self.get_features_importances().keys())
+        scores = {}
+        
+        if strategy == 'full':
+            sizes = list(range(1, len(ranking) + 1))
+        else:
+            sizes = self._get_geometric_sizes(len(ranking), growth)
+        
+        batch_size = max(1, effective_n_jobs(n_jobs))
+        
+        with Parallel(n_jobs = n_jobs) as parallel:
+            for i in range(0, len(sizes), batch_size):
+                self._score_prefixes(parallel, sizes[i:i + batch_size], ranking, data, labels, with_cv, model, scores)
                 
-            scores.append(score)
+                if patience is not None and self._is_sweep_patience_over(scores, patience):
+                    break
+            
+            if strategy == 'bisection':
+                self._bisect_prefixes(parallel, ranking, data, labels, with_cv, model, scores)
+        
+        evaluated_sizes = sorted(scores.keys())
+        best_size = max(evaluated_sizes, key = lambda size: (scores[size], -size))
+        best_features = self._expand_features(ranking[:best_size])
+        best_score = scores[best_size]
             
         print('Found best model with score ' + str(best_score) + ', refitting')
         new_model = clone(model)
         new_model.fit(data.loc[:,best_features],labels)
         
         return {'model': new_model,
-               'scores': pd.DataFrame({'features': features_str, 'score': scores}),
-               'best_features': best_features}
\ No newline at end of file
+               'scores': pd.DataFrame({'features': [','.join(ranking[:size]) for size in evaluated_sizes], 
+                                       'n_features': evaluated_sizes,
+                                       'score': [scores[size] for size in evaluated_sizes]}),
+               'best_features': best_features}
+    
+    def score_subsets(self, data, labels, subsets, n_jobs = None, update = False, preprocess = True):
+        """
+        Method for scoring given sets of features (e.g. proposed by experts or other selectors) in the same way as
+        sets of features are scored during the search. Evaluations are run in threads sharing the data, the evaluator
+        (and its cache of splits and scores, evaluators serialize only accesses to their caches) and the evaluation store, 
+        if "evaluation_store" parameter is set. Evaluator created during fitting is reused if the dataset and scoring settings 
+        are the same as in fitting.
+        
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Dataset containing the features, if update is True then it must be the dataset used for fitting,
+        labels: pandas.Series
+            Labels of the dataset,
+        subsets: list
+            List of sets of features (lists or sets of names of the features, or of groups if feature groups were used in fitting),
+        n_jobs: int (default: None)
+            Number of threads running the evaluations (-1 means all processors), if None then "n_jobs" parameter is taken,
+        update: boolean (default: False)
+            Information whether the scores will be added to g-RAVE and l-RAVE scores and to the search graph (nodes 
+            that don't exist are added), so next fitting (refit) takes them into account, if any set has score higher than
+            the best score, then it becomes the best set and the model is refitted on it, it needs fitted object,
+        preprocess: boolean (default: True)
+            Information whether use the preprocessing of input data, meaning resetting index of data and labels
+            relabeling the labels to 0 and 1.
+            
+        Returns: pandas.DataFrame
+            Data frame with columns features (names of the features separated by commas), n_features, score, seconds 
+            (time of the evaluation) and source ("evaluation" or "store"), i-th row is a score of i-th set of features.
+        """
+        
+        if preprocess:
+            data, labels = self._preprocess_input(data, labels)
+        
+        subsets = [sorted(set(str(name) for name in subset)) for subset in subsets]
+        names = set(data.columns) if self._groups is None else set(self._groups.keys())
+        for features in subsets:
+            if len(features) == 0:
+                raise Exception('Sets of features must not be empty')
+            elif not set(features).issubset(names):
+                raise Exception('Features ' + ', '.join(sorted(set(features) - names)) + ' are not in the dataset')
+        
+        if update:
+            if self._feature_names is None:
+                raise Exception('GSFS object must be fitted to update its scores')
+            elif not all(set(features).issubset(self._feature_names) for features in subsets):
+                raise Exception('Sets of features must contain only features used in fitting')
+        
+        if n_jobs is None:
+            n_jobs = self._params['n_jobs']
+        
+        metric = BuildInMetrics().get_metric(self._metric_name, self._params['fast_metrics'])
+        columns = set(column for features in subsets for column in self._expand_features(features))
+        evaluator = self._get_subsets_evaluator(data, labels, columns, update, metric)
+        store = None
+        
+        if self._params['evaluation_store'] is not None:
+            self._evaluation_store = self._get_evaluation_store()
+            store = self._evaluation_store
+            store.set_context(EvaluationStore.get_context(data, labels, self._model, self._metric_name, self._with_cv, self._params))
+        
+        unique_subsets = list(dict.fromkeys(tuple(features) for features in subsets))
+        try:
+            unique_results = Parallel(n_jobs = n_jobs, prefer = 'threads')(
+                delayed(self._score_subset)(self._expand_features(features), data, labels, metric, evaluator, store) 
+                for features in unique_subsets)
+        finally:
+            # Evaluator of the fitting stays usable after closing, only its caches are released
+            if evaluator is not None:
+                evaluator.close()
+        
+        if update:
+            best_score = self._best_score
+            for features, (score, seconds, source) in zip(unique_subsets, unique_results):
+                self._add_subset_score(list(features), score, seconds if source == 'evaluation' else None)
+            
+            if self._best_score != best_score:
+                print('Found better set of features with score ' + str(self._best_score) + ', refitting')
+                self._model.fit(data.loc[:, self._best_features], labels)
+                self._predictor = Predictor(self._model, self._input_columns, self._best_features)
+        
+        results = dict(zip(unique_subsets, unique_results))
+        results = [results[tuple(features)] for features in subsets]
+        
+        return pd.DataFrame({'features': [','.join(features) for features in subsets],
+                             'n_features': [len(features) for features in subsets],
+                             'score': [result[0] for result in results],
+                             'seconds': [result[1] for result in results],
+                             'source': [result[2] for result in results]})
+    
+    def _get_evaluation_store(self):
+        # Store is created once per path, so its connections are reused by next fittings and score_subsets
+        path = self._params['evaluation_store']
+        if path is None:
+            return None
+        
+        if self._evaluation_store is None or self._evaluation_store.get_path() != path:
+            return EvaluationStore(path)
+        
+        return self._evaluation_store
+    
+    def _get_subsets_evaluator(self, data, labels, columns, update, metric):
+        if self._evaluator is None:
+            return self._create_evaluator(data, labels, metric)
+        elif update:
+            return self._evaluator
+        
+        # Evaluator of the fitting is reused only if it was created for the same dataset and scoring settings
+        if (columns.issubset(self._evaluator_columns) and set(self._evaluator_columns).issubset(data.columns) and
+            EvaluationStore.get_context(data.loc[:, self._evaluator_columns], labels, self._model, self._metric_name, 
+                                        self._with_cv, self._params) == self._evaluator_context):
+            return self._evaluator
+        
+        return self._create_evaluator(data, labels, metric)
+    
+    def _score_subset(self, features, data, labels, metric, evaluator, store):
+        if store is not None:
+            score = store.get_score(features)
+            if score is not None:
+                return score, 0, 'store'
+        
+        start_time = time.perf_counter()
+        
+        if evaluator is not None:
+            score = evaluator.score(features)
+        else:
+            score = GSFS._score_features(metric, self._metric_name, clone(self._model), data[features], labels, 
+                                         self._with_cv, self._params)
+        
+        seconds = time.perf_counter() - start_time
+        
+        if store is not None:
+            store.add_score(features, score)
+        
+        return score, seconds, 'evaluation'
+    
+    def _add_subset_score(self, features, score, seconds):
+        node = self._root
+        used_nodes = [node]
+        
+        for i in range(len(features)):
+            child = self._node_adder.get_node(features[:i + 1])
+            node = self._node_adder.add_node(node, features[i]) if child is None else child
+            used_nodes.append(node)
+        
+        self._update_nodes(used_nodes, score)
+        self._global_scores.update_score(node._features, score)
+        
+        if seconds is not None:
+            self._global_scores.update_cost(node._features, seconds)
+        
+        if score > self._best_score:
+            self._set_best_node(node, score)
+        
+        if self._longest_graph_branch < len(used_nodes):
+            self._longest_graph_branch = len(used_nodes)
+    
+    def _score_prefixes(self, parallel, sizes, ranking, data, labels, with_cv, model, scores):
+        sizes = [size for size in sizes if size not in scores]
+        results = parallel(delayed(GSFS._score_features)(self._metric, self._metric_name, clone(model), 
+                                                         data.loc[:, self._expand_features(ranking[:size])], labels, with_cv, 
+                                                         self._params) 
+                           for size in sizes)
+        
+        for size, score in zip(sizes, results):
+            scores[size] = score
+    
+    def _bisect_prefixes(self, parallel, ranking, data, labels, with_cv, model, scores):
+        while True:
+            evaluated_sizes = sorted(scores.keys())
+            best_size = max(evaluated_sizes, key = lambda size: (scores[size], -size))
+            best_index = evaluated_sizes.index(best_size)
+            lower = evaluated_sizes[best_index - 1] if best_index > 0 else 0
+            upper = evaluated_sizes[best_index + 1] if best_index + 1 < len(evaluated_sizes) else best_size
+            
+            candidates = [size for size in set([(lower + best_size)//2, (best_size + upper + 1)//2]) 
+                          if size > lower and size < upper and size != best_size]
+            
+            if len(candidates) == 0:
+                return
+            
+            self._score_prefixes(parallel, sorted(candidates), ranking, data, labels, with_cv, model, scores)
+    
+    @staticmethod
+    def _get_geometric_sizes(features_count, growth):
+        sizes = []
+        size = 1
+        while size < features_count:
+            sizes.append(size)
+            size = max(size + 1, int(math.ceil(size * growth)))
+        sizes.append(features_count)
+        return sizes
+    
+    @staticmethod
+    def _is_sweep_patience_over(scores, patience):
+        best_score = None
+        not_improved = 0
+        for size in sorted(scores.keys()):
+            if best_score is None or scores[size] > best_score:
+                best_score = scores[size]
+                not_improved = 0
+            else:
+                not_improved += 1
+        return not_improved >= patience
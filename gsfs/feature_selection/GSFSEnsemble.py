@@ -0,0 +1,248 @@
+from gsfs.feature_selection.GSFS import *
+from gsfs.feature_selection.GlobalScores import *
+from gsfs.feature_selection.DefaultSettings import *
+from gsfs.feature_selection.BuildInMetrics import *
+from gsfs.feature_selection.Preprocessing import *
+from gsfs.feature_selection.Predictor import *
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+from joblib import Parallel, delayed
+import numpy as np
+import pandas as pd
+
+class GSFSEnsemble:
+    """
+    Class representing ensemble of independent GSFS searches (root parallelization). Every search is run in a separate process
+    with a different random state (used for train-test and cross-validation splits) and optionally on a different subsample
+    of the dataset. When all searches are done, their g-RAVE, l-RAVE scores and costs are merged into one GlobalScores object,
+    best sets of features of all searches are scored on the whole dataset and the best of them is selected.
+    """
+
+    def __init__(self, model, calculations_budget, n_searches = 4, n_jobs = -1, subsample = 1.0, random_state = None,
+                 params = None, metric = 'roc_auc', with_cv = False, **gsfs_kwargs):
+        """
+        Parameters
+        ----------
+        model: sklearn model
+            Model that implements fit, predict, predict_proba methods, used during feature selection,
+        calculations_budget: int|dict
+            Budget for calculations of every search (see GSFS),
+        n_searches: int (default: 4)
+            Number of independent searches,
+        n_jobs: int (default: -1)
+            Number of processes running the searches, -1 means using all processors,
+        subsample: float (default: 1.0)
+            Fraction of rows of the dataset (drawn without replacement, stratified) used by every search,
+            if 1.0 then searches differ only by random state,
+        random_state: int (default: None)
+            Random state of the first search, i-th search uses random_state + i, if None then "random_state" parameter is used,
+        params: dict (default: None)
+            Overrides of default parameters of the algorithm (see GSFS),
+        metric: str (default: "roc_auc")
+            Name of the metric that will be used for scoring the model's predictions,
+        with_cv: boolean (default: False)
+            Information whether use cross-validation during calculating model's score,
+        gsfs_kwargs:
+            Other arguments passed to constructors of GSFS objects (e.g. calculations_done_condition, multiarm_strategy, evaluator).
+        """
+
+        if n_searches <= 0:
+            raise Exception('n_searches must be > 0')
+        if subsample <= 0 or subsample > 1:
+            raise Exception('subsample must be in (0, 1]')
+
+        self._model = clone(model)
+        self._calculations_budget = calculations_budget
+        self._n_searches = n_searches
+        self._n_jobs = n_jobs
+        self._subsample = subsample
+        self._params = DefaultSettings.get_default_params() if params is None else DefaultSettings.merge_params(params)
+        self._random_state = self._params['random_state'] if random_state is None else random_state
+        self._metric_name = metric
+        self._with_cv = with_cv
+        self._gsfs_kwargs = gsfs_kwargs
+        self._global_scores = None
+        self._searches_results = []
+        self._best_features = None
+        self._best_score = None
+        self._predictor = None
+
+    def fit(self, data, out_variable, pos_class = 'numeric', **fit_kwargs):
+        """
+        Method for running all searches and merging their results.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Dataset that will be used for fitting, containing all features except the output variable,
+        out_variable: pandas.Series
+            Series containing output variable of the dataset,
+        pos_class: str (default: 'numeric')
+            Value indicating the positive class (see GSFS.fit),
+        fit_kwargs:
+            Other arguments passed to GSFS.fit (e.g. warm_start, screening).
+
+        Returns: None
+        """
+
+        data = data.reset_index(drop = True)
+        data.columns = [str(col) for col in data.columns]
+        out_variable = Preprocessing.relabel_data(out_variable.reset_index(drop = True), 1 if pos_class == 'numeric' else pos_class)
+
+        self._searches_results = Parallel(n_jobs = self._n_jobs)(
+            delayed(GSFSEnsemble._fit_search)(self._model, self._calculations_budget, self._get_search_params(i),
+                                              self._metric_name, self._with_cv, self._gsfs_kwargs,
+                                              *self._get_search_data(data, out_variable, i), fit_kwargs)
+            for i in range(self._n_searches))
+
+        self._global_scores = GlobalScores()
+        for result in self._searches_results:
+            self._global_scores.merge(result['global_scores'])
+
+        self._select_best_features(data, out_variable)
+        self._model.fit(data.loc[:, self._best_features], out_variable)
+        self._predictor = Predictor(self._model, data.columns, self._best_features)
+
+    def _get_search_params(self, i):
+        params = dict(self._params)
+        params['random_state'] = self._random_state + i
+        return params
+
+    def _get_search_data(self, data, out_variable, i):
+        if self._subsample == 1:
+            return data, out_variable
+
+        rows, _ = train_test_split(np.arange(len(data)), train_size = self._subsample,
+                                   stratify = out_variable, random_state = self._random_state + i)
+        return data.iloc[rows], out_variable.iloc[rows]
+
+    @staticmethod
+    def _fit_search(model, calculations_budget, params, metric_name, with_cv, gsfs_kwargs, data, out_variable, fit_kwargs):
+        gsfs = GSFS(model, calculations_budget, params = params, metric = metric_name, with_cv = with_cv, **gsfs_kwargs)
+        gsfs.fit(data, out_variable, **fit_kwargs)
+
+        return {'random_state': params['random_state'],
+                'best_features': gsfs.get_best_features(),
+                'best_score': gsfs.get_best_score(),
+                'iterations': gsfs._iterations - 1,
+                'global_scores': gsfs._global_scores,
+                'evaluation_stats': gsfs.get_evaluation_stats(),
+                'timings': gsfs.get_timings()}
+
+    def _select_best_features(self, data, out_variable):
+        # Scores of searches come from different splits (and subsamples), so candidates are compared on the same split
+        candidates = []
+        for result in self._searches_results:
+            # Search without any score better than 0 (e.g. stopped by time budget early) has no best features
+            if result['best_features'] is None:
+                continue
+
+            features = sorted(result['best_features'])
+            if features not in candidates:
+                candidates.append(features)
+
+        if len(candidates) == 0:
+            raise Exception('None of the searches found a set of features, increase calculations_budget')
+
+        metric = BuildInMetrics().get_metric(self._metric_name, self._params['fast_metrics'])
+        scores = Parallel(n_jobs = self._n_jobs)(
+            delayed(GSFS._score_features)(metric, self._metric_name, clone(self._model), data.loc[:, features],
+                                          out_variable, self._with_cv, self._params)
+            for features in candidates)
+
+        best = int(np.argmax(scores))
+        self._best_features = candidates[best]
+        self._best_score = scores[best]
+
+    def get_best_features(self):
+        """
+        Method for getting best set of features among best sets of all searches.
+
+        Returns: list
+            List of features.
+        """
+
+        return self._best_features
+
+    def get_best_score(self):
+        """
+        Method for getting score of the best set of features on the whole dataset.
+
+        Returns: float
+            Score of the best set of features.
+        """
+
+        return self._best_score
+
+    def get_features_importances(self):
+        """
+        Method for getting importances (g-RAVE merged from all searches) of all features.
+
+        Returns: dict
+            Dictionary containing pairs of features and importances.
+        """
+
+        importances = dict([k, self._global_scores.get_g_rave_score(k)] for k in self._global_scores.scores['g_rave'].keys())
+        return dict(sorted(importances.items(), key = lambda item: item[1], reverse = True))
+
+    def get_global_scores(self):
+        """
+        Method for getting GlobalScores object with merged scores of all searches.
+
+        Returns: gsfs.feature_selection.GlobalScores
+            Merged scores.
+        """
+
+        return self._global_scores
+
+    def get_searches_results(self):
+        """
+        Method for getting results of every search.
+
+        Returns: pandas.DataFrame
+            DataFrame with columns random_state, best_features, best_score and iterations.
+        """
+
+        return pd.DataFrame([{'random_state': result['random_state'], 'best_features': result['best_features'],
+                              'best_score': result['best_score'], 'iterations': result['iterations']}
+                             for result in self._searches_results])
+
+    def predict(self, data):
+        """
+        Method for predicting classes for input data using the model trained on the best features.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which the classes will be returned, numpy array must have the same columns as the dataset used for fitting.
+
+        Returns: list
+            List with predictions (1 - positive, 0 - negative class).
+        """
+
+        return self._predictor.predict(data)
+
+    def predict_proba(self, data):
+        """
+        Method for getting probabilities of classes for input data using the model trained on the best features.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which probabilites will be returned, numpy array must have the same columns as the dataset used for fitting.
+
+        Returns: 2-dimensional list
+            List, where first column represents probabilities of 0 (negative) class and second probabilities of 1 (positive) class.
+        """
+
+        return self._predictor.predict_proba(data)
+
+    def get_predictor(self):
+        """
+        Method for getting inference path of the model trained on the best features (see gsfs.feature_selection.Predictor).
+
+        Returns: gsfs.feature_selection.Predictor
+            Predictor object.
+        """
+
+        return self._predictor
@@ -1,12 +1,25 @@
 from gsfs.feature_selection.LRavePaths import *
+from gsfs.feature_selection.CostModel import *
 import pandas as pd
 
 class GlobalScores:
     """Class containing methods for getting and updating l-RAVE and g-RAVE."""
     
-    def __init__(self):
+    def __init__(self, max_updates_log = 10000, l_rave = None):
+        """
+        max_updates_log: int (default: 10000)
+            Number of most recent updates for which the updated features are remembered (used by get_updated_features),
+        l_rave: gsfs.feature_selection.LRavePaths|gsfs.feature_selection.ApproximateLRavePaths (default: None)
+            Object keeping l-RAVE scores, if None then exact LRavePaths is used.
+        """
+        
         self.scores = {'g_rave': {},
-                       'l_rave': LRavePaths()}            
+                       'l_rave': LRavePaths() if l_rave is None else l_rave}            
+        self.costs = CostModel()
+        self._updates_log = []
+        self._updates_log_offset = 0
+        self._max_updates_log = max_updates_log
+        self._l_rave_tail_version = self.scores['l_rave'].get_tail_version()
     
     def update_score(self, used_features, score):
         """
@@ -24,6 +37,7 @@ class GlobalScores:
 
         self._update_l_rave_score(used_features, score)
         self._update_g_rave_score(used_features, score)
+        self._log_update(used_features)
     
     def _update_l_rave_score(self, used_features, score):       
         self.scores['l_rave'].add_path_score(used_features, score)
@@ -36,6 +50,199 @@ class GlobalScores:
                 self.scores['g_rave'][name]['score'] += score
                 self.scores['g_rave'][name]['n'] += 1
     
+    def add_prior_scores(self, scores, n = 1, l_rave_n = 0):
+        """
+        Method for adding prior g-RAVE (and optionally l-RAVE) scores for many features at once, every prior counts as "n" iterations
+        with selected score.
+
+        Parameters
+        ----------
+        scores: dict
+            Dictionary containing pairs of feature names and prior scores,
+        n: float (default: 1)
+            Pseudo-count of every prior g-RAVE score,
+        l_rave_n: float (default: 0)
+            Pseudo-count of every prior l-RAVE score of single feature sets, if 0 then l-RAVE is not updated.
+
+        Returns: None
+        """
+        
+        if l_rave_n > 0:
+            self.scores['l_rave'].add_paths_scores([(set([name]), score) for name, score in scores.items()], l_rave_n)
+
+        self._log_update(list(scores.keys()))
+        
+        g_rave = self.scores['g_rave']
+        for name, score in scores.items():
+            if name not in g_rave:
+                g_rave[name] = {'n': n, 'score': score * n}
+            else:
+                g_rave[name]['score'] += score * n
+                g_rave[name]['n'] += n
+    
+    def merge(self, other):
+        """
+        Method for adding all g-RAVE and l-RAVE scores (sums and counts) and measured costs of other GlobalScores object,
+        e.g. from independent search on the same features.
+
+        Parameters
+        ----------
+        other: gsfs.feature_selection.GlobalScores
+            Object which scores will be added.
+
+        Returns: None
+        """
+        
+        self.scores['l_rave'].merge(other.scores['l_rave'])
+        self.costs.merge(other.costs)
+        self._log_update(list(other.scores['g_rave'].keys()))
+        
+        g_rave = self.scores['g_rave']
+        for name, score_info in other.scores['g_rave'].items():
+            if name not in g_rave:
+                g_rave[name] = dict(score_info)
+            else:
+                g_rave[name]['score'] += score_info['score']
+                g_rave[name]['n'] += score_info['n']
+    
+    def add_decayed_scores(self, other, decay = 1, max_n = None, features = None):
+        """
+        Method for adding g-RAVE and l-RAVE scores of other GlobalScores object (e.g. from previous run) as priors,
+        counts of the scores are multiplied by decay and capped, so their averages stay the same, but their weight is lower.
+
+        Parameters
+        ----------
+        other: gsfs.feature_selection.GlobalScores
+            Object which scores will be added,
+        decay: float (default: 1)
+            Multiplier of counts,
+        max_n: float (default: None)
+            Maximal count of every score after decay, if None then counts are not capped,
+        features: set (default: None)
+            If not None, then only scores of these features (and l-RAVE paths which are their subsets) are added.
+
+        Returns: None
+        """
+        
+        decayed = GlobalScores()
+        decayed.scores['l_rave'] = other.scores['l_rave'].get_decayed(decay, max_n, features)
+        
+        for name, score_info in other.scores['g_rave'].items():
+            if features is None or name in features:
+                n = score_info['n'] * decay if max_n is None else min(score_info['n'] * decay, max_n)
+                decayed.scores['g_rave'][name] = {'n': n, 'score': score_info['score']/score_info['n'] * n}
+        
+        self.merge(decayed)
+    
+    @staticmethod
+    def read_files(path):
+        """
+        Method for reading g-RAVE and l-RAVE scores saved by GSFS.save_stats_to_files.
+
+        Parameters
+        ----------
+        path: str
+            Path passed to save_stats_to_files (without "_g_rave.csv" and "_l_rave.csv" suffixes).
+
+        Returns: gsfs.feature_selection.GlobalScores
+            Object with read scores.
+        """
+        
+        global_scores = GlobalScores()
+        g_rave = pd.read_csv(path + '_g_rave.csv', dtype = {'feature': str}, keep_default_na = False)
+        l_rave = pd.read_csv(path + '_l_rave.csv', dtype = {'features': str}, keep_default_na = False)
+        
+        for name, n, scores in zip(g_rave['feature'], g_rave['n'], g_rave['scores']):
+            global_scores.scores['g_rave'][name] = {'n': n, 'score': scores}
+        
+        global_scores.scores['l_rave'] = LRavePaths.from_scores_dataframe(l_rave)
+        
+        return global_scores
+    
+    def get_version(self):
+        """
+        Method for getting version of the scores, the version is incremented on every update.
+        
+        Returns: int
+            Current version.
+        """
+        
+        return self._updates_log_offset + len(self._updates_log)
+    
+    def get_updated_features(self, version):
+        """
+        Method for getting features which g-RAVE or l-RAVE scores (of any set containing the feature) 
+        changed since selected version.
+        
+        Parameters
+        ----------
+        version: int
+            Version returned by get_version.
+            
+        Returns: set
+            Set of updated features or None if the updates are older than remembered ones (or all scores were invalidated,
+            e.g. by evictions in approximate l-RAVE).
+        """
+        
+        if version < self._updates_log_offset:
+            return None
+        
+        updated_features = set()
+        for used_features in self._updates_log[version - self._updates_log_offset:]:
+            updated_features.update(used_features)
+            
+        return updated_features
+    
+    def update_cost(self, used_features, seconds):
+        """
+        Method for adding measured evaluation time of used_features to the cost model. The update isn't logged
+        (see get_updated_features), so it must be followed by update_score with the same features.
+
+        Parameters
+        ----------
+        used_features: set
+            Set of evaluated features,
+        seconds: float
+            Time of the evaluation in seconds.
+
+        Returns: None
+        """
+        
+        self.costs.update_cost(used_features, seconds)
+    
+    def get_feature_cost(self, name):
+        """
+        Method for getting predicted cost (in seconds) of adding selected feature to a set of features.
+
+        Parameters
+        ----------
+        name: str
+            Name of the feature.
+
+        Returns: float
+            Predicted cost in seconds.
+        """
+        
+        return self.costs.get_feature_cost(name)
+    
+    def _log_update(self, used_features):
+        tail_version = self.scores['l_rave'].get_tail_version()
+        
+        if tail_version != self._l_rave_tail_version:
+            # Moving sets of features to the tail of approximate l-RAVE changes estimates of sets of any features,
+            # so all previous versions are invalidated (get_updated_features returns None for them)
+            self._l_rave_tail_version = tail_version
+            self._updates_log_offset += len(self._updates_log) + 1
+            self._updates_log = []
+            return
+        
+        self._updates_log.append(used_features)
+        
+        if len(self._updates_log) > 2 * self._max_updates_log:
+            removed = len(self._updates_log) - self._max_updates_log
+            self._updates_log = self._updates_log[removed:]
+            self._updates_log_offset += removed
+    
     def get_l_rave_score(self, used_features):
         """
         Method for getting l-RAVE score for selected features.
@@ -136,4 +343,14 @@ class GlobalScores:
             'n': n,
             'scores': scores,
             'score':[x/y for x, y in zip(scores, n)]
-        })
\ No newline at end of file
+        })
+        
+    def get_cost_dataframe(self):
+        """
+        Method for getting predicted evaluation costs of all features in form of DataFrame, with columns feature, n and cost.
+
+        Returns: pandas.DataFrame
+            DataFrame with costs of features.
+        """
+
+        return self.costs.get_dataframe()
\ No newline at end of file
@@ -0,0 +1,199 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from scipy.linalg import cholesky, solve_triangular, LinAlgError
+from sklearn.linear_model import Ridge, RidgeClassifier, LinearRegression
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+from gsfs.feature_selection.CV import *
+from gsfs.feature_selection.TrainTestScore import *
+from gsfs.feature_selection.BuildInMetrics import *
+
+class GramEvaluator:
+    """
+    Class for scoring sets of features for linear models (Ridge, RidgeClassifier, LinearRegression and
+    LinearDiscriminantAnalysis) without refitting the model. Gram matrix (or within-class covariance for LDA) is
+    computed once for every train split, model for a set of features is solved on its submatrix using Cholesky factor,
+    which for a set created by adding one feature to already scored set is obtained by extending the factor of that set.
+    Scoring can be run from many threads, only accesses to the cache are serialized.
+    """
+
+    def __init__(self, model, metric, metric_name, data, labels, with_cv, params):
+        """
+        Parameters
+        ----------
+        model: sklearn model
+            One of the supported linear models,
+        metric: sklearn metric from BuildInMetrics
+            Metric used for scoring,
+        metric_name: str
+            Name of used metric,
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset (0 - negative class, 1 - positive class),
+        with_cv: boolean
+            Information whether use cross-validation splits, if not then train-test split is used,
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        if not GramEvaluator.is_supported(model):
+            raise Exception('Gram evaluator supports only Ridge, RidgeClassifier, LinearRegression and LinearDiscriminantAnalysis models')
+
+        self._metric = metric
+        self._metric_name = metric_name
+        self._is_lda = isinstance(model, LinearDiscriminantAnalysis)
+        self._alpha = getattr(model, 'alpha', 0)
+        self._columns = dict([name, i] for i, name in enumerate(data.columns))
+        self._cache = OrderedDict()
+        self._cache_size = params['evaluator_cache_size']
+        self._lock = threading.Lock()
+
+        X = np.asarray(data, dtype = np.float64)
+        y = np.asarray(labels).astype(int)
+
+        if with_cv:
+            splits = CV.get_splits(data, labels, params['cv'], params['random_state'])
+        else:
+            splits = [TrainTestScore.get_split(labels, params['test_size'], params['random_state'])]
+
+        self._splits = [self._prepare_split(X[train], y[train], X[test], y[test]) for train, test in splits]
+
+    @staticmethod
+    def is_supported(model):
+        """
+        Method for checking whether the model can be scored with GramEvaluator.
+
+        Parameters
+        ----------
+        model: sklearn model
+            Checked model.
+
+        Returns: boolean
+            True if the model is supported.
+        """
+
+        if isinstance(model, LinearDiscriminantAnalysis):
+            return model.shrinkage is None and model.priors is None
+        return type(model) in [Ridge, RidgeClassifier, LinearRegression] and model.get_params().get('fit_intercept', True)
+
+    def score(self, features):
+        """
+        Method for getting score of the model trained on selected features.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features.
+
+        Returns: float
+            Score of the model, averaged over splits if cross-validation is used.
+        """
+
+        key = frozenset(features)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]['score']
+
+            parents = [(name, self._cache[key - set([name])]) for name in key if key - set([name]) in self._cache]
+
+        order, factors = self._get_factors(key, parents)
+        score = 0
+        for split, factor in zip(self._splits, factors):
+            w = solve_triangular(factor, solve_triangular(factor, split['r'][order], lower = True), lower = True, trans = 'T')
+            decision = split['X_test'][:, order].dot(w) + split['b_offset'] - split['center'][order].dot(w)
+
+            if self._metric_name in ['acc', 'f1']:
+                score += self._metric(split['y_test'], (decision > 0).astype(int))
+            else:
+                score += self._metric(split['y_test'], decision)
+
+        score /= len(self._splits)
+
+        with self._lock:
+            self._cache[key] = {'order': order, 'factors': factors, 'score': score}
+
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last = False)
+
+        return score
+
+    def close(self):
+        """
+        Method for releasing cached Cholesky factors of the evaluator, the evaluator can still be used afterwards.
+
+        Returns: None
+        """
+
+        with self._lock:
+            self._cache.clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_factors(self, key, parents):
+        # Cached entries are never modified, so factors of parents are extended outside of the lock
+        for name, parent in parents:
+            j = self._columns[name]
+            factors = [self._extend_factor(split['A'], parent['order'], factor, j) for split, factor in zip(self._splits, parent['factors'])]
+
+            if all(factor is not None for factor in factors):
+                return parent['order'] + [j], factors
+
+        order = sorted(self._columns[name] for name in key)
+        return order, [self._factorize(split['A'][np.ix_(order, order)]) for split in self._splits]
+
+    @staticmethod
+    def _extend_factor(A, order, factor, j):
+        l = solve_triangular(factor, A[order, j], lower = True) if len(order) > 0 else np.zeros(0)
+        d = A[j, j] - l.dot(l)
+
+        if d <= 1e-12 * max(A[j, j], 1):
+            return None
+
+        new_factor = np.zeros((len(order) + 1, len(order) + 1))
+        new_factor[:-1, :-1] = factor
+        new_factor[-1, :-1] = l
+        new_factor[-1, -1] = np.sqrt(d)
+        return new_factor
+
+    @staticmethod
+    def _factorize(A):
+        try:
+            return cholesky(A, lower = True)
+        except LinAlgError:
+            # Singular submatrix (e.g. duplicated or constant columns), small jitter makes it positive definite
+            jitter = 1e-8 * max(np.trace(A)/max(len(A), 1), 1)
+            return cholesky(A + jitter * np.eye(len(A)), lower = True)
+
+    def _prepare_split(self, X_train, y_train, X_test, y_test):
+        if self._is_lda:
+            positive = y_train == 1
+            mean_0 = X_train[~positive].mean(axis = 0)
+            mean_1 = X_train[positive].mean(axis = 0)
+            prior_1 = positive.mean()
+            X_centered = X_train.copy()
+            X_centered[positive] -= mean_1
+            X_centered[~positive] -= mean_0
+            A = X_centered.T.dot(X_centered)/(len(X_train) - 2)
+            r = mean_1 - mean_0
+            center = (mean_0 + mean_1)/2
+            b_offset = np.log(prior_1/(1 - prior_1))
+        else:
+            target = 2.0 * y_train - 1
+            center = X_train.mean(axis = 0)
+            X_centered = X_train - center
+            A = X_centered.T.dot(X_centered) + self._alpha * np.eye(X_train.shape[1])
+            r = X_centered.T.dot(target - target.mean())
+            b_offset = target.mean()
+
+        return {'A': A, 'r': r, 'center': center, 'b_offset': b_offset, 'X_test': X_test, 
+                'y_test': BuildInMetrics.prepare_labels(self._metric, y_test)}
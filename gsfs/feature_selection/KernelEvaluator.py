@@ -0,0 +1,257 @@
+import os
+import shutil
+import weakref
+import tempfile
+import threading
+import numpy as np
+from collections import OrderedDict
+from sklearn.base import clone
+from sklearn.svm import SVC
+from gsfs.feature_selection.CV import *
+from gsfs.feature_selection.TrainTestScore import *
+from gsfs.feature_selection.BuildInMetrics import *
+
+class KernelEvaluator:
+    """
+    Class for scoring sets of features for SVC with RBF kernel using precomputed kernels. Squared euclidean distance
+    over a set of features is a sum of squared distances over single features, so per-feature distance matrices are
+    computed once for every split (kept in memory or in memory-mapped files, in a temporary directory of the evaluator
+    created with the first matrix and removed by close or with the evaluator) and distances for a set of features are obtained from the cached distances of its parent set 
+    plus the matrix of the added feature. All matrices are kept in float32, cache of distances of sets of features is bounded
+    by number of sets and by size in megabytes. Scoring can be run from many threads, only accesses to the caches are serialized.
+    """
+
+    def __init__(self, model, metric, metric_name, data, labels, with_cv, params):
+        """
+        Parameters
+        ----------
+        model: sklearn.svm.SVC
+            SVC model with RBF kernel,
+        metric: sklearn metric from BuildInMetrics
+            Metric used for scoring,
+        metric_name: str
+            Name of used metric,
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset,
+        with_cv: boolean
+            Information whether use cross-validation splits, if not then train-test split is used,
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        if not KernelEvaluator.is_supported(model):
+            raise Exception('Kernel evaluator supports only SVC model with rbf kernel')
+
+        self._model = clone(model).set_params(kernel = 'precomputed')
+        self._gamma = model.gamma
+        self._metric = metric
+        self._metric_name = metric_name
+        self._columns = dict([name, i] for i, name in enumerate(data.columns))
+        self._memmap_root = params['kernel_memmap_dir']
+        self._memmap_dir = None
+        self._finalizer = None
+        self._cache = OrderedDict()
+        self._cache_size = params['kernel_cache_size']
+        self._cache_max_bytes = params['kernel_cache_mb'] * 1024 * 1024
+        self._cache_bytes = 0
+        self._scores = {}
+        self._feature_distances = {}
+        self._lock = threading.Lock()
+        self._distances_lock = threading.Lock()
+
+        X = np.asarray(data, dtype = np.float64)
+        y = np.asarray(labels)
+
+        if with_cv:
+            splits = CV.get_splits(data, labels, params['cv'], params['random_state'])
+        else:
+            splits = [TrainTestScore.get_split(labels, params['test_size'], params['random_state'])]
+
+        self._splits = [{'X_train': X[train], 'X_test': X[test], 'y_train': y[train], 'y_test': BuildInMetrics.prepare_labels(metric, y[test]),
+                         'sums': X[train].sum(axis = 0), 'squares_sums': (X[train]**2).sum(axis = 0)} for train, test in splits]
+
+        if self._memmap_root is not None and not os.path.exists(self._memmap_root):
+            os.makedirs(self._memmap_root, exist_ok = True)
+
+    @staticmethod
+    def is_supported(model):
+        """
+        Method for checking whether the model can be scored with KernelEvaluator.
+
+        Parameters
+        ----------
+        model: sklearn model
+            Checked model.
+
+        Returns: boolean
+            True if the model is supported.
+        """
+
+        return isinstance(model, SVC) and model.kernel == 'rbf'
+
+    def score(self, features):
+        """
+        Method for getting score of the model trained on selected features.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features.
+
+        Returns: float
+            Score of the model, averaged over splits if cross-validation is used.
+        """
+
+        key = frozenset(features)
+
+        with self._lock:
+            if key in self._scores:
+                return self._scores[key]
+
+            parent = None
+            for name in key:
+                if key - set([name]) in self._cache:
+                    self._cache.move_to_end(key - set([name]))
+                    parent = (name, self._cache[key - set([name])])
+                    break
+
+        distances = self._get_distances(key, parent)
+        score = 0
+        for i, split in enumerate(self._splits):
+            gamma = self._get_gamma(split, key)
+            model = clone(self._model)
+            model.fit(np.exp(-gamma * distances[i][0]), split['y_train'])
+            test_kernel = np.exp(-gamma * distances[i][1])
+
+            if self._metric_name in ['acc','f1']:
+                predicted = model.predict(test_kernel)
+            elif model.probability:
+                predicted = model.predict_proba(test_kernel)[:,1]
+            else:
+                predicted = model.decision_function(test_kernel)
+
+            score += self._metric(split['y_test'], predicted)
+
+        score /= len(self._splits)
+
+        with self._lock:
+            self._scores[key] = score
+
+            if key not in self._cache:
+                self._cache[key] = distances
+                self._cache_bytes += KernelEvaluator._get_bytes(distances)
+
+            while len(self._cache) > self._cache_size or (self._cache_bytes > self._cache_max_bytes and len(self._cache) > 0):
+                self._cache_bytes -= KernelEvaluator._get_bytes(self._cache.popitem(last = False)[1])
+
+        return score
+
+    def close(self):
+        """
+        Method for releasing cached matrices and removing memory-mapped files of the evaluator, the evaluator can still
+        be used afterwards (matrices are computed again when needed).
+
+        Returns: None
+        """
+
+        with self._lock, self._distances_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._feature_distances = {}
+
+            if self._finalizer is not None:
+                self._finalizer()
+
+            self._memmap_dir = None
+            self._finalizer = None
+
+    @staticmethod
+    def _get_bytes(distances):
+        return sum(train.nbytes + test.nbytes for train, test in distances)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_distances_lock'] = None
+        # Copy doesn't own the directory of memory-mapped files
+        state['_finalizer'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._distances_lock = threading.Lock()
+
+    def _get_distances(self, key, parent):
+        # Cached matrices are never modified, so distances of the parent are extended outside of the lock
+        if parent is not None:
+            name, parent_distances = parent
+            distances = []
+            for i, (train, test) in enumerate(parent_distances):
+                feature_train, feature_test = self._get_feature_distances(name, i)
+                distances.append((train + feature_train, test + feature_test))
+            return distances
+
+        distances = []
+        for i, split in enumerate(self._splits):
+            train = np.zeros((len(split['X_train']), len(split['X_train'])), dtype = np.float32)
+            test = np.zeros((len(split['X_test']), len(split['X_train'])), dtype = np.float32)
+
+            for name in key:
+                feature_train, feature_test = self._get_feature_distances(name, i)
+                train += feature_train
+                test += feature_test
+
+            distances.append((train, test))
+
+        return distances
+
+    def _get_feature_distances(self, name, split_index):
+        distances = self._feature_distances.get((name, split_index))
+        if distances is not None:
+            return distances
+
+        with self._distances_lock:
+            if (name, split_index) not in self._feature_distances:
+                self._add_feature_distances(name, split_index)
+
+        return self._feature_distances[(name, split_index)]
+
+    def _add_feature_distances(self, name, split_index):
+        split = self._splits[split_index]
+        j = self._columns[name]
+        train = (split['X_train'][:, j][:, None] - split['X_train'][:, j][None, :])**2
+        test = (split['X_test'][:, j][:, None] - split['X_train'][:, j][None, :])**2
+
+        self._feature_distances[(name, split_index)] = (self._store(train, split_index, j, 'train'),
+                                                        self._store(test, split_index, j, 'test'))
+
+    def _store(self, matrix, split_index, j, part):
+        if self._memmap_root is None:
+            return matrix.astype(np.float32)
+
+        if self._memmap_dir is None:
+            # Every evaluator has its own directory, so evaluators sharing kernel_memmap_dir don't overwrite their files
+            self._memmap_dir = tempfile.mkdtemp(prefix = 'kernels_', dir = self._memmap_root)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._memmap_dir, True)
+
+        stored = np.memmap(os.path.join(self._memmap_dir, str(split_index) + '_' + str(j) + '_' + part + '.dat'),
+                           dtype = np.float32, mode = 'w+', shape = matrix.shape)
+        stored[:] = matrix
+        stored.flush()
+        return stored
+
+    def _get_gamma(self, split, key):
+        indexes = [self._columns[name] for name in key]
+
+        if self._gamma == 'auto':
+            return 1.0/len(indexes)
+        elif self._gamma == 'scale':
+            count = len(split['X_train']) * len(indexes)
+            mean = split['sums'][indexes].sum()/count
+            variance = split['squares_sums'][indexes].sum()/count - mean**2
+            return 1.0/(len(indexes) * variance) if variance > 0 else 1.0
+
+        return self._gamma
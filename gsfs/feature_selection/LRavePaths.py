@@ -31,6 +31,122 @@ class LRavePaths:
             self._n_vals[ind] += 1
             self._scores[ind] += score
     
+    def add_paths_scores(self, paths_scores, n = 1):
+        """
+        Method for adding l-RAVE scores for many sets of features at once, every score counts as "n" iterations.
+
+        Parameters
+        ----------
+        paths_scores: list
+            List of pairs (set of features, score),
+        n: float (default: 1)
+            Pseudo-count of every added score.
+        """
+        
+        indexes = dict([frozenset(path), i] for i, path in enumerate(self._paths))
+        
+        for used_features, score in paths_scores:
+            key = frozenset(used_features)
+            
+            if key not in indexes:
+                indexes[key] = len(self._paths)
+                self._paths.append(set(used_features))
+                self._n_vals.append(n)
+                self._scores.append(score * n)
+            else:
+                ind = indexes[key]
+                self._n_vals[ind] += n
+                self._scores[ind] += score * n
+    
+    def merge(self, other):
+        """
+        Method for adding all l-RAVE scores (sums and counts) of other LRavePaths object.
+
+        Parameters
+        ----------
+        other: gsfs.feature_selection.LRavePaths
+            Object which scores will be added.
+        """
+        
+        self.merge_lists(other._paths, other._n_vals, other._scores)
+    
+    def merge_lists(self, paths, n_vals, scores):
+        """
+        Method for adding l-RAVE scores given as sums and counts.
+
+        Parameters
+        ----------
+        paths: list
+            List of sets of features,
+        n_vals: list
+            Counts of scores of every set,
+        scores: list
+            Sums of scores of every set.
+        """
+        
+        indexes = dict([frozenset(path), i] for i, path in enumerate(self._paths))
+        
+        for path, n, score in zip(paths, n_vals, scores):
+            key = frozenset(path)
+            
+            if key not in indexes:
+                indexes[key] = len(self._paths)
+                self._paths.append(set(path))
+                self._n_vals.append(n)
+                self._scores.append(score)
+            else:
+                ind = indexes[key]
+                self._n_vals[ind] += n
+                self._scores[ind] += score
+    
+    @staticmethod
+    def from_scores_dataframe(scores):
+        """
+        Method for creating LRavePaths object from DataFrame returned by get_scores_dataframe.
+
+        Parameters
+        ----------
+        scores: pandas.DataFrame
+            Data frame with columns features (names of features separated by commas), n and scores.
+
+        Returns: gsfs.feature_selection.LRavePaths
+            Object with l-RAVE scores from the data frame.
+        """
+        
+        paths = LRavePaths()
+        paths.merge_lists([set(features.split(',')) for features in scores['features']], list(scores['n']), list(scores['scores']))
+        return paths
+    
+    def get_decayed(self, decay, max_n = None, features = None):
+        """
+        Method for getting copy of l-RAVE scores with counts multiplied by decay (and capped), average scores stay the same.
+
+        Parameters
+        ----------
+        decay: float
+            Multiplier of counts,
+        max_n: float (default: None)
+            Maximal count after decay, if None then counts are not capped,
+        features: set (default: None)
+            If not None, then only paths which are subsets of features are kept.
+
+        Returns: gsfs.feature_selection.LRavePaths
+            Object with decayed scores.
+        """
+        
+        decayed = LRavePaths()
+        
+        for path, n, score in zip(self._paths, self._n_vals, self._scores):
+            if features is not None and not path.issubset(features):
+                continue
+            
+            new_n = n * decay if max_n is None else min(n * decay, max_n)
+            decayed._paths.append(set(path))
+            decayed._n_vals.append(new_n)
+            decayed._scores.append(score/n * new_n)
+            
+        return decayed
+    
     def get_path_score(self, used_features):
         """
         Method for getting l-RAVE score for selected features, it will be an average score of all nodes that have used_featuresas as subset of their features.
@@ -94,4 +210,15 @@ class LRavePaths:
             'n': self._n_vals, 
             'scores': self._scores,
             'score': [x/y for x, y in zip(self._scores, self._n_vals)]
-        })
\ No newline at end of file
+        })
+    
+    def get_tail_version(self):
+        """
+        Method for getting version of approximated part of the scores (see ApproximateLRavePaths), all scores are exact,
+        so it is always 0.
+
+        Returns: int
+            Version of the tail.
+        """
+        
+        return 0
@@ -1,5 +1,7 @@
 import math
 import random
+import heapq
+from gsfs.feature_selection.ArrayGraph import ArrayNodeAdder
 
 class MultiArmStrategies:
     """Class containing functions for multi-arm strategies that are used during search of the graph."""
@@ -19,6 +21,7 @@ class MultiArmStrategies:
         self._name = name
         self._all_features_names = all_features_names
         self._params = params
+        self._random = random.Random(params['random_state'])
         
     def multiarm_strategy(self, node, scoring_functions, global_scores, node_adder):
         """
@@ -61,7 +64,7 @@ class MultiArmStrategies:
         if node.T == 0:
             return True
         return (((int(math.pow(node.T, self._params['b_T'])) - int(math.pow(node.T - 1, self._params['b_T']))) > 0) and
-               not self._all_features_names.issubset(node._features))
+               len(node._features) < len(self._all_features_names))
     
     def _get_best_node(self, node, scoring_functions, global_scores):
         best_score = -1
@@ -79,46 +82,78 @@ class MultiArmStrategies:
     def _get_best_node_continuous(self, node, scoring_functions, global_scores, node_adder):
         best_score = -1
         best_node = None
-        not_used_features = self._all_features_names - node._features - node.get_used_features_in_children()
-        add_node = False
-        best_feature = None
         for child_node in node._children:
             score = scoring_functions.get_score(node, child_node, global_scores)
            
             if score > best_score:
                 best_score = score
                 best_node = child_node    
-        for feature in not_used_features:
-            score = scoring_functions.get_new_node_score(feature, node, global_scores)
-            
-            if score * self._params['new_node_preference'] > best_score:
-                best_score = score
-                add_node = True
-                best_feature = feature
+        
+        best_feature, score = self._get_best_new_feature(node, scoring_functions, global_scores, node_adder)
             
-        if add_node:
+        if best_feature is not None and score * self._params['new_node_preference'] > best_score:
             best_node = node_adder.add_node(node, best_feature)
             
         return best_node
     
     def _add_child_node(self, node, scoring_functions, global_scores, node_adder):
-        best_score = 0
-        best_feature = None
-        not_used_features = self._all_features_names - node._features - node.get_used_features_in_children()
+        best_feature, best_score = self._get_best_new_feature(node, scoring_functions, global_scores, node_adder)
         
-        if len(not_used_features) == 0:
+        if best_feature is None:
             return self._get_best_node(node, scoring_functions, global_scores)
         
-        for feature in not_used_features:
-            score = scoring_functions.get_new_node_score(feature, node, global_scores)
-            if score > best_score:
-                best_feature = feature
-                best_score = score
-        
-        if best_feature is not None:
+        if best_score > 0:
             return node_adder.add_node(node, best_feature)
         
-        return node_adder.add_node(node, list(not_used_features)[random.randint(0,len(not_used_features))])
+        not_used_features = node_adder.get_not_used_features(node)
+        not_redundant_features = [feature for feature in not_used_features if not scoring_functions.is_redundant(feature, node)]
+        
+        if len(not_redundant_features) > 0:
+            not_used_features = not_redundant_features
+        
+        return node_adder.add_node(node, not_used_features[self._random.randint(0,len(not_used_features) - 1)])
+    
+    def _get_best_new_feature(self, node, scoring_functions, global_scores, node_adder):
+        # Every node keeps max-heap of scores of features that can be added to it, entry of a feature becomes stale 
+        # only when RAVE scores of the feature change (every set containing node's features + feature contains feature),
+        # so only features updated since the last visit are rescored (graph stored in arrays keeps the scores in arrays)
+        if isinstance(node_adder, ArrayNodeAdder):
+            return node_adder.get_best_new_feature(node, scoring_functions, global_scores)
+        
+        candidates = node._candidates
+        updated_features = None if candidates is None else global_scores.get_updated_features(candidates['version'])
+        
+        if updated_features is None or len(updated_features) > len(candidates['scores']):
+            scores = dict([feature, scoring_functions.get_new_node_score(feature, node, global_scores)] 
+                          for feature in node_adder.get_not_used_features(node))
+            heap = [(-score, feature) for feature, score in scores.items()]
+            heapq.heapify(heap)
+            candidates = {'heap': heap, 'scores': scores}
+            node._candidates = candidates
+        else:
+            for feature in updated_features:
+                if feature in candidates['scores']:
+                    score = scoring_functions.get_new_node_score(feature, node, global_scores)
+                    
+                    if score != candidates['scores'][feature]:
+                        candidates['scores'][feature] = score
+                        heapq.heappush(candidates['heap'], (-score, feature))
+        
+        candidates['version'] = global_scores.get_version()
+        heap = candidates['heap']
+        
+        while len(heap) > 0:
+            score, feature = heap[0]
+            
+            if feature not in candidates['scores'] or candidates['scores'][feature] != -score:
+                heapq.heappop(heap)
+            elif not node_adder.is_not_used(node, feature):
+                heapq.heappop(heap)
+                del candidates['scores'][feature]
+            else:
+                return feature, -score
+        
+        return None, None
         
     def _add_all_child_nodes(self, node, used_features):
         node.add_child_nodes(self._all_node_names - used_features)   
@@ -23,6 +23,11 @@ class Node:
             features.add(feature_name)
         self._features = features
         self._children = []
+        self._not_used_mask = None
+        self._candidates = None
+        self._cost_sum = 0
+        self._cpu_cost_sum = 0
+        self._cost_n = 0
     
     def add_child(self, node):
         """
@@ -54,6 +59,44 @@ class Node:
         self.T += 1
         self._scores_sum += score
 
+    def add_cost(self, seconds, cpu_seconds):
+        """
+        Method for adding measured cost of evaluation of node's features.
+
+        Parameters
+        ----------
+        seconds: float
+            Wall time of the evaluation,
+        cpu_seconds: float
+            CPU time of the evaluation.
+
+        Returns: None
+        """
+        
+        self._cost_sum += seconds
+        self._cpu_cost_sum += cpu_seconds
+        self._cost_n += 1
+    
+    def get_cost(self):
+        """
+        Method for getting average wall time of evaluations of node's features, if node hasn’t been evaluated yet then 0 is returned.
+
+        Returns: float
+            Average evaluation time in seconds.
+        """
+        
+        return self._cost_sum/self._cost_n if self._cost_n != 0 else 0
+    
+    def get_cpu_cost(self):
+        """
+        Method for getting average CPU time of evaluations of node's features, if node hasn’t been evaluated yet then 0 is returned.
+
+        Returns: float
+            Average evaluation CPU time in seconds.
+        """
+        
+        return self._cpu_cost_sum/self._cost_n if self._cost_n != 0 else 0
+    
     def get_variance(self):
         """
         Method for getting variance of scores for current node, if node hasn’t been visited yet (has no scores) then 0 is returned.
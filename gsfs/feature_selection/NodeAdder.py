@@ -1,16 +1,31 @@
 from gsfs.feature_selection.Node import *
 
 class NodeAdder:
-    """Class that is used to add nodes to algorithm’s search graph."""
+    """
+    Class that is used to add nodes to algorithm’s search graph. If names of all features are provided, then for every node
+    a bitset of features that are not used in the node and its children is maintained when nodes are linked.
+    """
 
-    def __init__(self, root):
+    def __init__(self, root, all_features_names = None):
         """
         root: gsfs.feature_selection.Node
-        Root of the search graph used in algorithm.
+        Root of the search graph used in algorithm,
+        all_features_names: set (default: None)
+        Set containing all names of the variables in a dataset used in search, needed for get_not_used_features.
         """
         
         self._nodes_buckets = {}
         self._nodes_buckets[0] = [root]
+        self._nodes_index = None
+        self._features_list = None
+        
+        if all_features_names is not None:
+            self._features_list = sorted(all_features_names)
+            self._features_bits = dict([name, 1 << i] for i, name in enumerate(self._features_list))
+            self._all_mask = (1 << len(self._features_list)) - 1
+            self._init_not_used_mask(root, self._get_mask(root._features))
+            for node in root._children:
+                root._not_used_mask &= ~self._get_mask(node._features)
         
     def add_node(self, node, feature_name):
         """
@@ -27,19 +42,113 @@ class NodeAdder:
         """
 
         new_node = Node(node._features, feature_name)    
+        new_mask = None
+        
+        if self._features_list is not None:
+            new_mask = self._get_mask(new_node._features)
+            self._init_not_used_mask(new_node, new_mask)
         
         if len(node._features) + 1 not in self._nodes_buckets:
             self._nodes_buckets[len(node._features) + 1] = []
             
         self._nodes_buckets[len(node._features) + 1].append(new_node)
         
+        if self._nodes_index is not None:
+            self._nodes_index[frozenset(new_node._features)] = new_node
+        
         for prev_node in self._nodes_buckets[len(node._features)]:
             if prev_node._features.issubset(new_node._features):
-                prev_node.add_child(new_node)
+                self._link(prev_node, new_node, new_mask)
                 
         if len(node._features) + 2 in self._nodes_buckets:
             for next_node in self._nodes_buckets[len(node._features) + 2]:
                 if new_node._features.issubset(next_node._features):
-                    new_node.add_child(next_node)
+                    self._link(new_node, next_node, None if new_mask is None else self._get_mask(next_node._features))
                     
-        return new_node
\ No newline at end of file
+        return new_node
+    
+    def get_node(self, features):
+        """
+        Method for finding node with given set of features, index of nodes is built on first call and then
+        maintained when nodes are added.
+        
+        Parameters
+        ----------
+        features: set
+            Set of features of the node.
+        
+        Returns: gsfs.feature_selection.Node
+            Node with the features or None if there is no such node in the graph.
+        """
+        
+        if self._nodes_index is None:
+            self._nodes_index = dict([frozenset(node._features), node] for nodes in self._nodes_buckets.values() for node in nodes)
+        
+        return self._nodes_index.get(frozenset(features))
+    
+    def get_not_used_features(self, node):
+        """
+        Method for getting features that are neither used in the node nor in any of its children, 
+        i.e. features that can be used to create new child of the node.
+        
+        Parameters
+        ----------
+        node: gsfs.feature_selection.Node
+            Node for which the features will be returned.
+        
+        Returns: list
+            List of names of features.
+        """
+        
+        if self._features_list is None:
+            raise Exception('NodeAdder was created without names of all features')
+        
+        if node._not_used_mask is None:
+            self._init_not_used_mask(node, self._get_mask(node._features))
+            for child_node in node._children:
+                node._not_used_mask &= ~self._get_mask(child_node._features)
+        
+        # Only set bits are visited (lowest set bit is isolated and cleared), so cost depends on number of not used features
+        mask = node._not_used_mask
+        features = []
+        while mask:
+            lowest = mask & -mask
+            features.append(self._features_list[lowest.bit_length() - 1])
+            mask ^= lowest
+        
+        return features
+    
+    def is_not_used(self, node, feature_name):
+        """
+        Method for checking whether the feature is neither used in the node nor in any of its children.
+        
+        Parameters
+        ----------
+        node: gsfs.feature_selection.Node
+            Checked node,
+        feature_name: str
+            Name of the feature.
+        
+        Returns: boolean
+            True if the feature can be used to create new child of the node.
+        """
+        
+        if node._not_used_mask is None:
+            self.get_not_used_features(node)
+        
+        return (node._not_used_mask & self._features_bits[feature_name]) != 0
+    
+    def _get_mask(self, features):
+        mask = 0
+        for name in features:
+            mask |= self._features_bits[name]
+        return mask
+    
+    def _init_not_used_mask(self, node, features_mask):
+        node._not_used_mask = self._all_mask & ~features_mask
+    
+    def _link(self, parent, child, child_mask):
+        parent.add_child(child)
+        
+        if child_mask is not None and parent._not_used_mask is not None:
+            parent._not_used_mask &= ~child_mask
@@ -0,0 +1,137 @@
+import numpy as np
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler, MinMaxScaler, MaxAbsScaler, RobustScaler
+from sklearn.impute import SimpleImputer
+from gsfs.feature_selection.CV import *
+from gsfs.feature_selection.TrainTestScore import *
+from gsfs.feature_selection.BuildInMetrics import *
+
+class PipelineEvaluator:
+    """
+    Class for scoring sets of features for sklearn Pipeline which leading steps are per-column transformers
+    (StandardScaler, MinMaxScaler, MaxAbsScaler, RobustScaler, SimpleImputer). Statistics of these transformers don't
+    depend on other columns, so they are fitted once on all features for every train split and the dataset is transformed once,
+    for every set of features only the remaining steps of the pipeline are fitted on transformed columns.
+    """
+
+    PER_COLUMN_TRANSFORMERS = (StandardScaler, MinMaxScaler, MaxAbsScaler, RobustScaler, SimpleImputer)
+
+    def __init__(self, model, metric, metric_name, data, labels, with_cv, params):
+        """
+        Parameters
+        ----------
+        model: sklearn.pipeline.Pipeline
+            Pipeline starting with per-column transformers,
+        metric: sklearn metric from BuildInMetrics
+            Metric used for scoring,
+        metric_name: str
+            Name of used metric,
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset,
+        with_cv: boolean
+            Information whether use cross-validation splits, if not then train-test split is used,
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        if not PipelineEvaluator.is_supported(model):
+            raise Exception('Pipeline evaluator supports only Pipeline starting with per-column transformers')
+
+        steps_count = PipelineEvaluator._get_transformers_count(model)
+        self._transformers = Pipeline(model.steps[:steps_count])
+        self._model = model.steps[-1][1] if steps_count == len(model.steps) - 1 else Pipeline(model.steps[steps_count:])
+        self._metric = metric
+        self._metric_name = metric_name
+        self._columns = dict([name, i] for i, name in enumerate(data.columns))
+
+        y = np.asarray(labels)
+
+        if with_cv:
+            splits = CV.get_splits(data, labels, params['cv'], params['random_state'])
+        else:
+            splits = [TrainTestScore.get_split(labels, params['test_size'], params['random_state'])]
+
+        self._splits = []
+        for train, test in splits:
+            transformers = clone(self._transformers)
+            X_train = transformers.fit_transform(data.iloc[train], y[train])
+            X_test = transformers.transform(data.iloc[test])
+
+            if X_train.shape[1] != data.shape[1]:
+                raise Exception('Pipeline evaluator requires transformers that keep all columns (e.g. SimpleImputer drops columns with only missing values)')
+
+            self._splits.append({'X_train': np.asarray(X_train), 'X_test': np.asarray(X_test), 'y_train': y[train],
+                                 'y_test': BuildInMetrics.prepare_labels(metric, y[test])})
+
+    @staticmethod
+    def is_supported(model):
+        """
+        Method for checking whether the model can be scored with PipelineEvaluator.
+
+        Parameters
+        ----------
+        model: sklearn model
+            Checked model.
+
+        Returns: boolean
+            True if the model is a Pipeline which starts with at least one per-column transformer and has a final estimator.
+        """
+
+        if not isinstance(model, Pipeline):
+            return False
+
+        steps_count = PipelineEvaluator._get_transformers_count(model)
+        return steps_count > 0 and steps_count < len(model.steps)
+
+    def score(self, features):
+        """
+        Method for getting score of the pipeline trained on selected features.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features.
+
+        Returns: float
+            Score of the model, averaged over splits if cross-validation is used.
+        """
+
+        indexes = [self._columns[name] for name in features]
+        score = 0
+
+        for split in self._splits:
+            model = clone(self._model)
+            model.fit(split['X_train'][:, indexes], split['y_train'])
+
+            if self._metric_name in ['acc','f1']:
+                predicted = model.predict(split['X_test'][:, indexes])
+            else:
+                predicted = model.predict_proba(split['X_test'][:, indexes])[:,1]
+
+            score += self._metric(split['y_test'], predicted)
+
+        return score/len(self._splits)
+
+    def close(self):
+        """
+        Method for releasing caches of the evaluator, transformed splits are needed for scoring and nothing else is cached,
+        so nothing is released (it is provided for the same interface as other evaluators).
+
+        Returns: None
+        """
+
+        pass
+
+    @staticmethod
+    def _get_transformers_count(model):
+        steps_count = 0
+        for name, step in model.steps:
+            if step is None or step == 'passthrough' or isinstance(step, PipelineEvaluator.PER_COLUMN_TRANSFORMERS):
+                steps_count += 1
+            else:
+                break
+
+        return steps_count
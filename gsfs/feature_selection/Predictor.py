@@ -0,0 +1,181 @@
+import os
+import numpy as np
+import pandas as pd
+
+class Predictor:
+    """
+    Class representing inference path of a model trained on selected features. Positions of the selected features
+    in the training dataset are resolved once, so predictions for numpy arrays (with the same columns as the training
+    dataset) are made by positional selection and for data frames columns are looked up by name only when their
+    columns differ from the previous call. Input data is never modified. Model is expected to be trained
+    on data frame containing the selected features in given order, so the model gets data frame with the same column names
+    (e.g. for pipelines selecting columns by name).
+    """
+
+    def __init__(self, model, input_columns, features):
+        """
+        Parameters
+        ----------
+        model: sklearn model
+            Model trained on the selected features,
+        input_columns: list
+            Names of all columns of the training dataset,
+        features: list
+            Names of the selected features, in order in which they were passed to the model.
+        """
+
+        self._model = model
+        self._features = list(features)
+        self._input_columns = pd.Index([str(col) for col in input_columns])
+        self._positions = self._get_positions(self._input_columns)
+        self._last_columns = None
+        self._last_positions = None
+
+    def get_features(self):
+        """
+        Method for getting names of the selected features.
+
+        Returns: list
+            List of features.
+        """
+
+        return self._features
+
+    def get_matrix(self, data):
+        """
+        Method for selecting the features used by the model from input data.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame|numpy.ndarray
+            Input data, numpy array must have the same columns as the training dataset.
+
+        Returns: pandas.DataFrame
+            Data frame with the selected features, named as in the training dataset.
+        """
+
+        if isinstance(data, pd.DataFrame):
+            matrix = data.iloc[:, self._get_frame_positions(data.columns)]
+            matrix.columns = self._features
+            return matrix
+
+        data = np.asarray(data)
+        if data.ndim != 2 or data.shape[1] != len(self._input_columns):
+            raise Exception('Input array must have ' + str(len(self._input_columns)) + ' columns, as the training dataset')
+
+        return pd.DataFrame(data[:, self._positions], columns = self._features)
+
+    def predict(self, data):
+        """
+        Method for predicting classes for input data.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which the classes will be returned.
+
+        Returns: numpy.ndarray
+            Array with predictions.
+        """
+
+        return self._model.predict(self.get_matrix(data))
+
+    def predict_proba(self, data):
+        """
+        Method for getting probabilities of classes for input data.
+
+        Parameters
+        ----------
+        data: pandas.DataFrame|numpy.ndarray
+            Data for which probabilites will be returned.
+
+        Returns: numpy.ndarray
+            Array, where i-th column represents probabilities of i-th class.
+        """
+
+        return self._model.predict_proba(self.get_matrix(data))
+
+    def predict_chunks(self, chunks, proba = True):
+        """
+        Method for lazily predicting consecutive chunks of data, only one chunk is kept in memory at a time.
+
+        Parameters
+        ----------
+        chunks: iterable
+            Iterable of pandas.DataFrame or numpy.ndarray objects (e.g. reader returned by pandas.read_csv with chunksize),
+        proba: boolean (default: True)
+            If True then probabilities of classes are returned, otherwise classes.
+
+        Returns: generator
+            Generator of predictions for consecutive chunks.
+        """
+
+        for chunk in chunks:
+            yield self.predict_proba(chunk) if proba else self.predict(chunk)
+
+    def predict_file(self, input_path, output_path = None, chunksize = 100000, proba = True, **read_csv_kwargs):
+        """
+        Method for predicting CSV file in chunks, only the selected features are parsed. If output path is given,
+        predictions are appended to the output CSV file chunk by chunk, so memory usage doesn't depend on size of the file.
+
+        Parameters
+        ----------
+        input_path: str
+            Path of CSV file with header containing names of the features,
+        output_path: str (default: None)
+            Path of CSV file to which predictions will be written (it is overwritten), if None then predictions are returned,
+        chunksize: int (default: 100000)
+            Number of rows read at a time,
+        proba: boolean (default: True)
+            If True then probabilities of classes are predicted (columns "proba_<class>"), otherwise classes (column "prediction"),
+        read_csv_kwargs:
+            Other arguments passed to pandas.read_csv (e.g. sep).
+
+        Returns: int|numpy.ndarray
+            Number of predicted rows if output path is given, otherwise predictions.
+        """
+
+        if chunksize <= 0:
+            raise Exception('chunksize must be > 0')
+
+        reader = pd.read_csv(input_path, chunksize = chunksize, usecols = self._features, **read_csv_kwargs)
+        if output_path is None:
+            predictions = list(self.predict_chunks(reader, proba))
+            return np.concatenate(predictions) if len(predictions) > 0 else np.zeros(0)
+
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+        rows = 0
+        for prediction in self.predict_chunks(reader, proba):
+            if proba:
+                frame = pd.DataFrame(prediction, columns = ['proba_' + str(c) for c in self._model.classes_])
+            else:
+                frame = pd.DataFrame({'prediction': prediction})
+
+            frame.to_csv(output_path, mode = 'a', header = rows == 0, index = False)
+            rows += len(frame)
+
+        return rows
+
+    def _get_frame_positions(self, columns):
+        if columns is self._last_columns:
+            return self._last_positions
+
+        names = pd.Index([str(col) for col in columns])
+        positions = self._positions if names.equals(self._input_columns) else self._get_positions(names)
+
+        self._last_columns = columns
+        self._last_positions = positions
+        return positions
+
+    def _get_positions(self, names):
+        if not names.is_unique:
+            raise Exception('Names of columns of input data must be unique')
+
+        positions = names.get_indexer(self._features)
+        if (positions == -1).any():
+            missing = [self._features[i] for i in np.flatnonzero(positions == -1)]
+            raise Exception('Input data is missing features: ' + ', '.join(missing))
+
+        return positions
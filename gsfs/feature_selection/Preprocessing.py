@@ -29,34 +29,42 @@ class Preprocessing:
         return labels
 
     @staticmethod
-    def one_hot_encode(data):
+    def one_hot_encode(data, return_groups = False):
         """
         Method that can be used to one-hot encode input data. All columns containing string not-numerical will be one-hot encoded.
 
         Parameters
         ----------
         data: pandas.DafaFrame
-            Data frame that will be one-hot encoded.
+            Data frame that will be one-hot encoded,
+        return_groups: boolean (default: False)
+            Information whether also dictionary of groups of dummy columns (pairs of encoded columns and lists of their 
+            dummy columns) will be returned, it can be passed as "feature_groups" to GSFS.fit.
 
-        Returns: pandas.DataFrame 
-            Data frame with one-hot encoding.
+        Returns: pandas.DataFrame|tuple
+            Data frame with one-hot encoding, or tuple of the data frame and dictionary of groups if return_groups is True.
         """
 
-        for col in data:
+        groups = {}
+
+        for col in data.columns:
             ind = -1
 
-        for i in data.index.values:
-            if not pd.isnull(data.loc[i,col]):
-                ind = i
+            for i in data.index.values:
+                if not pd.isnull(data.loc[i,col]):
+                    ind = i
 
-        if ind == -1:
-            print('Column "' + col + '" contains only NaN values, removing it')
-            data = data.drop(columns=[col])
-        else:   
-            if isinstance(data.loc[ind,col], str):
+            if ind == -1:
+                print('Column "' + col + '" contains only NaN values, removing it')
+                data = data.drop(columns=[col])
+            elif isinstance(data.loc[ind,col], str):
                 dummies = pd.get_dummies(data.loc[:,col])
                 dummies.columns = col + '_' + dummies.columns
                 data = data.join(dummies)
                 data = data.drop(columns = col)
+                groups[col] = list(dummies.columns)
                 
-        return data
\ No newline at end of file
+        if return_groups:
+            return data, groups
+
+        return data
@@ -0,0 +1,152 @@
+import numpy as np
+from scipy.stats import rankdata
+
+class Redundancy:
+    """
+    Class representing sparse matrix of redundancy of pairs of features, only pairs with redundancy not lower than the threshold
+    are kept. Redundancy is absolute Pearson ("correlation") or Spearman ("spearman") correlation, or mutual information
+    of quantile-binned features normalized by geometric mean of their entropies ("mutual_info"), all in [0, 1].
+    The matrix is calculated for blocks of columns, so only a block of the dense matrix is kept in memory at a time.
+    """
+
+    def __init__(self, data, method = 'correlation', threshold = 0.95, block_size = 256, bins = 10, groups = None):
+        """
+        Parameters
+        ----------
+        data: pandas.DataFrame
+            Input dataset,
+        method: str (default: "correlation")
+            Measure of redundancy, available values are "correlation", "spearman" and "mutual_info",
+        threshold: float (default: 0.95)
+            Minimal redundancy of pairs of features that are kept,
+        block_size: int (default: 256)
+            Number of columns in a block ("mutual_info" uses blocks smaller by factor of "bins"),
+        bins: int (default: 10)
+            Number of quantile bins used by "mutual_info",
+        groups: dict (default: None)
+            Dictionary containing pairs of names of groups and lists of their columns, if not None then redundancy of two groups
+            is maximal redundancy of their columns.
+        """
+
+        self._threshold = threshold
+        self._pairs = {}
+        names = [str(col) for col in data.columns]
+        X = np.asarray(data, dtype = np.float64)
+        X = np.where(np.isnan(X), np.nanmean(X, axis = 0), X) if np.isnan(X).any() else X
+
+        if method in ['correlation', 'spearman']:
+            self._add_correlations(names, rankdata(X, axis = 0) if method == 'spearman' else X, block_size)
+        elif method == 'mutual_info':
+            self._add_mutual_info(names, X, max(1, block_size//bins), bins)
+        else:
+            raise Exception('Redundancy \"' + str(method) + '\" is not supported, available values are: correlation, spearman, mutual_info')
+
+        if groups is not None:
+            self._group_pairs(groups)
+
+    def get_redundancy(self, feature_name, features):
+        """
+        Method for getting highest redundancy of the feature with any of the features.
+
+        Parameters
+        ----------
+        feature_name: str
+            Name of the feature,
+        features: set
+            Set of features.
+
+        Returns: float
+            Redundancy, 0 if it is lower than the threshold for all features.
+        """
+
+        pairs = self._pairs.get(feature_name)
+
+        if pairs is None:
+            return 0
+
+        return max([pairs[name] for name in features if name in pairs], default = 0)
+
+    def is_redundant(self, feature_name, features):
+        """
+        Method for checking whether redundancy of the feature with any of the features is not lower than the threshold.
+
+        Parameters
+        ----------
+        feature_name: str
+            Name of the feature,
+        features: set
+            Set of features.
+
+        Returns: boolean
+            True if the feature is redundant.
+        """
+
+        pairs = self._pairs.get(feature_name)
+        return pairs is not None and not pairs.keys().isdisjoint(features)
+
+    def get_pairs_count(self):
+        """
+        Method for getting number of redundant pairs of features.
+
+        Returns: int
+            Number of pairs.
+        """
+
+        return sum(len(pairs) for pairs in self._pairs.values())//2
+
+    def _add_correlations(self, names, X, block_size):
+        std = X.std(axis = 0)
+        # Constant columns are zeroed, so they aren't correlated with anything
+        Z = np.divide(X - X.mean(axis = 0), std * np.sqrt(len(X)), out = np.zeros_like(X), where = std > 0)
+
+        for i in range(0, Z.shape[1], block_size):
+            for j in range(i, Z.shape[1], block_size):
+                self._add_block(names, i, j, np.abs(Z[:, i:i + block_size].T.dot(Z[:, j:j + block_size])))
+
+    def _add_mutual_info(self, names, X, block_size, bins):
+        codes = np.zeros(X.shape, dtype = np.int64)
+        for k in range(X.shape[1]):
+            edges = np.unique(np.quantile(X[:, k], np.linspace(0, 1, bins + 1)[1:-1]))
+            codes[:, k] = np.searchsorted(edges, X[:, k], side = 'right')
+
+        n = len(X)
+        marginals = np.stack([np.bincount(codes[:, k], minlength = bins) for k in range(X.shape[1])])/n
+        entropies = -np.sum(np.where(marginals > 0, marginals * np.log(np.where(marginals > 0, marginals, 1)), 0), axis = 1)
+
+        for i in range(0, X.shape[1], block_size):
+            left = self._get_one_hot(codes[:, i:i + block_size], bins)
+            for j in range(i, X.shape[1], block_size):
+                right = self._get_one_hot(codes[:, j:j + block_size], bins)
+                joint = left.T.dot(right).reshape(left.shape[1]//bins, bins, right.shape[1]//bins, bins).transpose(0, 2, 1, 3)/n
+                expected = marginals[i:i + block_size, None, :, None] * marginals[None, j:j + block_size, None, :]
+                ratio = np.divide(joint, expected, out = np.ones_like(joint), where = joint > 0)
+                mutual_info = np.sum(joint * np.log(ratio), axis = (2, 3))
+                norm = np.sqrt(np.outer(entropies[i:i + block_size], entropies[j:j + block_size]))
+                self._add_block(names, i, j, np.divide(mutual_info, norm, out = np.zeros_like(mutual_info), where = norm > 0))
+
+    @staticmethod
+    def _get_one_hot(codes, bins):
+        one_hot = np.zeros((codes.shape[0], codes.shape[1] * bins), dtype = np.float64)
+        one_hot[np.arange(codes.shape[0])[:, None], np.arange(codes.shape[1]) * bins + codes] = 1
+        return one_hot
+
+    def _add_block(self, names, i, j, block):
+        for a, b in np.argwhere(block >= self._threshold):
+            if i + a < j + b:
+                self._add_pair(names[i + a], names[j + b], float(min(block[a, b], 1)))
+
+    def _add_pair(self, first, second, value):
+        for name, other in [(first, second), (second, first)]:
+            if name not in self._pairs:
+                self._pairs[name] = {}
+            self._pairs[name][other] = max(value, self._pairs[name].get(other, 0))
+
+    def _group_pairs(self, groups):
+        columns_groups = dict([column, name] for name, group in groups.items() for column in group)
+        pairs = self._pairs
+        self._pairs = {}
+
+        for name, others in pairs.items():
+            for other, value in others.items():
+                if name in columns_groups and other in columns_groups and columns_groups[name] != columns_groups[other]:
+                    self._add_pair(columns_groups[name], columns_groups[other], value)
@@ -3,20 +3,26 @@ import math
 class ScoringFunctions():
     """
     Class containing scoring functions that are used during graph search. 
-    Available scoring functions are "UCB1", "UCB1_with_variance" and "UCB1_rave".
+    Available scoring functions are "UCB1", "UCB1_with_variance" and "UCB1_rave". If "cost_weight" param is > 0, 
+    scores are penalized by predicted evaluation time (in seconds) of the feature added to parent's set of features.
+    If redundancy matrix is provided, new nodes adding features redundant with parent's features are skipped 
+    ("redundancy_mode" is "skip") or their scores are penalized by "redundancy_penalty" times the redundancy ("penalty").
     """
     
-    def __init__(self, scoring_name, params):
+    def __init__(self, scoring_name, params, redundancy = None):
         """
         Parameters
         ----------
         scoring_name: str
             Name of the scoring function that will be used,
         params: dict
-            Parameters of scoring functions.
+            Parameters of scoring functions,
+        redundancy: gsfs.feature_selection.Redundancy (default: None)
+            Redundancy of pairs of features.
         """
         self._params = params
         self._scoring_name = scoring_name
+        self._redundancy = redundancy
 
     def set_scoring_function(self, scoring_name, params = None):
         """
@@ -51,13 +57,19 @@ class ScoringFunctions():
         """
         
         if self._scoring_name == 'UCB1':
-            return self._ucb_scoring(parent_node, node)
+            score = self._ucb_scoring(parent_node, node)
         elif self._scoring_name == 'UCB1_with_variance':
-            return self._ucb_var_scoring(parent_node, node)
+            score = self._ucb_var_scoring(parent_node, node)
         elif self._scoring_name == 'UCB1_rave':
-            return self._rave_scoring(parent_node, node, global_scores)
+            score = self._rave_scoring(parent_node, node, global_scores)
         else:
             raise Exception('Error initializing ScoringFunctions object, \"' + self._scoring_name + '\" is not supported.')
+        
+        if parent_node is None or self._params['cost_weight'] == 0:
+            return score
+        
+        new_feature = next(iter(node._features.difference(parent_node._features)))
+        return score - self._params['cost_weight'] * global_scores.get_feature_cost(new_feature)
      
     def get_new_node_score(self, feature_name, node, global_scores): 
         """
@@ -76,6 +88,13 @@ class ScoringFunctions():
             Score of the node.
         """
         
+        redundancy = 0
+        if self._redundancy is not None:
+            redundancy = self._redundancy.get_redundancy(feature_name, node._features)
+            
+            if redundancy > 0 and self._params['redundancy_mode'] == 'skip':
+                return -float('Inf')
+        
         if global_scores.get_n(feature_name) == 0:
             return float('Inf')
         
@@ -86,7 +105,28 @@ class ScoringFunctions():
         c = self._params['c']
         c_l = self._params['c_l']
         beta = c_l/(c_l + global_scores.get_t_l(tmp_features))
-        return (1 - beta) * l_rave + beta * g_rave
+        # Penalties depend only on the added feature, its cost changes only when a set containing it is evaluated
+        # (unevaluated features cost 0) and every evaluation is followed by update_score of the same set, so the
+        # score changes only when the feature appears in the updates log
+        return ((1 - beta) * l_rave + beta * g_rave - self._params['cost_weight'] * global_scores.get_feature_cost(feature_name) - 
+                self._params['redundancy_penalty'] * redundancy)
+    
+    def is_redundant(self, feature_name, node):
+        """
+        Method for checking whether the feature is redundant with any of node's features.
+
+        Parameters
+        ----------
+        feature_name: str
+            Name of the feature,
+        node: gsfs.feature_selection.Node
+            Current node in search.
+			
+        Returns: boolean
+            True if the feature is redundant, False if it isn't or redundancy matrix wasn't provided.
+        """
+        
+        return self._redundancy is not None and self._redundancy.is_redundant(feature_name, node._features)
     
     def _ucb_scoring(self, parent_node, node):
         if parent_node == None or node.T == 0:
@@ -0,0 +1,124 @@
+import numpy as np
+from sklearn.feature_selection import mutual_info_classif
+
+class Screening:
+    """
+    Class containing static methods for univariate pre-screening of features, every statistic is calculated
+    for all columns of the dataset at once. Available statistics are "mutual_info", "f_classif" and "point_biserial".
+    """
+
+    @staticmethod
+    def get_scores(name, data, labels, random_state = 123):
+        """
+        Method for getting univariate statistic for every column of the dataset, the higher the value,
+        the more informative the column is.
+
+        Parameters
+        ----------
+        name: str
+            Name of the statistic, available values are "mutual_info", "f_classif" and "point_biserial",
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset,
+        random_state: int (default: 123)
+            Seed used by "mutual_info" statistic.
+
+        Returns: numpy.array
+            Array with statistic for every column of the dataset, columns with undefined statistic (e.g. constant ones) get 0.
+        """
+
+        X = np.asarray(data, dtype = np.float64)
+        y = np.asarray(labels)
+
+        if name == 'mutual_info':
+            scores = mutual_info_classif(X, y, random_state = random_state)
+        elif name == 'f_classif':
+            scores = Screening._f_classif(X, y)
+        elif name == 'point_biserial':
+            scores = Screening._point_biserial(X, y)
+        else:
+            raise Exception('Screening statistic \"' + str(name) + '\" is not supported, available values are: mutual_info, f_classif, point_biserial')
+
+        return np.nan_to_num(scores)
+
+    @staticmethod
+    def get_top_k(names, scores, k):
+        """
+        Method for getting names of k columns with highest scores.
+
+        Parameters
+        ----------
+        names: list
+            Names of the columns,
+        scores: numpy.array
+            Scores of the columns, i-th score is a score of i-th column,
+        k: int
+            Number of columns that will be returned, if None or greater than number of columns then all columns are returned.
+
+        Returns: list
+            Names of selected columns ordered by descending score.
+        """
+
+        order = np.argsort(-np.asarray(scores), kind = 'stable')
+
+        if k is not None:
+            order = order[:k]
+
+        return [names[i] for i in order]
+
+    @staticmethod
+    def calibrate(scores, low, high):
+        """
+        Method for mapping scores of features to the scale of the metric, the highest score is mapped to "high" and
+        score 0 to "low".
+
+        Parameters
+        ----------
+        scores: numpy.array
+            Non-negative scores of features,
+        low: float
+            Value of the metric that corresponds to not informative feature,
+        high: float
+            Value of the metric that corresponds to the most informative feature.
+
+        Returns: numpy.array
+            Calibrated scores.
+        """
+
+        scores = np.clip(np.asarray(scores, dtype = np.float64), 0, None)
+        max_score = scores.max() if len(scores) > 0 else 0
+
+        if max_score == 0:
+            return np.full(len(scores), float(low))
+
+        return low + (high - low) * scores/max_score
+
+    @staticmethod
+    def _f_classif(X, y):
+        classes = np.unique(y)
+        n = X.shape[0]
+        mean = X.mean(axis = 0)
+        between = np.zeros(X.shape[1])
+        within = np.zeros(X.shape[1])
+
+        for c in classes:
+            X_c = X[y == c]
+            mean_c = X_c.mean(axis = 0)
+            between += X_c.shape[0] * (mean_c - mean)**2
+            within += ((X_c - mean_c)**2).sum(axis = 0)
+
+        df_between = len(classes) - 1
+        df_within = n - len(classes)
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            return (between/df_between)/(within/df_within)
+
+    @staticmethod
+    def _point_biserial(X, y):
+        y = (y == y.max()).astype(np.float64)
+        X_centered = X - X.mean(axis = 0)
+        y_centered = y - y.mean()
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            return np.abs(X_centered.T.dot(y_centered)/(np.sqrt((X_centered**2).sum(axis = 0)) * np.sqrt((y_centered**2).sum())))
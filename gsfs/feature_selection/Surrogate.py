@@ -0,0 +1,145 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy.sparse import csr_matrix, hstack
+from sklearn.linear_model import Ridge
+from sklearn.ensemble import RandomForestRegressor
+
+class Surrogate:
+    """
+    Class representing surrogate model predicting score of a set of features from its bitmask and RAVE scores.
+    Surrogate is trained on true evaluations done during the search and is periodically retrained in background thread.
+    Available surrogate models are "ridge" and "forest".
+    """
+
+    def __init__(self, name, all_features_names, params):
+        """
+        Parameters
+        ----------
+        name: str
+            Name of the surrogate model, available values are "ridge" and "forest",
+        all_features_names: set
+            Set containing all names of the variables in a dataset used in search,
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        if name not in ['ridge', 'forest']:
+            raise Exception('Surrogate \"' + str(name) + '\" is not supported, available values are: ridge, forest')
+
+        self._name = name
+        self._params = params
+        self._features_indexes = dict([feature, i] for i, feature in enumerate(sorted(all_features_names)))
+        self._rows = []
+        self._extras = []
+        self._scores = []
+        self._model = None
+        self._residual_std = 0
+        self._trained_size = 0
+        self._executor = None
+        self._future = None
+
+    def add_evaluation(self, features, score, global_scores):
+        """
+        Method for adding true evaluation of set of features to the training data of surrogate.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features,
+        score: float
+            True score of the features,
+        global_scores: gsfs.feature_selection.GlobalScores
+            GlobalScores object used in search.
+
+        Returns: None
+        """
+
+        self._rows.append([self._features_indexes[name] for name in features])
+        self._extras.append(self._get_extras(features, global_scores))
+        self._scores.append(score)
+
+        self._collect_trained_model()
+
+        if (self._future is None and len(self._scores) >= self._params['surrogate_min_samples'] and
+            len(self._scores) - self._trained_size >= self._params['surrogate_retrain_interval']):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers = 1)
+
+            self._trained_size = len(self._scores)
+            self._future = self._executor.submit(self._train, self._get_matrix(self._rows, self._extras), np.array(self._scores))
+
+    def get_score(self, features, global_scores, best_score):
+        """
+        Method for getting surrogate score of the features, it is returned only if upper bound of the prediction
+        (prediction + surrogate_k * standard deviation of residuals) is lower than best_score - surrogate_margin.
+
+        Parameters
+        ----------
+        features: list
+            Names of the features,
+        global_scores: gsfs.feature_selection.GlobalScores
+            GlobalScores object used in search,
+        best_score: float
+            Best score found in the search.
+
+        Returns: float
+            Predicted score or None if the features should be evaluated with the model.
+        """
+
+        self._collect_trained_model()
+
+        if self._model is None:
+            return None
+
+        x = self._get_matrix([[self._features_indexes[name] for name in features]], [self._get_extras(features, global_scores)])
+        prediction = self._model.predict(x)[0]
+
+        if prediction + self._params['surrogate_k'] * self._residual_std < best_score - self._params['surrogate_margin']:
+            return prediction
+
+        return None
+
+    def close(self):
+        """
+        Method for stopping background training of surrogate.
+
+        Returns: None
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait = True)
+            self._collect_trained_model()
+            self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_future'] = None
+        return state
+
+    def _collect_trained_model(self):
+        if self._future is not None and self._future.done():
+            self._model, self._residual_std = self._future.result()
+            self._future = None
+
+    def _train(self, X, y):
+        if self._name == 'ridge':
+            model = Ridge(alpha = 1.0)
+            model.fit(X, y)
+            residuals = y - model.predict(X)
+        else:
+            model = RandomForestRegressor(n_estimators = 50, min_samples_leaf = 3, oob_score = True, random_state = self._params['random_state'])
+            model.fit(X, y)
+            residuals = y - model.oob_prediction_
+
+        return model, float(np.std(residuals))
+
+    def _get_matrix(self, rows, extras):
+        indices = np.array([i for row in rows for i in row], dtype = np.int64)
+        indptr = np.cumsum([0] + [len(row) for row in rows])
+        bitmask = csr_matrix((np.ones(len(indices)), indices, indptr), shape = (len(rows), len(self._features_indexes)))
+        return hstack([bitmask, csr_matrix(np.array(extras))], format = 'csr')
+
+    def _get_extras(self, features, global_scores):
+        g_rave = [global_scores.get_g_rave_score(name) for name in features]
+        return [len(features), np.mean(g_rave), np.min(g_rave), np.max(g_rave), global_scores.get_l_rave_score(set(features))]
@@ -1,10 +1,50 @@
+from gsfs.feature_selection.BuildInMetrics import *
 from sklearn.model_selection import train_test_split
+import numpy as np
+import weakref
 
 class TrainTestScore:
-    """Class containing static method for performing scoring of a model using train-test split."""
+    """
+    Class containing static method for performing scoring of a model using train-test split. Split and test labels prepared 
+    for the metric are cached for the last scored labels object, so they aren't recalculated on every scoring of the same labels.
+    Labels are referenced weakly by the cache, so it doesn't keep them in memory, and it is cleared at the end of fitting.
+    """
+    
+    _split_cache = None
+    
+    @staticmethod
+    def get_split(labels, test_size, random_state = 123):
+        """
+        Method for getting indexes of rows used as train and test dataset, the split is the same as the one 
+        used in train_test_score.
+        
+        Parameters
+        ----------
+        labels: pandas.Series
+            Labels of input dataset,
+        test_size: float
+            Fraction of the input dataset that will be used as a test dataset,
+        random_state: int (default: 123)
+            Seed used for splitting.
+            
+        Returns: tuple
+            Pair of numpy arrays, indexes of train rows and indexes of test rows.
+        """
+        
+        return tuple(train_test_split(np.arange(len(labels)), test_size = test_size, random_state = random_state))
+    
+    @staticmethod
+    def clear_cache():
+        """
+        Method for releasing cached split and test labels.
+        
+        Returns: None
+        """
+        
+        TrainTestScore._split_cache = None
     
     @staticmethod
-    def train_test_score(metric, metric_name, model, data, labels, test_size):
+    def train_test_score(metric, metric_name, model, data, labels, test_size, random_state = 123):
         """
         Method for scoring a model using train-test split.
         
@@ -21,18 +61,45 @@ class TrainTestScore:
         labels: pandas.Series
             Labels of input dataset
         test_size: float
-            Fraction of the input dataset that will be used as a test dataset.
+            Fraction of the input dataset that will be used as a test dataset,
+        random_state: int (default: 123)
+            Seed used for splitting.
             
         Returns: float 
             Train-test split score.
         """
 
-        X_train, X_test, y_train, y_test = train_test_split(data, labels, test_size = test_size, random_state = 123)
-        model.fit(X_train, y_train)
+        train, test, y_test = TrainTestScore._get_prepared_split(metric, labels, test_size, random_state)
+        model.fit(TrainTestScore._get_rows(data, train), TrainTestScore._get_rows(labels, train))
         
         if metric_name in ['acc','f1']:
-            predicted = model.predict(X_test)   
+            predicted = model.predict(TrainTestScore._get_rows(data, test))   
         else:
-            predicted = model.predict_proba(X_test)[:,1]
+            predicted = model.predict_proba(TrainTestScore._get_rows(data, test))[:,1]
                 
-        return metric(y_test, predicted)
\ No newline at end of file
+        return metric(y_test, predicted)
+    
+    @staticmethod
+    def _get_rows(values, rows):
+        return values.iloc[rows] if hasattr(values, 'iloc') else np.asarray(values)[rows]
+    
+    @staticmethod
+    def _get_prepared_split(metric, labels, test_size, random_state):
+        # Labels object is compared by identity of live weak reference (so id of freed labels can't be matched), 
+        # cache is replaced by single assignment, so it is safe for threads
+        cache = TrainTestScore._split_cache
+        key = (len(labels), metric, test_size, random_state)
+        
+        if cache is not None and cache[0]() is labels and cache[1] == key:
+            return cache[2]
+        
+        train, test = TrainTestScore.get_split(labels, test_size, random_state)
+        split = (train, test, BuildInMetrics.prepare_labels(metric, np.asarray(labels)[test]))
+        
+        try:
+            TrainTestScore._split_cache = (weakref.ref(labels), key, split)
+        except TypeError:
+            # Labels not supporting weak references (e.g. list) aren't cached
+            TrainTestScore._split_cache = None
+        
+        return split
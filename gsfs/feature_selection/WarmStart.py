@@ -0,0 +1,132 @@
+import numpy as np
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.svm import l1_min_c
+from joblib import Parallel, delayed
+from gsfs.feature_selection.Screening import *
+
+class WarmStart:
+    """
+    Class containing estimators of feature importances used for initialising RAVE scores before the graph search.
+    Available estimators are "forest", "l1_logistic" and "permutation", selected estimators are run concurrently.
+    """
+
+    def __init__(self, estimators, params):
+        """
+        Parameters
+        ----------
+        estimators: list
+            Names of the estimators that will be used,
+        params: dict
+            Parameters of the algorithm.
+        """
+
+        for name in estimators:
+            if name not in ['forest', 'l1_logistic', 'permutation']:
+                raise Exception('Warm start estimator \"' + str(name) + '\" is not supported, available values are: forest, l1_logistic, permutation')
+
+        if len(estimators) == 0:
+            raise Exception('At least one warm start estimator must be selected')
+
+        self._estimators = estimators
+        self._params = params
+
+    def get_priors(self, model, metric, metric_name, data, labels, chance_score):
+        """
+        Method for getting prior scores of all features. Importances of every estimator are normalized to [0, 1],
+        averaged and mapped to the scale of the metric, the most important feature gets the best held-out score
+        of the estimators and not important features get the score of not informative model.
+
+        Parameters
+        ----------
+        model: sklearn model
+            Model used in feature selection, it is used by "permutation" estimator,
+        metric: sklearn metric from BuildInMetrics
+            Metric used in feature selection,
+        metric_name: str
+            Name of used metric,
+        data: pandas.DataFrame
+            Input dataset,
+        labels: pandas.Series
+            Labels of input dataset,
+        chance_score: float
+            Score of not informative model.
+
+        Returns: dict
+            Dictionary containing pairs of feature names and prior scores.
+        """
+
+        X = np.asarray(data, dtype = np.float64)
+        y = np.asarray(labels).astype(int)
+
+        if self._params['warm_start_subsample'] < 1:
+            X, _, y, _ = train_test_split(X, y, train_size = self._params['warm_start_subsample'],
+                                          random_state = self._params['random_state'], stratify = y)
+
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size = self._params['test_size'], random_state = self._params['random_state'])
+
+        n_jobs = 1 if self._params['n_jobs'] == 1 else len(self._estimators)
+        results = Parallel(n_jobs = n_jobs, prefer = 'threads')(
+            delayed(self._get_importances)(name, model, metric, metric_name, X_train, X_test, y_train, y_test)
+            for name in self._estimators)
+
+        importances = np.zeros(X.shape[1])
+        reference_scores = [chance_score]
+        for estimator_importances, reference_score in results:
+            importances += Screening.calibrate(estimator_importances, 0, 1)/len(results)
+            if reference_score is not None:
+                reference_scores.append(reference_score)
+
+        priors = Screening.calibrate(importances, chance_score, max(reference_scores))
+        return dict([name, priors[i]] for i, name in enumerate(data.columns))
+
+    def _get_importances(self, name, model, metric, metric_name, X_train, X_test, y_train, y_test):
+        if name == 'forest':
+            return self._forest_importances(metric, metric_name, X_train, X_test, y_train, y_test)
+        elif name == 'l1_logistic':
+            return self._l1_logistic_importances(X_train, y_train)
+        else:
+            return self._permutation_importances(model, metric, metric_name, X_train, X_test, y_train, y_test)
+
+    def _forest_importances(self, metric, metric_name, X_train, X_test, y_train, y_test):
+        rf = RandomForestClassifier(n_estimators = 100, n_jobs = self._params['n_jobs'], random_state = self._params['random_state'])
+        rf.fit(X_train, y_train)
+        return rf.feature_importances_, WarmStart._score(rf, metric, metric_name, X_test, y_test)
+
+    def _l1_logistic_importances(self, X_train, y_train):
+        std = X_train.std(axis = 0)
+        std[std == 0] = 1
+        X_scaled = (X_train - X_train.mean(axis = 0))/std
+        importances = np.zeros(X_train.shape[1])
+        lr = LogisticRegression(penalty = 'l1', solver = 'liblinear', warm_start = True, random_state = self._params['random_state'])
+
+        for c in l1_min_c(X_scaled, y_train, loss = 'log') * np.logspace(0, 3, 10):
+            lr.set_params(C = c)
+            lr.fit(X_scaled, y_train)
+            importances += np.abs(lr.coef_[0])
+
+        return importances, None
+
+    def _permutation_importances(self, model, metric, metric_name, X_train, X_test, y_train, y_test):
+        model = clone(model)
+        model.fit(X_train, y_train)
+        base_score = WarmStart._score(model, metric, metric_name, X_test, y_test)
+        random_state = np.random.RandomState(self._params['random_state'])
+        importances = np.zeros(X_train.shape[1])
+        X_permuted = X_test.copy()
+
+        for i in range(X_test.shape[1]):
+            X_permuted[:, i] = X_test[random_state.permutation(X_test.shape[0]), i]
+            importances[i] = base_score - WarmStart._score(model, metric, metric_name, X_permuted, y_test)
+            X_permuted[:, i] = X_test[:, i]
+
+        return importances, base_score
+
+    @staticmethod
+    def _score(model, metric, metric_name, X_test, y_test):
+        if metric_name in ['acc','f1']:
+            return metric(y_test, model.predict(X_test))
+
+        return metric(y_test, model.predict_proba(X_test)[:,1])
@@ -0,0 +1,48 @@
+import unittest
+import random
+
+class TestApproximateLRavePaths(unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(0)
+        features = [str(i) for i in range(12)]
+        self._paths = [(set(rand.sample(features, rand.randint(1, 4))), rand.random()) for _ in range(500)]
+        self._exact = LRavePaths()
+        for path, score in self._paths:
+            self._exact.add_path_score(path, score)
+    
+    def test_exact_below_limit(self):
+        lrave = ApproximateLRavePaths(max_paths = 10000)
+        for path, score in self._paths:
+            lrave.add_path_score(path, score)
+        
+        error = ApproximateLRavePaths.get_error(self._exact, lrave)
+        self.assertEqual(error['max_score_error'], 0)
+        self.assertEqual(error['mean_t_l_error'], 0)
+        
+    def test_bounded_memory(self):
+        lrave = ApproximateLRavePaths(max_paths = 50, reservoir_size = 20)
+        for path, score in self._paths:
+            lrave.add_path_score(path, score)
+        
+        info = lrave.get_memory_info()
+        self.assertLessEqual(info['exact_paths'], 50)
+        self.assertEqual(info['reservoir_paths'], 20)
+        self.assertGreater(info['evicted_paths'], 0)
+        
+        for name in ['0', '5', '11']:
+            self.assertAlmostEqual(lrave.get_t_l(set([name])), self._exact.get_t_l(set([name])))
+            self.assertAlmostEqual(lrave.get_path_score(set([name])), self._exact.get_path_score(set([name])))
+        
+        # Count-min sketch never underestimates counts of pairs
+        self.assertGreaterEqual(lrave.get_t_l(set(['0', '1'])), self._exact.get_t_l(set(['0', '1'])))
+        
+    def test_merge(self):
+        first = ApproximateLRavePaths(max_paths = 50, reservoir_size = 20)
+        second = ApproximateLRavePaths(max_paths = 50, reservoir_size = 20)
+        for i, (path, score) in enumerate(self._paths):
+            (first if i % 2 == 0 else second).add_path_score(path, score)
+        
+        first.merge(second)
+        
+        self.assertAlmostEqual(first.get_t_l(set(['3'])), self._exact.get_t_l(set(['3'])))
+        self.assertLessEqual(first.get_memory_info()['exact_paths'], 50)
@@ -0,0 +1,80 @@
+import unittest
+
+class TestArrayGraph(unittest.TestCase):
+    def setUp(self):
+        self._node_adder = ArrayNodeAdder(set(['A','B','C','D']), capacity = 2)
+        self._root = self._node_adder.get_root()
+        
+    def test_adding_to_next(self):
+        self._node_adder.add_node(self._root, 'A')
+        self._node_adder.add_node(self._root, 'C')
+        self._node_adder.add_node(self._root, 'D')
+        
+        self._node_adder.add_node(self._root._children[0], 'B')
+        self._node_adder.add_node(self._root, 'B')
+        
+        self.assertEqual(len(self._root._children[0]._children), 1)
+        self.assertEqual(len(self._root._children[1]._children), 0)
+        self.assertEqual(len(self._root._children[2]._children), 0)
+        self.assertEqual(len(self._root._children[3]._children), 1)
+        
+        self.assertEqual(self._root._children[0]._children[0]._features, set(['A','B']))
+        self.assertEqual(self._root._children[3]._children[0], self._root._children[0]._children[0])
+        self.assertEqual(self._node_adder.get_nodes_count(), 6)
+        
+    def test_not_used_features(self):
+        node_a = self._node_adder.add_node(self._root, 'A')
+        node_c = self._node_adder.add_node(self._root, 'C')
+        self._node_adder.add_node(node_a, 'B')
+        self._node_adder.add_node(self._root, 'B')
+        
+        self.assertEqual(self._node_adder.get_not_used_features(self._root), ['D'])
+        self.assertEqual(self._node_adder.get_not_used_features(node_a), ['C','D'])
+        self.assertEqual(self._node_adder.get_not_used_features(node_c), ['A','B','D'])
+        self.assertTrue(self._node_adder.is_not_used(node_c, 'D'))
+        self.assertFalse(self._node_adder.is_not_used(node_a, 'B'))
+        
+    def test_scores(self):
+        node = self._node_adder.add_node(self._root, 'A')
+        node.add_score(0.2)
+        node.add_score(0.6)
+        
+        self.assertEqual(node.T, 2)
+        self.assertAlmostEqual(node.get_score(), 0.4)
+        self.assertAlmostEqual(node.get_variance(), 0.04)
+        self.assertEqual(self._root.get_score(), 0)
+        
+    def test_get_node(self):
+        node_a = self._node_adder.add_node(self._root, 'A')
+        
+        self.assertEqual(self._node_adder.get_node(set(['A'])), node_a)
+        self.assertIsNone(self._node_adder.get_node(set(['A','B'])))
+        
+        node_ab = self._node_adder.add_node(node_a, 'B')
+        self.assertEqual(self._node_adder.get_node(['B','A']), node_ab)
+        self.assertEqual(self._node_adder.get_node(set()), self._root)
+
+    def test_best_new_feature(self):
+        scores = {'A': 0.1, 'B': 0.4, 'C': 0.3, 'D': 0.2}
+        calls = []
+
+        class Scoring:
+            def get_new_node_score(self, feature_name, node, global_scores):
+                calls.append(feature_name)
+                return scores[feature_name]
+
+        global_scores = GlobalScores()
+        self.assertEqual(self._node_adder.get_best_new_feature(self._root, Scoring(), global_scores), ('B', 0.4))
+        self.assertEqual(len(calls), 4)
+
+        self._node_adder.add_node(self._root, 'B')
+        scores['D'] = 0.5
+        global_scores.update_score(set(['D']), 0.5)
+        self.assertEqual(self._node_adder.get_best_new_feature(self._root, Scoring(), global_scores), ('D', 0.5))
+        self.assertEqual(calls[4:], ['D'])
+
+        for feature in ['A', 'C', 'D']:
+            self._node_adder.add_node(self._root, feature)
+        self.assertEqual(self._node_adder.get_best_new_feature(self._root, Scoring(), global_scores), (None, None))
+        self.assertEqual(len(self._root._children), 4)
+        self.assertEqual(self._root.get_used_features_in_children(), set(['A', 'B', 'C', 'D']))
@@ -0,0 +1,63 @@
+import gc
+import weakref
+import unittest
+
+import numpy as np
+import pandas as pd
+
+class TestBuildInMetrics(unittest.TestCase):
+    def setUp(self):
+        self._labels = np.array([0, 1, 1, 0, 1, 0, 0, 1])
+        self._scores = np.array([0.1, 0.4, 0.4, 0.4, 0.9, 0.2, 0.8, 0.3])
+        self._predicted = np.array([0, 1, 0, 0, 1, 1, 0, 1])
+        
+    def test_fast_roc_auc(self):
+        fast_roc_auc = BuildInMetrics().get_metric('roc_auc', True)
+        self.assertAlmostEqual(fast_roc_auc(self._labels, self._scores), roc_auc_score(self._labels, self._scores))
+        self.assertAlmostEqual(fast_roc_auc(SplitLabels(self._labels), self._scores), roc_auc_score(self._labels, self._scores))
+        
+    def test_fast_acc_f1(self):
+        labels = BuildInMetrics.prepare_labels(FastMetrics.f1, self._labels)
+        self.assertAlmostEqual(FastMetrics.f1(labels, self._predicted), f1_score(self._labels, self._predicted))
+        self.assertAlmostEqual(FastMetrics.accuracy(labels, self._predicted), accuracy_score(self._labels, self._predicted))
+        self.assertEqual(FastMetrics.f1(np.array([0, 0]), np.array([0, 0])), 0)
+        
+    def test_sklearn_metrics(self):
+        self.assertEqual(BuildInMetrics().get_metric('roc_auc'), roc_auc_score)
+        self.assertEqual(BuildInMetrics().get_metric('f1', False), f1_score)
+        
+    def test_cached_split_labels(self):
+        labels = pd.Series(np.tile(self._labels, 5))
+        metric = BuildInMetrics().get_metric('roc_auc', True)
+        
+        train, test, y_test = TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)
+        self.assertIs(TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)[2], y_test)
+        self.assertIsNot(TrainTestScore._get_prepared_split(metric, labels.copy(), 0.25, 1)[2], y_test)
+        self.assertEqual(y_test.n_positive, int(labels.iloc[test].sum()))
+        
+        splits = CV._get_prepared_splits(metric, labels.to_frame(), labels, 2, 1)
+        self.assertIs(CV._get_prepared_splits(metric, labels.to_frame(), labels, 2, 1), splits)
+        self.assertEqual([split[2].n_positive for split in splits], [int(labels[test].sum()) for _, test, _ in splits])
+        
+    def test_cached_split_labels_released(self):
+        labels = pd.Series(np.tile(self._labels, 5))
+        metric = BuildInMetrics().get_metric('roc_auc', True)
+        reference = weakref.ref(labels)
+        TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)
+        CV._get_prepared_splits(metric, labels.to_frame(), labels, 2, 1)
+        
+        del labels
+        gc.collect()
+        self.assertIsNone(reference())
+        
+        labels = [int(label) for label in np.tile(self._labels, 5)]
+        self.assertIsNot(TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)[2], 
+                         TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)[2])
+        
+        labels = pd.Series(labels)
+        TrainTestScore._get_prepared_split(metric, labels, 0.25, 1)
+        CV._get_prepared_splits(metric, labels.to_frame(), labels, 2, 1)
+        TrainTestScore.clear_cache()
+        CV.clear_cache()
+        self.assertIsNone(TrainTestScore._split_cache)
+        self.assertIsNone(CV._splits_cache)
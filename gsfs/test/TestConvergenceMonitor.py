@@ -0,0 +1,33 @@
+import unittest
+
+class TestConvergenceMonitor(unittest.TestCase):
+    def test_convergence(self):
+        params = DefaultSettings.merge_params({'convergence_window': 10, 'convergence_top_k': 2})
+        global_scores = GlobalScores()
+        global_scores.update_score(set(['A','B']), 0.9)
+        global_scores.update_score(set(['C']), 0.1)
+        monitor = ConvergenceMonitor(params)
+        
+        self.assertFalse(monitor.update(0, 0.9, global_scores))
+        self.assertFalse(monitor.update(5, 0.9, global_scores))
+        self.assertTrue(monitor.update(10, 0.9, global_scores))
+        self.assertEqual(monitor.get_converged_iteration(), 10)
+        
+    def test_no_convergence(self):
+        params = DefaultSettings.merge_params({'convergence_window': 10, 'convergence_top_k': 2})
+        global_scores = GlobalScores()
+        global_scores.update_score(set(['A','B']), 0.9)
+        global_scores.update_score(set(['C']), 0.1)
+        monitor = ConvergenceMonitor(params)
+        
+        self.assertFalse(monitor.update(0, 0.9, global_scores))
+        global_scores.update_score(set(['C']), 1)
+        global_scores.update_score(set(['C']), 1)
+        self.assertFalse(monitor.update(10, 0.95, global_scores))
+        self.assertFalse(monitor.update(15, 0.95, global_scores))
+        self.assertIsNone(monitor.get_converged_iteration())
+        
+    def test_conditions(self):
+        self.assertEqual(GSFS._parse_conditions('time|convergence', 60), {'time': 60, 'convergence': None})
+        self.assertEqual(GSFS._parse_conditions('convergence', 100), {'convergence': None, 'iterations': 100})
+        self.assertEqual(GSFS._parse_conditions(['time', 'iterations'], {'time': 60, 'iterations': 10}), {'time': 60, 'iterations': 10})
@@ -0,0 +1,48 @@
+import unittest
+import time
+import numpy as np
+
+class TestEvaluationGuard(unittest.TestCase):
+    def test_evaluation(self):
+        guard = EvaluationGuard({'evaluation_timeout': 10, 'evaluation_max_rss_mb': None})
+        result = guard.run(max, (0.3, 0.7))
+        
+        self.assertEqual(result['score'], 0.7)
+        self.assertIsNone(result['reason'])
+        
+    def test_timeout(self):
+        guard = EvaluationGuard({'evaluation_timeout': 10, 'evaluation_max_rss_mb': None})
+        result = guard.run(time.sleep, (10,), timeout = 0.2)
+        
+        self.assertIsNone(result['score'])
+        self.assertEqual(result['reason'], 'timeout')
+        self.assertLess(result['seconds'], 5)
+        
+    def test_error(self):
+        guard = EvaluationGuard({'evaluation_timeout': 10, 'evaluation_max_rss_mb': None})
+        
+        with self.assertRaises(Exception):
+            guard.run(int, ('A',))
+
+    def test_memory_limit(self):
+        guard = EvaluationGuard({'evaluation_timeout': 10, 'evaluation_max_rss_mb': 100})
+        result = guard.run(np.ones, (600 * 2**20, np.uint8))
+        
+        self.assertIsNone(result['score'])
+        self.assertEqual(result['reason'], 'memory')
+        self.assertGreater(result['rss_mb'], 100)
+        self.assertEqual(guard.run(max, (0.3, 0.7))['score'], 0.7)
+        guard.close()
+        
+    def test_persistent_worker(self):
+        guard = EvaluationGuard({'evaluation_timeout': 10, 'evaluation_max_rss_mb': None})
+        cache = {}
+        function = cache.setdefault
+        
+        self.assertEqual(guard.run(function, ('A', 1))['score'], 1)
+        self.assertEqual(guard.run(function, ('A', 2))['score'], 1)
+        self.assertEqual(cache, {})
+        
+        self.assertEqual(guard.run(time.sleep, (10,), timeout = 0.2)['reason'], 'timeout')
+        self.assertEqual(guard.run(function, ('A', 3))['score'], 3)
+        guard.close()
@@ -0,0 +1,44 @@
+import unittest
+import os
+import tempfile
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+class TestEvaluationStore(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, 'store.db')
+        self._data = pd.DataFrame({'A': [1, 2, 3, 4], 'B': [0, 1, 0, 1]})
+        self._labels = pd.Series([0, 0, 1, 1])
+        self._params = DefaultSettings.get_default_params()
+        
+    def tearDown(self):
+        self._dir.cleanup()
+        
+    def test_scores(self):
+        store = EvaluationStore(self._path)
+        store.set_context(EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'roc_auc', False, self._params))
+        store.add_score(['B', 'A'], 0.7)
+        
+        other_store = EvaluationStore(self._path)
+        other_store.set_context(EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'roc_auc', False, self._params))
+        
+        self.assertEqual(other_store.get_score(['A', 'B']), 0.7)
+        self.assertIsNone(other_store.get_score(['A']))
+        self.assertEqual(other_store.get_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        
+    def test_names_with_commas(self):
+        store = EvaluationStore(self._path)
+        store.set_context(EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'roc_auc', False, self._params))
+        store.add_score(['a,b'], 0.7)
+        
+        self.assertIsNone(store.get_score(['a', 'b']))
+        self.assertEqual(store.get_score(['a,b']), 0.7)
+        
+    def test_context(self):
+        context = EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'roc_auc', False, self._params)
+        
+        self.assertEqual(context, EvaluationStore.get_context(self._data.copy(), self._labels.copy(), LogisticRegression(), 'roc_auc', False, self._params))
+        self.assertNotEqual(context, EvaluationStore.get_context(self._data, self._labels, LogisticRegression(C = 2), 'roc_auc', False, self._params))
+        self.assertNotEqual(context, EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'acc', False, self._params))
+        self.assertNotEqual(context, EvaluationStore.get_context(self._data, self._labels, LogisticRegression(), 'roc_auc', True, self._params))
@@ -0,0 +1,323 @@
+import unittest
+import asyncio
+import threading
+import os
+import tempfile
+import itertools
+from unittest import mock
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression, RidgeClassifier
+from sklearn.compose import ColumnTransformer, make_column_selector
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+class TestGSFS(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self._data = pd.DataFrame(random.normal(size = (200, 6)), columns = ['A', 'B', 'C', 'D', 'E', 'F'])
+        self._labels = pd.Series((self._data['A'] + self._data['C'] + random.normal(size = 200) > 0).astype(int))
+
+    def _assert_usable(self, gsfs, budget):
+        self.assertEqual(gsfs.get_stopping_info()['reason'], 'cancelled')
+        self.assertLess(gsfs.get_stopping_info()['iterations'], budget)
+        self.assertIsNotNone(gsfs.get_best_features())
+        self.assertEqual(len(gsfs.predict_proba(self._data)), len(self._data))
+
+    def _get_sweep_gsfs(self, features_count, score):
+        gsfs = GSFS(LogisticRegression(), 10)
+        evaluated = []
+
+        def score_prefixes(parallel, sizes, ranking, data, labels, with_cv, model, scores):
+            for size in sizes:
+                if size not in scores:
+                    scores[size] = score(size)
+                    evaluated.append(size)
+
+        gsfs.get_features_importances = lambda: dict(['f' + str(i), 1] for i in range(features_count))
+        gsfs._score_prefixes = score_prefixes
+        data = pd.DataFrame(np.random.RandomState(0).normal(size = (40, features_count)),
+                            columns = ['f' + str(i) for i in range(features_count)])
+        return gsfs, evaluated, data, pd.Series([0, 1]*20)
+
+    def test_geometric_sizes(self):
+        self.assertEqual(GSFS._get_geometric_sizes(20, 2), [1, 2, 4, 8, 16, 20])
+        self.assertEqual(GSFS._get_geometric_sizes(10, 1.2), [1, 2, 3, 4, 5, 6, 8, 10])
+        self.assertEqual(GSFS._get_geometric_sizes(1, 2), [1])
+
+    def test_bisection_sweep(self):
+        gsfs, evaluated, data, labels = self._get_sweep_gsfs(20, lambda size: -(size - 11)**2)
+        result = gsfs.get_best_model(data, labels, n_jobs = 1, strategy = 'bisection')
+
+        self.assertEqual(evaluated, [1, 2, 4, 8, 16, 20, 6, 12, 10, 14, 9, 11])
+        self.assertEqual(result['best_features'], ['f' + str(i) for i in range(11)])
+        self.assertEqual(list(result['scores']['n_features']), sorted(evaluated))
+
+    def test_sweep_patience(self):
+        gsfs, evaluated, data, labels = self._get_sweep_gsfs(20, lambda size: [0.5, 0.6, 0.7, 0.65, 0.6, 0.9][min(size, 6) - 1])
+        result = gsfs.get_best_model(data, labels, n_jobs = 1, patience = 2)
+
+        self.assertEqual(evaluated, [1, 2, 3, 4, 5])
+        self.assertEqual(result['best_features'], ['f0', 'f1', 'f2'])
+
+        gsfs, evaluated, data, labels = self._get_sweep_gsfs(20, lambda size: size)
+        gsfs.get_best_model(data, labels, n_jobs = 1, strategy = 'geometric', patience = 2)
+
+        self.assertEqual(evaluated, [1, 2, 4, 8, 16, 20])
+
+    def test_events(self):
+        gsfs = GSFS(LogisticRegression(), 20)
+        events = list(gsfs.iter_fit(self._data, self._labels, events = 'iteration'))
+
+        self.assertEqual([event['iteration'] for event in events], list(range(1, 21)))
+        self.assertEqual(gsfs.get_stopping_info()['iterations'], 20)
+
+        gsfs = GSFS(LogisticRegression(), 20)
+        events = list(gsfs.iter_fit(self._data, self._labels))
+        best_scores = [event['best_score'] for event in events]
+
+        self.assertTrue(all(event['event'] == 'improvement' and event['score'] == event['best_score'] for event in events))
+        self.assertEqual(best_scores, sorted(set(best_scores)))
+        self.assertEqual(best_scores[-1], gsfs.get_best_score())
+        self.assertEqual(events[-1]['best_features'], gsfs.get_best_features())
+
+    def test_closing_iter_fit(self):
+        gsfs = GSFS(LogisticRegression(), 1000)
+        iterator = gsfs.iter_fit(self._data, self._labels, events = 'iteration')
+        for event in iterator:
+            if event['iteration'] == 5:
+                break
+        iterator.close()
+
+        self._assert_usable(gsfs, 1000)
+        self.assertEqual(gsfs.get_stopping_info()['iterations'], 5)
+
+    def test_cancel_from_thread(self):
+        gsfs = GSFS(LogisticRegression(), 100000)
+        started = threading.Event()
+
+        def consume():
+            for event in gsfs.iter_fit(self._data, self._labels, events = 'iteration'):
+                started.set()
+
+        thread = threading.Thread(target = consume)
+        thread.start()
+        self.assertTrue(started.wait(30))
+        gsfs.cancel()
+        thread.join(30)
+
+        self.assertFalse(thread.is_alive())
+        self._assert_usable(gsfs, 100000)
+
+    def test_fit_async_break(self):
+        gsfs = GSFS(LogisticRegression(), 1000)
+
+        async def consume():
+            async for event in gsfs.fit_async(self._data, self._labels, events = 'iteration'):
+                if event['iteration'] == 3:
+                    break
+
+        asyncio.run(consume())
+        self._assert_usable(gsfs, 1000)
+
+    def test_fit_async_task_cancel(self):
+        gsfs = GSFS(LogisticRegression(), 100000)
+
+        async def consume(started):
+            async for event in gsfs.fit_async(self._data, self._labels, events = 'iteration'):
+                started.set()
+
+        async def main():
+            started = asyncio.Event()
+            task = asyncio.ensure_future(consume(started))
+            await asyncio.wait_for(started.wait(), 30)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        self._assert_usable(gsfs, 100000)
+
+    def test_feature_groups(self):
+        gsfs = GSFS(LogisticRegression(), 30)
+        gsfs.fit(self._data, self._labels, feature_groups = {'g1': ['A', 'B'], 'g2': ['C', 'D']})
+        names = set(['g1', 'g2', 'E', 'F'])
+        groups = {'g1': ['A', 'B'], 'g2': ['C', 'D'], 'E': ['E'], 'F': ['F']}
+
+        self.assertTrue(set(gsfs._global_scores.scores['g_rave'].keys()).issubset(names))
+        self.assertTrue(set(gsfs.get_features_importances().keys()).issubset(names))
+        nodes = [node for bucket in gsfs._node_adder._nodes_buckets.values() for node in bucket]
+        self.assertTrue(all(set(node._features).issubset(names) for node in nodes))
+        self.assertIsNotNone(gsfs._node_adder.get_node(set(['g1'])))
+
+        best_features = gsfs.get_best_features()
+        selected = [name for name, group in groups.items() if not set(group).isdisjoint(best_features)]
+        self.assertEqual(sorted(best_features), sorted(column for name in selected for column in groups[name]))
+
+    def test_feature_groups_screening(self):
+        gsfs = GSFS(LogisticRegression(), 10, params = {'screening_top_k': 2, 'screening_mode': 'filter'})
+        gsfs.fit(self._data, self._labels, screening = 'f_classif', feature_groups = {'g1': ['A', 'B'], 'g2': ['C', 'D', 'E']})
+
+        self.assertEqual(gsfs._groups, {'g1': ['A'], 'g2': ['C']})
+        self.assertTrue(set(gsfs.get_features_importances().keys()).issubset(['g1', 'g2']))
+        self.assertTrue(set(gsfs.get_best_features()).issubset(['A', 'C']))
+
+    def test_wrong_feature_groups(self):
+        for feature_groups in [{'g1': ['A', 'B'], 'g2': ['B', 'C']}, {'g1': ['A', 'Z']}, {'g1': []}, {'A': ['B', 'C']}]:
+            with self.assertRaises(Exception):
+                GSFS(LogisticRegression(), 10).fit(self._data, self._labels, feature_groups = feature_groups)
+
+    def test_score_subsets(self):
+        gsfs = GSFS(LogisticRegression(), 10)
+        scores = gsfs.score_subsets(self._data, self._labels, [['A', 'B'], ['B', 'A'], ['C']], n_jobs = 2)
+
+        self.assertEqual(list(scores['features']), ['A,B', 'A,B', 'C'])
+        self.assertEqual(scores.iloc[0].to_dict(), scores.iloc[1].to_dict())
+        gsfs._metric = BuildInMetrics().get_metric('roc_auc', True)
+        for features, score in zip([['A', 'B'], ['C']], scores['score'][1:]):
+            self.assertAlmostEqual(score, gsfs._get_score_for_features(self._data.loc[:, features], self._labels))
+
+    def test_score_subsets_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            gsfs = GSFS(LogisticRegression(), 10, params = {'evaluation_store': os.path.join(directory, 'store.db')})
+            first = gsfs.score_subsets(self._data, self._labels, [['A'], ['B', 'C']])
+            second = gsfs.score_subsets(self._data, self._labels, [['C', 'B'], ['A'], ['D']])
+
+            self.assertEqual(list(first['source']), ['evaluation', 'evaluation'])
+            self.assertEqual(list(second['source']), ['store', 'store', 'evaluation'])
+            self.assertEqual(list(second['score'][:2]), list(first['score'][::-1]))
+
+    def test_score_subsets_state(self):
+        with tempfile.TemporaryDirectory() as directory:
+            gsfs = GSFS(LogisticRegression(), 3, params = {'evaluation_store': os.path.join(directory, 'store.db')})
+            gsfs.fit(self._data, self._labels)
+            store = gsfs._evaluation_store
+            metric = gsfs._metric
+            subsets = [list(subset) for subset in itertools.combinations(['A', 'B', 'C', 'D', 'E', 'F'], 2)]
+            scores = gsfs.score_subsets(self._data, self._labels, subsets, n_jobs = 4)
+
+            self.assertIs(gsfs._evaluation_store, store)
+            self.assertIs(gsfs._metric, metric)
+            self.assertEqual(store.get_stats()['hits'], (scores['source'] == 'store').sum())
+            self.assertEqual(store.get_stats()['hits'] + store.get_stats()['misses'], len(subsets))
+
+            gsfs.fit(self._data, self._labels)
+            self.assertIs(gsfs._evaluation_store, store)
+
+    def test_score_subsets_update(self):
+        gsfs = GSFS(LogisticRegression(), 1)
+        gsfs.fit(self._data, self._labels)
+        n = gsfs._global_scores.get_n('A')
+        subsets = [list(subset) for size in [1, 2] for subset in itertools.combinations(['A', 'B', 'C', 'D', 'E', 'F'], size)]
+        subsets.append(['A', 'B', 'C', 'D', 'E', 'F'])
+
+        self.assertIsNone(gsfs._node_adder.get_node(set(subsets[-1])))
+        scores = gsfs.score_subsets(self._data, self._labels, subsets, update = True)
+
+        self.assertIsNotNone(gsfs._node_adder.get_node(set(subsets[-1])))
+        self.assertEqual(gsfs._global_scores.get_n('A'), n + 7)
+        self.assertEqual(gsfs.get_best_score(), scores['score'].max())
+        self.assertEqual(sorted(gsfs.get_best_features()), scores['features'][scores['score'].idxmax()].split(','))
+        self.assertEqual(gsfs.get_predictor().get_features(), gsfs.get_best_features())
+
+    def test_score_subsets_evaluator(self):
+        gsfs = GSFS(RidgeClassifier(), 5, evaluator = 'gram')
+        gsfs.fit(self._data, self._labels)
+        self.assertEqual(len(gsfs._evaluator._cache), 0)
+        subsets = [list(subset) for subset in itertools.combinations(['A', 'B', 'C', 'D', 'E', 'F'], 3)]
+        with mock.patch.object(gsfs._evaluator, 'score', wraps = gsfs._evaluator.score) as score:
+            scores = gsfs.score_subsets(self._data, self._labels, subsets, n_jobs = 4)
+
+        self.assertEqual(score.call_count, len(subsets))
+        self.assertEqual(len(gsfs._evaluator._cache), 0)
+        self.assertEqual(list(scores['score']), [gsfs._evaluator.score(subset) for subset in subsets])
+
+        gsfs._evaluator.close()
+        with mock.patch.object(gsfs._evaluator, 'score') as score:
+            gsfs.score_subsets(self._data, 1 - self._labels, [['A', 'B', 'C', 'D']])
+
+        score.assert_not_called()
+        self.assertEqual(len(gsfs._evaluator._cache), 0)
+
+    def _get_candidates_mismatches(self, params, graph_backend = 'objects', warm_start = False):
+        random = np.random.RandomState(0)
+        data = pd.DataFrame(random.normal(size = (200, 20)), columns = ['f' + str(i) for i in range(20)])
+        labels = pd.Series((data['f0'] + data['f1'] + random.normal(size = 200) > 0).astype(int))
+        get_best_new_feature = MultiArmStrategies._get_best_new_feature
+        mismatches = []
+
+        def checked(strategy, node, scoring_functions, global_scores, node_adder):
+            feature, score = get_best_new_feature(strategy, node, scoring_functions, global_scores, node_adder)
+            scores = [scoring_functions.get_new_node_score(name, node, global_scores) for name in node_adder.get_not_used_features(node)]
+            if len(scores) > 0 and score != max(scores):
+                mismatches.append(feature)
+            return feature, score
+
+        with mock.patch.object(MultiArmStrategies, '_get_best_new_feature', checked):
+            gsfs = GSFS(LogisticRegression(), 100, graph_backend = graph_backend, params = params)
+            gsfs.fit(data, labels, warm_start = warm_start)
+
+        return gsfs, mismatches
+
+    def test_cost_weight_candidates(self):
+        gsfs, mismatches = self._get_candidates_mismatches({'cost_weight': 50}, warm_start = ['l1_logistic'])
+        self.assertEqual(mismatches, [])
+
+    def test_l_rave_eviction_candidates(self):
+        for graph_backend in ['objects', 'arrays']:
+            gsfs, mismatches = self._get_candidates_mismatches({'l_rave_backend': 'approximate', 'l_rave_max_paths': 20,
+                                                                'l_rave_reservoir_size': 2, 'l_rave_sketch_width': 4},
+                                                               graph_backend)
+
+            self.assertGreater(gsfs._global_scores.scores['l_rave'].get_memory_info()['evicted_paths'], 0)
+            self.assertEqual(mismatches, [])
+
+    def test_graph_backends(self):
+        results = []
+        for graph_backend in ['objects', 'arrays']:
+            gsfs = GSFS(LogisticRegression(), 40, graph_backend = graph_backend, params = {'cost_weight': 1})
+            gsfs.fit(self._data, self._labels)
+            labels = sorted(node.get_label() for bucket in gsfs._node_adder._nodes_buckets.values() for node in bucket)
+            results.append((labels, gsfs.get_best_features(), gsfs.get_best_score()))
+
+        self.assertEqual(len(results[1][0]), 41)
+        self.assertEqual(results[0], results[1])
+
+    def test_evaluation_guard(self):
+        results = []
+        for params in [None, {'evaluation_timeout': 60}]:
+            gsfs = GSFS(RidgeClassifier(), 10, evaluator = 'gram', params = params)
+            gsfs.fit(self._data, self._labels)
+            results.append((gsfs.get_best_features(), gsfs.get_best_score()))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(gsfs._evaluator._cache), 0)
+        self.assertEqual(gsfs.get_evaluation_stats()['killed_evaluations'], 0)
+
+        gsfs = GSFS(LogisticRegression(), 5, params = {'evaluation_timeout': 1e-6})
+        with self.assertRaises(Exception):
+            gsfs.fit(self._data, self._labels)
+        self.assertIsNone(gsfs.get_best_features())
+        self.assertEqual(gsfs.get_evaluation_stats()['killed_evaluations'], 5)
+
+    def test_named_columns_model(self):
+        model = Pipeline([('columns', ColumnTransformer([('scaler', StandardScaler(), make_column_selector(pattern = '.*'))])),
+                          ('model', LogisticRegression())])
+        gsfs = GSFS(model, 10)
+        gsfs.fit(self._data, self._labels)
+
+        self.assertEqual(list(gsfs._model.feature_names_in_), gsfs.get_best_features())
+        self.assertEqual(len(gsfs.predict_proba(self._data.to_numpy())), len(self._data))
+        self.assertTrue(np.allclose(gsfs.predict_proba(self._data), gsfs.predict_proba(self._data.iloc[:, ::-1])))
+
+    def test_evaluator_closed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            gsfs = GSFS(SVC(), 5, evaluator = 'kernel', params = {'kernel_memmap_dir': directory})
+            gsfs.fit(self._data, self._labels)
+
+            self.assertEqual(os.listdir(directory), [])
+            self.assertEqual(len(gsfs._evaluator._feature_distances), 0)
+
+            scores = gsfs.score_subsets(self._data, self._labels, [['A', 'C']])
+            self.assertEqual(list(scores['score']), [gsfs._evaluator.score(['A', 'C'])])
@@ -38,4 +38,82 @@ class TestGlobalScores(unittest.TestCase):
         self.assertEqual(global_scores.get_t_l(set(['B','C'])), 2)
         self.assertEqual(global_scores.get_t_l(set(['A','C','B'])), 1)
         self.assertEqual(global_scores.get_t_l(set(['E'])), 1)
-        self.assertEqual(global_scores.get_t_l(set(['F'])), 0)
\ No newline at end of file
+        self.assertEqual(global_scores.get_t_l(set(['F'])), 0)
+
+    def test_prior_scores(self):
+        global_scores = GlobalScores()
+        global_scores.update_score(set('A'),0.4)
+        global_scores.add_prior_scores({'A': 0.7, 'B': 0.6}, 2)
+        
+        self.assertAlmostEqual(global_scores.get_g_rave_score('A'),(0.4+2*0.7)/3)
+        self.assertAlmostEqual(global_scores.get_g_rave_score('B'),0.6)
+        self.assertEqual(global_scores.get_n('B'),2)
+        self.assertEqual(global_scores.get_t_l(set('B')),0)
+        
+    def test_updated_features(self):
+        global_scores = GlobalScores(max_updates_log = 2)
+        global_scores.update_score(set(['A','B']),0.1)
+        version = global_scores.get_version()
+        global_scores.update_score(set(['B','C']),0.2)
+        global_scores.add_prior_scores({'D': 0.5})
+        
+        self.assertEqual(global_scores.get_updated_features(version), set(['B','C','D']))
+        self.assertEqual(global_scores.get_updated_features(global_scores.get_version()), set())
+        
+        global_scores.update_score(set(['E']),0.3)
+        global_scores.update_score(set(['E']),0.3)
+        self.assertEqual(global_scores.get_updated_features(version), None)
+        
+    def test_l_rave_tail_invalidation(self):
+        global_scores = GlobalScores(l_rave = ApproximateLRavePaths(max_paths = 2))
+        global_scores.update_score(set(['A', 'B']), 0.5)
+        global_scores.update_score(set(['C']), 0.3)
+        version = global_scores.get_version()
+        
+        global_scores.update_score(set(['C']), 0.4)
+        self.assertEqual(global_scores.get_updated_features(version), set(['C']))
+        
+        global_scores.update_score(set(['D']), 0.2)
+        self.assertIsNone(global_scores.get_updated_features(version))
+        self.assertEqual(global_scores.get_version(), version + 2)
+        self.assertEqual(global_scores.get_updated_features(global_scores.get_version()), set())
+        
+    def test_costs(self):
+        global_scores = GlobalScores()
+        self.assertEqual(global_scores.get_feature_cost('A'), 0)
+        
+        global_scores.update_cost(set(['A','B']),2)
+        global_scores.update_cost(set(['A']),3)
+        
+        self.assertAlmostEqual(global_scores.get_feature_cost('A'), 2)
+        self.assertAlmostEqual(global_scores.get_feature_cost('B'), 1)
+        self.assertEqual(global_scores.get_feature_cost('C'), 0)
+        self.assertAlmostEqual(global_scores.costs.get_cost(set(['A','B'])), 3)
+        
+    def test_merge(self):
+        global_scores = GlobalScores()
+        global_scores.update_score(set(['A','B']),0.2)
+        other = GlobalScores()
+        other.update_score(set(['A']),0.6)
+        other.update_score(set(['C']),0.5)
+        global_scores.merge(other)
+        
+        self.assertAlmostEqual(global_scores.get_g_rave_score('A'), 0.4)
+        self.assertEqual(global_scores.get_g_rave_score('C'), 0.5)
+        self.assertEqual(global_scores.get_n('A'), 2)
+        self.assertAlmostEqual(global_scores.get_l_rave_score(set('A')), 0.4)
+        self.assertEqual(other.get_n('A'), 1)
+        
+    def test_decayed_scores(self):
+        previous_scores = GlobalScores()
+        for i in range(10):
+            previous_scores.update_score(set(['A','B']),0.6)
+        previous_scores.update_score(set(['C']),0.2)
+        global_scores = GlobalScores()
+        global_scores.add_decayed_scores(previous_scores, 0.5, 4, set(['A','B']))
+        
+        self.assertAlmostEqual(global_scores.get_g_rave_score('A'), 0.6)
+        self.assertEqual(global_scores.get_n('A'), 4)
+        self.assertEqual(global_scores.get_n('C'), 0)
+        self.assertAlmostEqual(global_scores.get_l_rave_score(set(['A','B'])), 0.6)
+        self.assertEqual(global_scores.get_t_l(set(['A'])), 4)
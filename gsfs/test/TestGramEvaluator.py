@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import RidgeClassifier
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+
+class TestGramEvaluator(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self._data = pd.DataFrame(random_state.normal(size = (200, 5)), columns = ['A','B','C','D','E'])
+        self._labels = pd.Series((self._data['A'] + self._data['B'] + random_state.normal(size = 200) > 0).astype(int))
+        self._params = DefaultSettings.get_default_params()
+        
+    def _get_reference_score(self, model, features):
+        train, test = TrainTestScore.get_split(self._labels, self._params['test_size'])
+        model.fit(self._data.loc[train, features], self._labels[train])
+        return roc_auc_score(self._labels[test], model.decision_function(self._data.loc[test, features]))
+        
+    def test_ridge_classifier(self):
+        evaluator = GramEvaluator(RidgeClassifier(alpha = 2), roc_auc_score, 'roc_auc', self._data, self._labels, False, self._params)
+        
+        self.assertAlmostEqual(evaluator.score(['A']), self._get_reference_score(RidgeClassifier(alpha = 2), ['A']))
+        self.assertAlmostEqual(evaluator.score(['A','C']), self._get_reference_score(RidgeClassifier(alpha = 2), ['A','C']))
+        self.assertAlmostEqual(evaluator.score(['C','A','D']), self._get_reference_score(RidgeClassifier(alpha = 2), ['A','C','D']))
+        
+    def test_lda(self):
+        evaluator = GramEvaluator(LinearDiscriminantAnalysis(), roc_auc_score, 'roc_auc', self._data, self._labels, False, self._params)
+        
+        self.assertAlmostEqual(evaluator.score(['B','E']), self._get_reference_score(LinearDiscriminantAnalysis(), ['B','E']))
+        self.assertAlmostEqual(evaluator.score(['A','B','E']), self._get_reference_score(LinearDiscriminantAnalysis(), ['A','B','E']))
+        
+    def test_not_supported(self):
+        self.assertEqual(GramEvaluator.is_supported(LinearDiscriminantAnalysis(solver = 'lsqr', shrinkage = 'auto')), False)
@@ -0,0 +1,70 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sklearn.svm import SVC
+
+class TestKernelEvaluator(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self._data = pd.DataFrame(random_state.normal(size = (120, 4)) * [1, 2, 1, 3], columns = ['A','B','C','D'])
+        self._labels = pd.Series((self._data['A'] + self._data['B']/2 + random_state.normal(size = 120) > 0).astype(int))
+        self._params = DefaultSettings.get_default_params()
+        self._metric = BuildInMetrics().get_metric('roc_auc', True)
+        
+    def _assert_same_scores(self, model, with_cv, params = None):
+        params = self._params if params is None else params
+        evaluator = KernelEvaluator(model, self._metric, 'roc_auc', self._data, self._labels, with_cv, params)
+        
+        # Sets are scored in order in which they are built incrementally from cached parent sets, distances are kept 
+        # in float32, so scores can differ slightly when predictions are almost tied
+        for features in [['A'], ['A','B'], ['A','B','D'], ['B'], ['B','C'], ['C','A','D']]:
+            expected = GSFS._score_features(self._metric, 'roc_auc', SVC(**model.get_params()), self._data.loc[:, features], 
+                                            self._labels, with_cv, self._params)
+            self.assertAlmostEqual(evaluator.score(features), expected, delta = 0.01)
+        
+        return evaluator
+        
+    def test_train_test(self):
+        self._assert_same_scores(SVC(gamma = 'scale', probability = True, random_state = 0), False)
+        self._assert_same_scores(SVC(gamma = 0.3, probability = True, random_state = 0), False)
+        
+    def test_cv(self):
+        self._assert_same_scores(SVC(gamma = 'scale', probability = True, random_state = 0), True)
+        self._assert_same_scores(SVC(gamma = 0.3, C = 2, probability = True, random_state = 0), True)
+        
+    def test_cache_bound(self):
+        size = (90 * 90 + 30 * 90) * 4
+        evaluator = self._assert_same_scores(SVC(probability = True, random_state = 0), False, 
+                                             dict(self._params, kernel_cache_mb = 2.5 * size/(1024 * 1024)))
+        
+        self.assertEqual(len(evaluator._cache), 2)
+        self.assertEqual(evaluator._cache_bytes, 2 * size)
+        
+    def test_memmap_dirs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            params = dict(self._params, kernel_memmap_dir = directory)
+            first = KernelEvaluator(SVC(), self._metric, 'roc_auc', self._data, self._labels, False, params)
+            second = KernelEvaluator(SVC(), self._metric, 'roc_auc', self._data.iloc[::-1].reset_index(drop = True), 
+                                     self._labels.iloc[::-1].reset_index(drop = True), False, params)
+            first_score = first.score(['A','B'])
+            second.score(['A','B'])
+            
+            self.assertNotEqual(first._memmap_dir, second._memmap_dir)
+            self.assertEqual(len(os.listdir(directory)), 2)
+            self.assertEqual(first.score(['A','B']), first_score)
+            self.assertEqual(first._feature_distances[('A', 0)][0].dtype, np.float32)
+            
+            first._scores = {}
+            self.assertEqual(first.score(['A','B']), first_score)
+            
+            first.close()
+            second.close()
+            self.assertEqual(os.listdir(directory), [])
+            
+            self.assertEqual(first.score(['A','C']), first.score(['C','A']))
+            self.assertEqual(len(os.listdir(directory)), 1)
+            first.close()
+            self.assertEqual(os.listdir(directory), [])
@@ -27,4 +27,38 @@ class TestLRavePaths(unittest.TestCase):
         self.assertEqual(lrave.get_t_l(set(['C', 'A'])), 1)
         self.assertEqual(lrave.get_t_l(set(['B', 'C'])), 2)
         self.assertEqual(lrave.get_t_l(set(['A', 'B','C'])), 1)
-        self.assertEqual(lrave.get_t_l(set(['D'])), 1)
\ No newline at end of file
+        self.assertEqual(lrave.get_t_l(set(['D'])), 1)
+
+    def test_bulk_path_scores(self):
+        lrave = LRavePaths()
+        lrave.add_path_score(set('A'),0.1)
+        lrave.add_paths_scores([(set('A'),0.4), (set('B'),0.6)], 2)
+        
+        self.assertAlmostEqual(lrave.get_path_score(set('A')), (0.1+2*0.4)/3)
+        self.assertEqual(lrave.get_path_score(set('B')), 0.6)
+        self.assertEqual(lrave.get_t_l(set('A')), 3)
+        self.assertEqual(lrave.get_t_l(set('B')), 2)
+        
+    def test_merge(self):
+        lrave = LRavePaths()
+        lrave.add_path_score(set(['A','B']),0.2)
+        other = LRavePaths()
+        other.add_path_score(set(['B','A']),0.4)
+        other.add_path_score(set('C'),0.6)
+        lrave.merge(other)
+        
+        self.assertAlmostEqual(lrave.get_path_score(set(['A','B'])), 0.3)
+        self.assertEqual(lrave.get_path_score(set('C')), 0.6)
+        self.assertEqual(lrave.get_t_l(set('A')), 2)
+        self.assertEqual(len(lrave.get_scores_dataframe()), 2)
+        
+    def test_scores_dataframe(self):
+        lrave = LRavePaths()
+        lrave.add_path_score(set(['A','B']),0.2)
+        lrave.add_path_score(set(['A','B']),0.4)
+        lrave.add_path_score(set('C'),0.6)
+        read_lrave = LRavePaths.from_scores_dataframe(lrave.get_scores_dataframe())
+        
+        self.assertAlmostEqual(read_lrave.get_path_score(set(['A','B'])), 0.3)
+        self.assertEqual(read_lrave.get_t_l(set('A')), 2)
+        self.assertEqual(read_lrave.get_path_score(set('C')), 0.6)
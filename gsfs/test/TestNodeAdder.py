@@ -46,4 +46,29 @@ class TestNodeAdder(unittest.TestCase):
         self.assertEqual(len(self._root._children[3]._children), 1)
         
         self.assertEqual(self._root._children[0]._children[0]._features, set(['A','B']))
-        self.assertEqual(self._root._children[3]._children[0]._features, set(['A','B']))
\ No newline at end of file
+        self.assertEqual(self._root._children[3]._children[0]._features, set(['A','B']))
+
+    def test_not_used_features(self):
+        root = Node(set(),None)
+        node_adder = NodeAdder(root, set(['A','B','C','D']))
+        node_a = node_adder.add_node(root, 'A')
+        node_c = node_adder.add_node(root, 'C')
+        node_adder.add_node(node_a, 'B')
+        node_adder.add_node(root, 'B')
+        
+        self.assertEqual(node_adder.get_not_used_features(root), ['D'])
+        self.assertEqual(node_adder.get_not_used_features(node_a), ['C','D'])
+        self.assertEqual(node_adder.get_not_used_features(node_c), ['A','B','D'])
+        self.assertEqual(node_adder.get_not_used_features(root._children[2]), ['C','D'])
+        
+    def test_get_node(self):
+        root = Node(set(),None)
+        node_adder = NodeAdder(root, set(['A','B','C']))
+        node_a = node_adder.add_node(root, 'A')
+        
+        self.assertIs(node_adder.get_node(set(['A'])), node_a)
+        self.assertIsNone(node_adder.get_node(set(['A','B'])))
+        
+        node_ab = node_adder.add_node(node_a, 'B')
+        self.assertIs(node_adder.get_node(['B','A']), node_ab)
+        self.assertIs(node_adder.get_node(set()), root)
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler, PolynomialFeatures
+from sklearn.linear_model import LogisticRegression
+
+class TestPipelineEvaluator(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self._data = pd.DataFrame(random_state.normal(size = (200, 4)) * [1, 10, 100, 1], columns = ['A','B','C','D'])
+        self._labels = pd.Series((self._data['A'] + self._data['B']/10 + random_state.normal(size = 200) > 0).astype(int))
+        self._data = self._data.mask(random_state.uniform(size = self._data.shape) < 0.1)
+        self._params = DefaultSettings.get_default_params()
+        self._metric = BuildInMetrics().get_metric('roc_auc', True)
+        
+    def _get_pipeline(self):
+        return Pipeline([('imputer', SimpleImputer()), ('scaler', StandardScaler()), ('model', LogisticRegression(C = 0.1))])
+        
+    def _assert_same_scores(self, with_cv):
+        evaluator = PipelineEvaluator(self._get_pipeline(), self._metric, 'roc_auc', self._data, self._labels, with_cv, self._params)
+        
+        for features in [['A'], ['B','C'], ['D','A','C']]:
+            expected = GSFS._score_features(self._metric, 'roc_auc', self._get_pipeline(), self._data.loc[:, features], 
+                                            self._labels, with_cv, self._params)
+            self.assertAlmostEqual(evaluator.score(features), expected)
+        
+    def test_train_test(self):
+        self._assert_same_scores(False)
+        
+    def test_cv(self):
+        self._assert_same_scores(True)
+        
+    def test_not_supported(self):
+        self.assertTrue(PipelineEvaluator.is_supported(self._get_pipeline()))
+        self.assertFalse(PipelineEvaluator.is_supported(LogisticRegression()))
+        self.assertFalse(PipelineEvaluator.is_supported(Pipeline([('imputer', SimpleImputer()), ('scaler', StandardScaler())])))
+        self.assertFalse(PipelineEvaluator.is_supported(Pipeline([('poly', PolynomialFeatures()), ('model', LogisticRegression())])))
+        
+        with self.assertRaises(Exception):
+            PipelineEvaluator(Pipeline([('poly', PolynomialFeatures()), ('model', LogisticRegression())]), self._metric, 'roc_auc', 
+                              self._data, self._labels, False, self._params)
+        
+        data = self._data.copy()
+        data['D'] = np.nan
+        with self.assertRaises(Exception):
+            PipelineEvaluator(self._get_pipeline(), self._metric, 'roc_auc', data, self._labels, False, self._params)
@@ -0,0 +1,54 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+class TestPredictor(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self._data = pd.DataFrame(random.normal(size = (50, 4)), columns = ['A', 'B', 'C', 'D'])
+        self._labels = (self._data['B'] + self._data['D'] > 0).astype(int)
+        self._model = LogisticRegression().fit(self._data.loc[:, ['D', 'B']], self._labels)
+        self._expected = self._model.predict_proba(self._data.loc[:, ['D', 'B']])
+
+    def test_predict(self):
+        predictor = Predictor(self._model, self._data.columns, ['D', 'B'])
+        data = self._data.copy()
+
+        self.assertTrue(np.allclose(predictor.predict_proba(data), self._expected))
+        self.assertTrue(np.allclose(predictor.predict_proba(data.to_numpy()), self._expected))
+        self.assertTrue(np.allclose(predictor.predict_proba(data.loc[:, ['B', 'D']]), self._expected))
+        self.assertEqual(list(data.columns), ['A', 'B', 'C', 'D'])
+        self.assertEqual(list(predictor.predict(data)), list(self._model.predict(self._data.loc[:, ['D', 'B']])))
+        self.assertEqual(list(predictor.get_matrix(data.to_numpy()).columns), ['D', 'B'])
+
+    def test_wrong_input(self):
+        predictor = Predictor(self._model, self._data.columns, ['D', 'B'])
+
+        with self.assertRaises(Exception):
+            predictor.predict(self._data.loc[:, ['A', 'B']])
+        with self.assertRaises(Exception):
+            predictor.predict(self._data.to_numpy()[:, :3])
+
+    def test_chunks(self):
+        predictor = Predictor(self._model, self._data.columns, ['D', 'B'])
+        chunks = [self._data.iloc[i:i + 20] for i in range(0, 50, 20)]
+
+        self.assertTrue(np.allclose(np.concatenate(list(predictor.predict_chunks(chunks))), self._expected))
+
+    def test_file(self):
+        predictor = Predictor(self._model, self._data.columns, ['D', 'B'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input.csv')
+            output_path = os.path.join(directory, 'output.csv')
+            self._data.to_csv(input_path, index = False)
+
+            self.assertTrue(np.allclose(predictor.predict_file(input_path, chunksize = 7), self._expected))
+            self.assertEqual(predictor.predict_file(input_path, output_path, chunksize = 7), 50)
+
+            output = pd.read_csv(output_path)
+            self.assertEqual(list(output.columns), ['proba_0', 'proba_1'])
+            self.assertTrue(np.allclose(output.to_numpy(), self._expected))
@@ -0,0 +1,17 @@
+import unittest
+import pandas as pd
+
+class TestPreprocessing(unittest.TestCase):
+    def test_one_hot_encode(self):
+        data = pd.DataFrame({'A': ['x', 'y', 'x'], 'B': [1, 2, 3], 'C': ['u', 'u', 'v']})
+        
+        encoded, groups = Preprocessing.one_hot_encode(data, return_groups = True)
+        
+        self.assertEqual(sorted(encoded.columns), ['A_x', 'A_y', 'B', 'C_u', 'C_v'])
+        self.assertEqual(groups, {'A': ['A_x', 'A_y'], 'C': ['C_u', 'C_v']})
+        self.assertEqual(list(encoded['A_y']), [0, 1, 0])
+        
+    def test_relabel_data(self):
+        labels = Preprocessing.relabel_data(pd.Series(['a', 'b', 'c', 'b']), 'b')
+        
+        self.assertEqual(list(labels), [0, 1, 0, 1])
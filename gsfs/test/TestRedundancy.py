@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+class TestRedundancy(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        a = random.normal(size = 200)
+        b = random.normal(size = 200)
+        self._data = pd.DataFrame({'A': a, 'A2': a + 0.01 * random.normal(size = 200), 'B': b, 'C': -b, 'D': np.ones(200)})
+        
+    def test_correlation(self):
+        redundancy = Redundancy(self._data, 'correlation', 0.9, block_size = 2)
+        
+        self.assertEqual(redundancy.get_pairs_count(), 2)
+        self.assertTrue(redundancy.is_redundant('A', set(['B', 'A2'])))
+        self.assertFalse(redundancy.is_redundant('A', set(['B', 'D'])))
+        self.assertAlmostEqual(redundancy.get_redundancy('B', set(['C'])), 1)
+        self.assertEqual(redundancy.get_redundancy('D', set(['A'])), 0)
+        
+    def test_mutual_info(self):
+        redundancy = Redundancy(self._data, 'mutual_info', 0.5, block_size = 20)
+        
+        self.assertTrue(redundancy.is_redundant('A2', set(['A'])))
+        self.assertTrue(redundancy.is_redundant('C', set(['B'])))
+        self.assertFalse(redundancy.is_redundant('A', set(['B'])))
+        
+    def test_groups(self):
+        redundancy = Redundancy(self._data, 'correlation', 0.9, groups = {'G1': ['A', 'B'], 'G2': ['C'], 'G3': ['A2', 'D']})
+        
+        self.assertEqual(redundancy.get_pairs_count(), 2)
+        self.assertTrue(redundancy.is_redundant('G1', set(['G2'])))
+        self.assertTrue(redundancy.is_redundant('G1', set(['G3'])))
+        self.assertFalse(redundancy.is_redundant('G2', set(['G3'])))
@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+class TestScreening(unittest.TestCase):
+    def setUp(self):
+        self._labels = pd.Series([0, 0, 0, 1, 1, 1])
+        self._data = pd.DataFrame({
+            'A': [0, 0, 1, 1, 1, 1],
+            'B': [0, 0, 0, 1, 1, 1],
+            'C': [1, 1, 1, 1, 1, 1]})
+        
+    def test_point_biserial(self):
+        scores = Screening.get_scores('point_biserial', self._data, self._labels)
+        self.assertAlmostEqual(scores[0], np.corrcoef(self._data['A'], self._labels)[0, 1])
+        self.assertAlmostEqual(scores[1], 1)
+        self.assertEqual(scores[2], 0)
+        
+    def test_f_classif(self):
+        scores = Screening.get_scores('f_classif', self._data, self._labels)
+        self.assertEqual(Screening.get_top_k(list(self._data.columns), scores, 2), ['B', 'A'])
+        self.assertEqual(scores[2], 0)
+        
+    def test_calibrate(self):
+        calibrated = Screening.calibrate(np.array([0, 1, 2]), 0.5, 1)
+        self.assertEqual(list(calibrated), [0.5, 0.75, 1])
+        self.assertEqual(list(Screening.calibrate(np.array([0, 0]), 0.5, 1)), [0.5, 0.5])
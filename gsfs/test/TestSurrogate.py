@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+class TestSurrogate(unittest.TestCase):
+    def setUp(self):
+        self._params = DefaultSettings.merge_params({'surrogate_min_samples': 10, 'surrogate_retrain_interval': 5})
+        self._global_scores = GlobalScores()
+        self._random = np.random.RandomState(0)
+        
+    def _add_evaluations(self, surrogate, count):
+        for _ in range(count):
+            features = list(self._random.choice(['A','B','C','D'], self._random.randint(1, 4), replace = False))
+            score = 0.5 + 0.1 * ('A' in features) + self._random.normal(scale = 0.01)
+            self._global_scores.update_score(set(features), score)
+            surrogate.add_evaluation(features, score, self._global_scores)
+        
+    def test_not_trained(self):
+        surrogate = Surrogate('ridge', set(['A','B','C','D']), self._params)
+        self._add_evaluations(surrogate, 9)
+        
+        self.assertIsNone(surrogate._future)
+        self.assertIsNone(surrogate.get_score(['B'], self._global_scores, 1))
+        
+    def test_retraining(self):
+        surrogate = Surrogate('ridge', set(['A','B','C','D']), self._params)
+        self._add_evaluations(surrogate, 10)
+        
+        self.assertIsNotNone(surrogate._future)
+        surrogate._future.result()
+        self._add_evaluations(surrogate, 4)
+        
+        self.assertIsNotNone(surrogate._model)
+        self.assertIsNone(surrogate._future)
+        self.assertEqual(surrogate._trained_size, 10)
+        
+        self._add_evaluations(surrogate, 1)
+        self.assertEqual(surrogate._trained_size, 15)
+        
+        executor = surrogate._executor
+        surrogate.close()
+        
+        self.assertIsNone(surrogate._executor)
+        self.assertIsNone(surrogate._future)
+        self.assertTrue(all(not thread.is_alive() for thread in executor._threads))
+        
+    def test_score_bound(self):
+        surrogate = Surrogate('forest', set(['A','B','C','D']), self._params)
+        self._add_evaluations(surrogate, 10)
+        surrogate.close()
+        
+        prediction = surrogate._model.predict(surrogate._get_matrix([[1]], [surrogate._get_extras(['B'], self._global_scores)]))[0]
+        bound = prediction + self._params['surrogate_k'] * surrogate._residual_std
+        
+        self.assertAlmostEqual(surrogate.get_score(['B'], self._global_scores, bound + 0.01), prediction)
+        self.assertIsNone(surrogate.get_score(['B'], self._global_scores, bound))
+        
+        surrogate._params = dict(self._params, surrogate_margin = 0.02)
+        self.assertIsNone(surrogate.get_score(['B'], self._global_scores, bound + 0.01))
+        self.assertAlmostEqual(surrogate.get_score(['B'], self._global_scores, bound + 0.03), prediction)
+        
+    def test_evaluation_stats(self):
+        random = np.random.RandomState(0)
+        data = pd.DataFrame(random.normal(size = (200, 6)), columns = ['A','B','C','D','E','F'])
+        labels = pd.Series((data['A'] + random.normal(size = 200) > 0).astype(int))
+        gsfs = GSFS(LogisticRegression(), 60, params = {'surrogate': 'ridge', 'surrogate_min_samples': 20, 
+                                                        'surrogate_retrain_interval': 10, 'surrogate_k': 0})
+        gsfs.fit(data, labels)
+        stats = gsfs.get_evaluation_stats()
+        
+        self.assertGreaterEqual(stats['true_evaluations'], 20)
+        self.assertEqual(stats['true_evaluations'] + stats['surrogate_evaluations'], gsfs.get_stopping_info()['iterations'])
+        self.assertIsNone(gsfs._surrogate._executor)
@@ -13,4 +13,5 @@ setup(name='GSFS',
 	'pandas==0.23.4',
 	'scikit-learn==0.20.2',
 	'graphviz==0.8.4',
+	'joblib',
 	])
\ No newline at end of file